@@ -0,0 +1,253 @@
+from contextlib import asynccontextmanager
+from typing import Callable, Union
+import anyio.to_thread
+from fastapi import APIRouter, FastAPI, Request
+from anchor_sdk.exceptions import AnchorSdkException
+from anchor_sdk.default_sep10_handler.jwt_keys import JwtKeySet
+from anchor_sdk.sep_handlers.sep1_handler import Sep1Handler
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler, AsyncSep12Handler
+from anchor_sdk.sep_handlers.sep6_handler import Sep6Handler
+from anchor_sdk.sep_handlers.sep38_handler import Sep38Handler
+from anchor_sdk.sep_endpoints.sep1_endpoints import Sep1Endpoints
+from anchor_sdk.sep_endpoints.sep10_endpoints import Sep10Endpoints
+from anchor_sdk.sep_endpoints.sep12_endpoints import Sep12Endpoints
+from anchor_sdk.sep_endpoints.sep6_endpoints import Sep6Endpoints
+from anchor_sdk.sep_endpoints.sep38_endpoints import Sep38Endpoints
+from anchor_sdk.sep_endpoints.jwks_endpoints import JwksEndpoints
+from anchor_sdk.sep_endpoints.readiness_endpoints import ReadinessEndpoints
+from anchor_sdk.sep_endpoints.profiler_endpoints import ProfilerEndpoints
+from anchor_sdk.default_sep10_handler.handler import DefaultSep10Handler
+from anchor_sdk.sep_services.warmup import WarmUp, preload_reference_data, warm_sep10_handler
+from anchor_sdk.sep_services.profiling import RouteProfiler
+from anchor_sdk.sep_services.admission import (
+    AdmissionController, AdmissionMiddleware, PRIORITY_BULK, PRIORITY_DISCOVERY, PRIORITY_INTERACTIVE
+)
+
+DEFAULT_PREFIXES = {
+    "sep1": "/.well-known",
+    "sep10": "/auth",
+    "sep12": "/kyc",
+    "sep6": "/sep6",
+    "sep38": "/sep38",
+}
+
+def default_thread_limit(sync_handlers: int) -> int:
+    """
+    Sizes the threadpool running synchronous routes: 16 threads per mounted synchronous
+    handler, at least the 40 threads of the AnyIO default.
+    """
+    return max(40, 16 * sync_handlers)
+
+def default_admission(prefixes: dict[str, str], thread_limit: int, queue_timeout: float = 1) -> AdmissionController:
+    """
+    Admission control of the routes mounted by `create_anchor_app`.
+
+    `stellar.toml`, the JWKS, `/ready`, the SEP-6 and SEP-38 `/info` and the SEP-6 status
+    stream are never limited. Every other route shares the "anchor" limit of three quarters
+    of `thread_limit`, which leaves threads for the discovery routes, and the limit of its SEP,
+    half of it. SEP-10 token verification and SEP-12 `PUT /customer` have their own limits of
+    a quarter of it, and uploads and token introspection queue behind interactive requests.
+    """
+    shared = max(1, thread_limit * 3 // 4)
+    admission = AdmissionController()
+    admission.add_limit("anchor", shared, queue_timeout=queue_timeout)
+    for key in ("sep10", "sep12", "sep6", "sep38"):
+        admission.add_limit(key, max(1, shared // 2), queue_timeout=queue_timeout)
+    admission.add_limit("sep10_verify", max(1, shared // 4), queue_timeout=queue_timeout)
+    admission.add_limit("sep12_upload", max(1, shared // 4), queue_timeout=queue_timeout)
+
+    for path in (
+        f"{prefixes['sep1']}/stellar.toml",
+        "/.well-known/jwks.json",
+        "/ready",
+        f"{prefixes['sep6']}/info",
+        f"{prefixes['sep38']}/info",
+        f"{prefixes['sep6']}/transaction/stream",
+    ):
+        admission.add_rule(path, methods=["GET"], priority=PRIORITY_DISCOVERY)
+
+    sep10, sep12 = prefixes["sep10"], prefixes["sep12"]
+    admission.add_rule(f"{sep10}/introspect", ["sep10", "anchor"], priority=PRIORITY_BULK)
+    admission.add_rule(sep10, ["sep10_verify", "sep10", "anchor"], methods=["POST"])
+    admission.add_rule(sep10, ["sep10", "anchor"])
+    admission.add_rule(f"{sep12}/customer", ["sep12_upload", "sep12", "anchor"], methods=["PUT"], priority=PRIORITY_BULK)
+    admission.add_rule(sep12, ["sep12", "anchor"])
+    admission.add_rule(prefixes["sep6"], ["sep6", "anchor"])
+    admission.add_rule(prefixes["sep38"], ["sep38", "anchor"])
+    return admission
+
+def anchor_exception_handler(request: Request, exc: AnchorSdkException):
+    return exc.default_exception_anchor_response()
+
+def create_anchor_app(
+    sep1_handler: Sep1Handler = None,
+    sep10_handler: Sep10Handler = None,
+    sep12_handler: Sep12Handler = None,
+    sep6_handler: Sep6Handler = None,
+    sep38_handler: Sep38Handler = None,
+    prefixes: dict[str, str] = None,
+    fast_responses: bool = False,
+    jwt_keys: JwtKeySet = None,
+    warm_up: WarmUp = None,
+    services: list = (),
+    thread_limit: int = None,
+    admission: Union[bool, AdmissionController] = False,
+    profiler: RouteProfiler = None,
+    profiler_admin_token: str = None,
+    lifespan: Callable = None,
+    sep1_options: dict = None,
+    sep10_options: dict = None,
+    sep12_options: dict = None,
+    sep6_options: dict = None,
+    sep38_options: dict = None
+) -> FastAPI:
+    """
+    Builds a FastAPI application serving every configured SEP.
+
+    Each given handler is mounted with its endpoints class under its prefix, `AnchorSdkException`s
+    are rendered as SEP error responses, and the application lifespan:
+
+    - sizes the threadpool running synchronous routes, by default with `default_thread_limit`
+      of the number of mounted synchronous handlers;
+    - starts `warm_up`, with the reference data, `DefaultSep10Handler` and endpoints warm-up
+      tasks appended, and mounts `GET /ready`;
+    - starts the SEP-38 rate cache and each background service, e.g. a `KycProcessor` or
+      `CustomerPurgeWorker`, and on shutdown stops them in reverse order so they drain their
+      current work.
+
+    With `admission`, requests go through an `AdmissionMiddleware`: `True` applies
+    `default_admission`, which keeps discovery routes responsive while expensive routes
+    queue and are shed with a 503 and `Retry-After` under overload.
+
+    With `profiler`, a sample of the requests of every SEP route is profiled; the profiles
+    are served under `/admin/profiles` when `profiler_admin_token` is also given.
+
+    Services and warm-up are started in each worker process, after any pre-fork. With
+    several workers, `hitch serve --factory` calls the factory in each worker, so the
+    handlers, queues and connections it creates belong to that worker; state built when
+    the factory's module is imported is shared copy-on-write.
+
+    Args:
+        sep1_handler (Sep1Handler, optional): Serves `stellar.toml`.
+        sep10_handler (Sep10Handler, optional): Required by SEP-6, 12 and 38.
+        sep12_handler (Sep12Handler, optional): Required by SEP-6.
+        sep6_handler (Sep6Handler, optional): SEP-6 handler.
+        sep38_handler (Sep38Handler, optional): SEP-38 handler.
+        prefixes (dict[str, str], optional): Prefix of each SEP, by "sep1", "sep10"... key,
+            merged over `DEFAULT_PREFIXES`.
+        fast_responses (bool, optional): Pre-encoded responses for SEP-10 and SEP-12. Defaults to False.
+        jwt_keys (JwtKeySet, optional): Published at `/.well-known/jwks.json` when given.
+        warm_up (WarmUp, optional): Start-up warm-up; enables `GET /ready`.
+        services (list, optional): Objects with `start()` and `stop()` run for the application's lifetime.
+            The SEP-38 rate cache and the SEP-6 `deposit_pool` are added automatically.
+        thread_limit (int, optional): Threads running synchronous routes.
+        admission (Union[bool, AdmissionController], optional): Admission control, `True` for
+            `default_admission`. Defaults to False.
+        profiler (RouteProfiler, optional): Samples and profiles requests per route.
+        profiler_admin_token (str, optional): Bearer token of the `ProfilerEndpoints`.
+        lifespan (Callable, optional): The application's own lifespan, entered last.
+        sep1_options, sep10_options, sep12_options, sep6_options, sep38_options (dict, optional):
+            Extra keyword arguments of each endpoints class, e.g. `{"catalog": catalog}`.
+
+    Returns:
+        FastAPI: The application. `app.state.endpoints` holds the endpoints instances by SEP key
+            and `app.state.admission` the admission controller, if any.
+
+    Raises:
+        ValueError: If a SEP is configured without the handlers it depends on.
+    """
+    prefixes = {**DEFAULT_PREFIXES, **(prefixes or {})}
+    if sep10_handler is None and (sep12_handler or sep6_handler or sep38_handler):
+        raise ValueError("SEP-6, SEP-12 and SEP-38 require a sep10_handler")
+    if sep6_handler is not None and sep12_handler is None:
+        raise ValueError("SEP-6 requires a sep12_handler")
+
+    endpoints = {}
+    routers: list[tuple[APIRouter, str]] = []
+
+    def mount(key: str, build: Callable[[APIRouter], object], prefix: str = None):
+        router = APIRouter(route_class=profiler.route_class) if profiler is not None else APIRouter()
+        endpoints[key] = build(router)
+        routers.append((router, prefixes[key] if prefix is None else prefix))
+
+    if sep1_handler is not None:
+        mount("sep1", lambda router: Sep1Endpoints(sep1_handler, router, **(sep1_options or {})))
+    if sep10_handler is not None:
+        mount("sep10", lambda router: Sep10Endpoints(
+            sep10_handler, router, fast_responses=fast_responses, **(sep10_options or {})
+        ))
+    if jwt_keys is not None:
+        mount("jwks", lambda router: JwksEndpoints(router, jwt_keys), "")
+    if sep12_handler is not None:
+        mount("sep12", lambda router: Sep12Endpoints(
+            router, sep12_handler, sep10_handler, fast_responses=fast_responses, **(sep12_options or {})
+        ))
+    if sep6_handler is not None:
+        mount("sep6", lambda router: Sep6Endpoints(
+            router, sep6_handler, sep10_handler, sep12_handler, **(sep6_options or {})
+        ))
+    if sep38_handler is not None:
+        mount("sep38", lambda router: Sep38Endpoints(
+            router, sep38_handler, sep10_handler, **(sep38_options or {})
+        ))
+    if warm_up is not None:
+        mount("ready", lambda router: ReadinessEndpoints(router, warm_up), "")
+        warm_up.add("reference data", preload_reference_data)
+        if isinstance(sep10_handler, DefaultSep10Handler):
+            warm_up.add("sep10", lambda: warm_sep10_handler(sep10_handler))
+        for key in ("sep1", "sep6"):
+            if key in endpoints:
+                warm_up.add(f"{key} responses", endpoints[key].warm_up)
+
+    if profiler is not None and profiler_admin_token is not None:
+        admin_router = APIRouter()
+        endpoints["profiler"] = ProfilerEndpoints(admin_router, profiler, profiler_admin_token)
+        routers.append((admin_router, ""))
+
+    # services owning threads are started in the lifespan, i.e. in each worker process
+    lifespan_services = list(services)
+    if "sep38" in endpoints:
+        lifespan_services.insert(0, endpoints["sep38"].rate_cache)
+    deposit_pool = endpoints["sep6"].deposit_pool if "sep6" in endpoints else None
+    if deposit_pool is not None and deposit_pool not in lifespan_services:
+        lifespan_services.insert(0, deposit_pool)
+
+    if thread_limit is None:
+        sync_handlers = [
+            handler for handler in (sep1_handler, sep10_handler, sep12_handler, sep6_handler, sep38_handler)
+            if handler is not None and not isinstance(handler, AsyncSep12Handler)
+        ]
+        thread_limit = default_thread_limit(len(sync_handlers))
+
+    @asynccontextmanager
+    async def anchor_lifespan(app: FastAPI):
+        anyio.to_thread.current_default_thread_limiter().total_tokens = thread_limit
+        if warm_up is not None:
+            warm_up.start()
+        started = []
+        try:
+            for service in lifespan_services:
+                service.start()
+                started.append(service)
+            if lifespan is None:
+                yield
+            else:
+                async with lifespan(app) as state:
+                    yield state
+        finally:
+            for service in reversed(started):
+                await anyio.to_thread.run_sync(service.stop)
+
+    if admission is True:
+        admission = default_admission(prefixes, thread_limit)
+
+    app = FastAPI(lifespan=anchor_lifespan)
+    app.add_exception_handler(AnchorSdkException, anchor_exception_handler)
+    if admission:
+        app.add_middleware(AdmissionMiddleware, controller=admission)
+    for router, prefix in routers:
+        app.include_router(router, prefix=prefix)
+    app.state.endpoints = endpoints
+    app.state.admission = admission or None
+    return app
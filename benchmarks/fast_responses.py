@@ -0,0 +1,95 @@
+"""
+Compares the default FastAPI response path with the pre-encoded fast response path
+for the SEP-10 and SEP-12 responses.
+
+The default path mirrors what FastAPI does with a value returned from an endpoint:
+build the response object, validate it against the route's response model, run it
+through `jsonable_encoder` and render a `JSONResponse`. The fast path builds the same
+body with `model_construct`/`dump_json` and wraps it in `PreEncodedJSONResponse`.
+
+Usage:
+    python -m anchor_sdk.benchmarks.fast_responses [iterations]
+"""
+import asyncio
+import sys
+import time
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from anchor_sdk.sep_serializations.encoders import PreEncodedJSONResponse, dump_json, orjson
+from anchor_sdk.sep_serializations.sep10_serializations import ChallengeResponse, TokenResponse
+from anchor_sdk.sep_serializations.sep12_serializations import CustomerGetResponse
+
+TRANSACTION = "AAAAAgAAAAC" + "A" * 480 + "=="
+NETWORK_PASSPHRASE = "Test SDF Network ; September 2015"
+TOKEN = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "e" * 300 + "." + "s" * 43
+CUSTOMER = {
+    "id": "d1ce2f48-3ff1-495d-9240-7a50d806cfed",
+    "status": "NEEDS_INFO",
+    "fields": {
+        name: {"type": "string", "description": f"{name.replace('_', ' ')} of the customer"}
+        for name in ("mobile_number", "email_address", "birth_date", "address", "city", "postal_code")
+    },
+    "provided_fields": {
+        name: {"type": "string", "description": f"{name.replace('_', ' ')} of the customer", "status": "ACCEPTED"}
+        for name in ("first_name", "last_name", "address_country_code")
+    },
+}
+
+
+def _response_field(response_model):
+    router = APIRouter()
+    router.add_api_route("/", lambda: None, response_model=response_model)
+    return router.routes[0].response_field
+
+
+async def _default(field, build, exclude_none):
+    content = await serialize_response(field=field, response_content=build(), exclude_none=exclude_none)
+    return JSONResponse(content).body
+
+
+async def _run(iterations: int):
+    cases = [
+        (
+            "GET /auth",
+            _response_field(ChallengeResponse),
+            lambda: ChallengeResponse(transaction=TRANSACTION, network_passphrase=NETWORK_PASSPHRASE),
+            lambda: dump_json(ChallengeResponse.model_construct(transaction=TRANSACTION, network_passphrase=NETWORK_PASSPHRASE)),
+            False,
+        ),
+        (
+            "POST /auth",
+            _response_field(TokenResponse),
+            lambda: TokenResponse(token=TOKEN),
+            lambda: dump_json(TokenResponse.model_construct(token=TOKEN)),
+            False,
+        ),
+        (
+            "GET /customer",
+            _response_field(CustomerGetResponse),
+            lambda: dict(CUSTOMER),
+            lambda: dump_json(dict(CUSTOMER)),
+            True,
+        ),
+    ]
+
+    print(f"iterations: {iterations}, orjson: {'yes' if orjson is not None else 'no'}")
+    for name, field, build_default, build_fast, exclude_none in cases:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await _default(field, build_default, exclude_none)
+        default_us = (time.perf_counter() - start) / iterations * 1e6
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            PreEncodedJSONResponse(build_fast()).body
+        fast_us = (time.perf_counter() - start) / iterations * 1e6
+
+        print(
+            f"{name:<15} default {default_us:8.2f} us   fast {fast_us:8.2f} us   "
+            f"saved {default_us - fast_us:8.2f} us/request ({default_us / fast_us:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,274 @@
+"""
+Command line interface of Hitch.
+
+Usage:
+    hitch serve myanchor.app:app --workers 1
+    hitch serve myanchor.app:build_app --factory --workers 4 --port 8000
+"""
+import argparse
+import gc
+import importlib
+import importlib.util
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Callable
+import uvicorn
+from fastapi import FastAPI
+from anchor_sdk.sep_services.warmup import preload_reference_data
+
+logger = logging.getLogger(__name__)
+
+def _import_target(target: str):
+    module_name, _, attribute = target.partition(":")
+    if not attribute:
+        raise ValueError(f"Application target '{target}' must be 'module:attribute'")
+    return getattr(importlib.import_module(module_name), attribute)
+
+def load_app(target: str, factory: bool = False) -> FastAPI:
+    """
+    Imports `module:attribute`, calling it when `factory` is set.
+    """
+    app = _import_target(target)
+    return app() if factory else app
+
+def _event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+def _http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+def _bind(host: str, port: int, backlog: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+def serve(
+    target: str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    factory: bool = False,
+    preload: bool = True,
+    access_log: bool = True,
+    graceful_timeout: float = 30,
+    backlog: int = 2048
+):
+    """
+    Serves an anchor application with pre-forked uvicorn workers.
+
+    Several workers require an application factory. The master process imports the
+    factory's module and preloads the reference datasets, then freezes the heap so the
+    garbage collector does not dirty the shared pages; every worker is forked from it,
+    shares that read-only state copy-on-write and calls the factory itself. Threads do not
+    survive a fork and SQLite connections must not cross one, so the queues, caches and
+    connections the application owns are created in the worker that uses them. Workers
+    share the listening socket, run uvloop and httptools when they are installed, and are
+    restarted if they exit unexpectedly.
+
+    On SIGTERM or SIGINT each worker stops accepting connections, finishes in-flight
+    requests and runs the application's shutdown, which drains its background services.
+    Workers still running after `graceful_timeout` seconds are killed.
+
+    Args:
+        target (str): The application, as "module:attribute".
+        host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+        port (int, optional): Port to bind. Defaults to 8000.
+        workers (int, optional): Worker processes; more than one requires `factory`. Defaults to 1.
+        factory (bool, optional): Whether `target` is a function returning the application. Defaults to False.
+        preload (bool, optional): Load reference datasets before forking. Defaults to True.
+        access_log (bool, optional): Log every request. Defaults to True.
+        graceful_timeout (float, optional): Seconds allowed for a graceful shutdown. Defaults to 30.
+        backlog (int, optional): Listen backlog. Defaults to 2048.
+
+    Raises:
+        ValueError: If several workers are requested without `factory`.
+    """
+    if workers > 1 and not factory:
+        raise ValueError("Serving several workers requires an application factory, see --factory")
+    if preload:
+        preload_reference_data()
+    # with several workers only the factory is imported here; each worker builds its own application
+    app = load_app(target, factory) if workers <= 1 else None
+    build_app = _import_target(target) if workers > 1 else None
+    sock = _bind(host, port, backlog)
+
+    def run_worker():
+        config = uvicorn.Config(
+            app if app is not None else build_app(),
+            loop=_event_loop(),
+            http=_http_protocol(),
+            access_log=access_log,
+            timeout_graceful_shutdown=graceful_timeout,
+            backlog=backlog
+        )
+        uvicorn.Server(config).run(sockets=[sock])
+
+    logger.info("Serving %s on %s:%d with %d worker(s), %s loop, %s", target, host, port, workers, _event_loop(), _http_protocol())
+    if workers <= 1:
+        run_worker()
+        return
+
+    gc.collect()
+    gc.freeze()
+    _supervise(run_worker, workers, graceful_timeout)
+
+def _fork(run_worker: Callable[[], None]) -> int:
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        status = 0
+        try:
+            run_worker()
+        except BaseException:
+            logger.exception("Worker crashed")
+            status = 1
+        finally:
+            os._exit(status)
+    return pid
+
+def _supervise(
+    run_worker: Callable[[], None],
+    workers: int,
+    graceful_timeout: float,
+    restart_delay: float = 1,
+    max_restart_delay: float = 30,
+    max_crashes: int = 5,
+    crash_window: float = 60
+):
+    """
+    Runs `workers` forked workers until SIGTERM or SIGINT, replacing those that exit.
+
+    A worker exiting within `crash_window` seconds of its start counts as a crash, and its
+    replacement is forked after `restart_delay` seconds, doubled for each further crash in
+    the window up to `max_restart_delay`. After `max_crashes` crashes within the window,
+    e.g. an application failing at startup, the remaining workers are stopped and the
+    master exits with status 1.
+    """
+    children = {_fork(run_worker): time.monotonic() for _ in range(workers)}
+    restarts: list[float] = []
+    crashes: list[float] = []
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        restarts.clear()
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    deadline = None
+    while children or restarts:
+        now = time.monotonic()
+        if stopping and deadline is None:
+            deadline = now + graceful_timeout
+        if deadline is not None and now > deadline:
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            deadline = float("inf")
+
+        while restarts and restarts[0] <= now and not stopping:
+            restarts.pop(0)
+            children[_fork(run_worker)] = time.monotonic()
+
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            if not restarts:
+                break
+            pid = 0
+        if pid == 0:
+            time.sleep(0.1)
+            continue
+
+        started = children.pop(pid, None)
+        if stopping or started is None:
+            continue
+        crashes[:] = [crashed for crashed in crashes if now - crashed < crash_window]
+        if now - started < crash_window:
+            crashes.append(now)
+        if len(crashes) >= max_crashes:
+            logger.error("%d workers crashed within %ss, stopping", len(crashes), crash_window)
+            stop(signal.SIGTERM, None)
+            _supervise_shutdown(children, graceful_timeout)
+            raise SystemExit(1)
+        delay = min(restart_delay * 2 ** (len(crashes) - 1), max_restart_delay) if crashes else 0
+        logger.warning("Worker %d exited, starting a new one in %.1fs", pid, delay)
+        restarts.append(now + delay)
+        restarts.sort()
+
+def _supervise_shutdown(children: dict[int, float], graceful_timeout: float):
+    deadline = time.monotonic() + graceful_timeout
+    while children:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid:
+            children.pop(pid, None)
+            continue
+        if time.monotonic() > deadline:
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            deadline = float("inf")
+        time.sleep(0.1)
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(prog="hitch", description="Hitch Stellar anchor tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Serve an anchor application")
+    serve_parser.add_argument("app", help="Application as 'module:attribute'")
+    serve_parser.add_argument("--factory", action="store_true", help="Call the attribute to build the application")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes. Defaults to the number of CPUs with --factory, 1 otherwise"
+    )
+    serve_parser.add_argument("--no-preload", dest="preload", action="store_false", help="Skip loading reference data before forking")
+    serve_parser.add_argument("--no-access-log", dest="access_log", action="store_false")
+    serve_parser.add_argument("--graceful-timeout", type=float, default=30)
+    serve_parser.add_argument("--backlog", type=int, default=2048)
+
+    args = parser.parse_args(argv)
+    if args.workers is None:
+        args.workers = (os.cpu_count() or 1) if args.factory else 1
+    if args.workers > 1 and not args.factory:
+        parser.error("--workers above 1 requires --factory, so each worker builds its own application")
+    logging.basicConfig(level=logging.INFO)
+    sys.path.insert(0, os.getcwd())
+    serve(
+        args.app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        factory=args.factory,
+        preload=args.preload,
+        access_log=args.access_log,
+        graceful_timeout=args.graceful_timeout,
+        backlog=args.backlog
+    )
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,24 @@
+import hashlib
+import json
+import time
+from typing import Optional
 from fastapi import Request
-from anchor_sdk.models import AnchorUser
+from anchor_sdk.models import AnchorUser, TokenIntrospection
 from anchor_sdk.exceptions import Sep10AuthError, MethodNotImplementedError
 from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.default_sep10_handler.jwt_keys import JwtKeySet
+from anchor_sdk.default_sep10_handler.horizon import HorizonPool
+from anchor_sdk.default_sep10_handler.outbound import CircuitBreakers, DeadlineRequestsClient, deadline
+from anchor_sdk.sep_services.shared_cache import CacheBackend
 from anchor_sdk.default_sep10_handler.util.sep10_utils import (
     get_client_signing_key,
     challenge_transaction,
     validate_challenge_xdr,
     generate_jwt
 )
-from stellar_sdk import Network, Server
-from fastapi import Request
+from stellar_sdk import Network, Server, Keypair
+from stellar_sdk.client.requests_client import RequestsClient
+from stellar_sdk.exceptions import ConnectionError as StellarConnectionError
 
 from stellar_sdk.sep.exceptions import (
     InvalidSep10ChallengeError,
@@ -21,10 +30,52 @@ from jwt import (
     ExpiredSignatureError,
     DecodeError,
     InvalidAlgorithmError,
-    InvalidSignatureError
+    InvalidSignatureError,
+    InvalidKeyError
 )
 
 class DefaultSep10Handler(Sep10Handler):
+    """
+    SEP-10 handler issuing and verifying JWTs for challenges signed with the anchor's key.
+
+    Tokens are signed with HS256 and `jwt_secret_key`, or, when `jwt_keys` is given, with
+    the current EdDSA/ES256 key of the key set and its `kid` in the header, so downstream
+    services can verify them with the published JWKS. While migrating, tokens without a
+    `kid` are still verified with `jwt_secret_key` if one is set.
+
+    Each `GET /auth` and `POST /auth` runs under a `deadline` of `request_budget` seconds
+    covering the client domain TOML fetch and the Horizon calls. Client domains that keep
+    failing are short-circuited by per-domain circuit breakers, and Horizon nodes by the
+    breakers of the `HorizonPool`, so logins fail fast with `Sep10AuthError` instead of
+    waiting out timeouts.
+
+    With a `cache`, e.g. an `MmapCache` shared by the workers of a host, client domain
+    signing keys and the claims of verified tokens are cached. A cached token is only
+    re-verified after `token_cache_ttl` seconds, so a retired JWT key keeps validating
+    its tokens for at most that long; revocation is still checked on every request.
+
+    Args:
+        jwt_secret_key (str): HS256 secret. May be None when `jwt_keys` is given.
+        sep10_signing_key (str): The SEP-10 signing secret key.
+        web_auth_domain (str): The web auth domain.
+        home_domain (str): The home domain.
+        host_url (str): Base URL of the anchor, used as JWT issuer.
+        allowed_client_domains (list[str], optional): Client domains allowed to authenticate. Defaults to [].
+        client_attribution_required (bool, optional): Whether a client domain is mandatory. Defaults to False.
+        network_passphrase (str, optional): Network passphrase. Defaults to testnet.
+        server (Server | HorizonPool, optional): Horizon client, or a `HorizonPool` spreading
+            account lookups over several nodes. Defaults to a pool of the testnet Horizon.
+        toml_client (RequestsClient, optional): HTTP client for client domain TOML lookups. Defaults
+            to a `DeadlineRequestsClient` with a 3 seconds timeout.
+        jwt_keys (JwtKeySet, optional): Asymmetric keys to sign and verify tokens with. Defaults to None.
+        revoked_jtis (optional): Container of revoked token ids, checked with `in`, e.g. a
+            `RevocationList`. Defaults to None.
+        request_budget (float, optional): Seconds of outbound I/O allowed per request. Defaults to 5.
+        toml_breakers (CircuitBreakers, optional): Breakers of client domains. Defaults to new breakers.
+        cache (CacheBackend, optional): Cache of signing keys and verified tokens. Defaults to None.
+        signing_key_ttl (float, optional): Seconds a client domain signing key is cached. Defaults to 300.
+        token_cache_ttl (float, optional): Seconds the claims of a verified token are cached. Defaults to 60.
+    """
 
     def __init__(
         self,
@@ -36,16 +87,34 @@ class DefaultSep10Handler(Sep10Handler):
         allowed_client_domains : list[str] = [],
         client_attribution_required : bool = False,
         network_passphrase : str = Network.TESTNET_NETWORK_PASSPHRASE,
-        server: Server = Server("https://horizon-testnet.stellar.org")
+        server: Server | HorizonPool = None,
+        toml_client: RequestsClient = None,
+        jwt_keys: JwtKeySet = None,
+        revoked_jtis = None,
+        request_budget: float = 5,
+        toml_breakers: CircuitBreakers = None,
+        cache: CacheBackend = None,
+        signing_key_ttl: float = 300,
+        token_cache_ttl: float = 60
     ):
-        self.server = server
+        self.server = server if server is not None else HorizonPool(["https://horizon-testnet.stellar.org"])
+        self.toml_client = toml_client if toml_client is not None else DeadlineRequestsClient(request_timeout=3)
+        self.request_budget = request_budget
+        self.toml_breakers = toml_breakers if toml_breakers is not None else CircuitBreakers()
+        self.cache = cache
+        self.signing_key_ttl = signing_key_ttl
+        self.token_cache_ttl = token_cache_ttl
         self.host_url = host_url
         self.home_domain = home_domain
         self.jwt_secret_key = jwt_secret_key
+        self.jwt_keys = jwt_keys
+        self.revoked_jtis = revoked_jtis
         self.web_auth_domain = web_auth_domain
         self.sep10_signing_key = sep10_signing_key
+        self.sep10_public_key = Keypair.from_secret(sep10_signing_key).public_key
+        self.home_domains = [home_domain]
         self.network_passphrase = network_passphrase
-        self.allowed_client_domains = allowed_client_domains
+        self.allowed_client_domains = frozenset(allowed_client_domains)
         self.client_attribution_required = client_attribution_required
 
 
@@ -68,14 +137,32 @@ class DefaultSep10Handler(Sep10Handler):
             raise Sep10AuthError(f"Client domain '{client_domain}' not allowed")
 
         if client_domain:
+            client_signing_key = self._cached_signing_key(client_domain)
+        if client_domain and client_signing_key is None:
+            breaker = self.toml_breakers.get(client_domain)
+            if not breaker.allow():
+                raise Sep10AuthError(f"Unable to fetch '{client_domain}' signing key, try again later")
             try:
-                client_signing_key = get_client_signing_key(client_domain)
+                with deadline(self.request_budget):
+                    client_signing_key = get_client_signing_key(client_domain, self.toml_client)
             except (
                 ConnectionError,
+                StellarConnectionError,
                 StellarTomlNotFoundError,
                 toml.decoder.TomlDecodeError,
             ):
+                breaker.record_failure()
                 raise Sep10AuthError(f"Unable to fetch '{client_domain}' signing key")
+            except Sep10AuthError:
+                breaker.record_success()
+                raise
+            except Exception:
+                # every admitted call records an outcome, or a half-open breaker never closes
+                breaker.record_failure()
+                raise
+            breaker.record_success()
+            if self.cache is not None:
+                self.cache.set(f"sep10:signing_key:{client_domain}", client_signing_key.encode(), self.signing_key_ttl)
         try:
             transaction = challenge_transaction(
                 server_secret_key,
@@ -93,13 +180,16 @@ class DefaultSep10Handler(Sep10Handler):
             raise Sep10AuthError(f"Error generating challenge transaction: {e}")
 
     def verify_challenge_transaction(self, envelope_xdr: str) -> str:
-        client_domain = validate_challenge_xdr(
-            envelope_xdr=envelope_xdr,
-            server_account_secret=self.sep10_signing_key,
-            web_auth_domain=self.web_auth_domain,
-            network_passphrase=self.network_passphrase,
-            home_domains=[self.home_domain]
-        )
+        with deadline(self.request_budget):
+            client_domain = validate_challenge_xdr(
+                envelope_xdr=envelope_xdr,
+                server_account_secret=self.sep10_signing_key,
+                web_auth_domain=self.web_auth_domain,
+                network_passphrase=self.network_passphrase,
+                home_domains=self.home_domains,
+                server=self.server,
+                server_account_public_key=self.sep10_public_key
+            )
         token = generate_jwt(
             server_account_secret=self.sep10_signing_key,
             web_auth_domain=self.web_auth_domain,
@@ -108,7 +198,9 @@ class DefaultSep10Handler(Sep10Handler):
             jwt_secret_key=self.jwt_secret_key,
             network_passphrase=self.network_passphrase,
             client_domain=client_domain,
-            home_domains=[self.home_domain]
+            home_domains=self.home_domains,
+            server_account_public_key=self.sep10_public_key,
+            jwt_keys=self.jwt_keys
         )
         return token
 
@@ -125,28 +217,109 @@ class DefaultSep10Handler(Sep10Handler):
         return self._verify_token(token=token)
 
     def _verify_token(self, token: str) -> AnchorUser:
+        decoded_jwt = self._verified_claims(token)
+        if self.revoked_jtis is not None and decoded_jwt.get('jti') in self.revoked_jtis:
+            raise Sep10AuthError("Token has been revoked, please re-authenticate")
+        return self._user_from_claims(decoded_jwt)
+
+    def revoke_token(self, token: str):
+        """
+        Revokes a token issued by this handler, e.g. on logout.
+
+        Requires `revoked_jtis` to be a `RevocationList`.
+
+        Raises:
+            Sep10AuthError: If the token is invalid or expired.
+        """
+        decoded_jwt = self._verified_claims(token)
+        self.revoked_jtis.revoke(decoded_jwt['jti'], decoded_jwt.get('exp'))
+
+    def introspect_tokens(self, tokens: list[str], check_revoked: bool = True) -> list[TokenIntrospection]:
+        """
+        Verifies a batch of JWTs against the preloaded keys in one pass.
+
+        Repeated tokens in the batch are only verified once.
+
+        Args:
+            tokens (list[str]): The JWTs to verify.
+            check_revoked (bool, optional): Report tokens whose `jti` is in `revoked_jtis`
+                as inactive. Defaults to True.
+
+        Returns:
+            list[TokenIntrospection]: One result per token, in input order.
+        """
+        revoked_jtis = self.revoked_jtis if check_revoked else None
+        verified = {}
+        results = []
+        for token in tokens:
+            result = verified.get(token)
+            if result is None:
+                result = verified[token] = self._introspect(token, revoked_jtis)
+            results.append(result)
+        return results
+
+    def _introspect(self, token: str, revoked_jtis) -> TokenIntrospection:
         try:
-            decoded_jwt = jwt.decode(
-                token,
-                algorithms=['HS256'],
-                key=self.jwt_secret_key,
-            )
+            decoded_jwt = self._verified_claims(token)
+            jti, exp = decoded_jwt.get('jti'), decoded_jwt.get('exp')
+            if revoked_jtis is not None and jti in revoked_jtis:
+                return TokenIntrospection(False, jti=jti, exp=exp, error="Token has been revoked")
+            return TokenIntrospection(True, self._user_from_claims(decoded_jwt), jti, exp)
+        except Sep10AuthError as e:
+            return TokenIntrospection(False, error=e.error_message)
 
-            account_memo_split = decoded_jwt['sub'].split(":")
-            account = account_memo_split[0]
-            memo = account_memo_split[1] if len(account_memo_split) > 1 else None
-            client_domain = decoded_jwt['client_domain']
-            if not client_domain in self.allowed_client_domains and self.client_attribution_required:
-                raise Sep10AuthError("token was not signed by one of the allowed domains")
-
-            return AnchorUser(
-                account_id=account,
-                memo_id=memo,
-                client_domain=client_domain
-            )
+    def _cached_signing_key(self, client_domain: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(f"sep10:signing_key:{client_domain}")
+        return cached.decode() if cached is not None else None
 
-        except ExpiredSignatureError:
-            raise Sep10AuthError("Token has expired, please re-authenticate")
+    def _verified_claims(self, token: str) -> dict:
+        cache_key = None
+        decoded_jwt = None
+        if self.cache is not None:
+            cache_key = "sep10:token:" + hashlib.blake2b(token.encode(), digest_size=20).hexdigest()
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                decoded_jwt = json.loads(cached)
+
+        if decoded_jwt is None:
+            try:
+                decoded_jwt = self._decode_token(token)
+            except ExpiredSignatureError:
+                raise Sep10AuthError("Token has expired, please re-authenticate")
+            except (DecodeError, InvalidSignatureError, InvalidAlgorithmError, InvalidKeyError) as e:
+                raise Sep10AuthError("This token is invalid")
 
-        except (DecodeError, InvalidSignatureError, InvalidAlgorithmError) as e:
-            raise Sep10AuthError("This token is invalid")
+            if cache_key is not None:
+                ttl = min(self.token_cache_ttl, decoded_jwt.get('exp', 0) - time.time())
+                if ttl > 0:
+                    self.cache.set(cache_key, json.dumps(decoded_jwt).encode(), ttl)
+
+        if not decoded_jwt.get('client_domain') in self.allowed_client_domains and self.client_attribution_required:
+            raise Sep10AuthError("token was not signed by one of the allowed domains")
+        return decoded_jwt
+
+    @staticmethod
+    def _user_from_claims(decoded_jwt: dict) -> AnchorUser:
+        account_memo_split = decoded_jwt['sub'].split(":")
+        account = account_memo_split[0]
+        memo = account_memo_split[1] if len(account_memo_split) > 1 else 0
+
+        return AnchorUser(
+            account_id=account,
+            memo_id=memo,
+            client_domain=decoded_jwt['client_domain']
+        )
+
+    def _decode_token(self, token: str) -> dict:
+        if self.jwt_keys is not None:
+            kid = jwt.get_unverified_header(token).get("kid")
+            if kid is not None or not self.jwt_secret_key:
+                return self.jwt_keys.verify(token, kid)
+
+        return jwt.decode(
+            token,
+            algorithms=['HS256'],
+            key=self.jwt_secret_key,
+        )
@@ -0,0 +1,237 @@
+import json
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextvars import copy_context
+from typing import Callable, Optional, TypeVar
+from stellar_sdk import Account, Server
+from stellar_sdk.exceptions import BadRequestError, ConnectionError, NotFoundError
+from anchor_sdk.sep_services.shared_cache import CacheBackend
+from anchor_sdk.default_sep10_handler.outbound import CircuitBreaker, DeadlineRequestsClient, remaining_time
+
+T = TypeVar("T")
+
+class HorizonEndpoint:
+    """
+    One Horizon node, with its own connection pool, circuit breaker and latency statistics.
+
+    The health score is the expected cost of a request: the smoothed latency plus the
+    smoothed failure rate times the request timeout. Lower is better, and an erroring
+    node ranks behind a merely slow one.
+
+    Attributes:
+        url (str): Horizon URL.
+        request_timeout (float): Seconds before a request is abandoned.
+        server (Server): Client of this node, without retries; failover is done by the pool.
+        breaker (CircuitBreaker): Breaker of this node.
+
+    Args:
+        url (str): Horizon URL.
+        pool_size (int, optional): Pooled HTTP connections. Defaults to 10.
+        request_timeout (float, optional): Seconds before a request is abandoned. Defaults to 5.
+        breaker (CircuitBreaker, optional): Defaults to a new `CircuitBreaker`.
+        latency_window (int, optional): Number of latency samples kept for percentiles. Defaults to 200.
+    """
+    SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 10,
+        request_timeout: float = 5,
+        breaker: CircuitBreaker = None,
+        latency_window: int = 200
+    ):
+        self.url = url
+        self.request_timeout = request_timeout
+        self.server = Server(url, DeadlineRequestsClient(pool_size=pool_size, num_retries=0, request_timeout=request_timeout))
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self._latencies = deque(maxlen=latency_window)
+        self._latency: Optional[float] = None
+        self._success_rate = 1.0
+
+    @property
+    def score(self) -> float:
+        latency = self._latency if self._latency is not None else 0.0
+        return latency + (1 - self._success_rate) * self.request_timeout
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Returns the given percentile (0 to 1) of recent latencies, or None without samples.
+        """
+        latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, math.ceil(percentile * len(latencies)) - 1)]
+
+    def record(self, latency: float, ok: bool):
+        if ok:
+            self._latencies.append(latency)
+            self._latency = latency if self._latency is None else (
+                self.SMOOTHING * latency + (1 - self.SMOOTHING) * self._latency
+            )
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        self._success_rate = self.SMOOTHING * ok + (1 - self.SMOOTHING) * self._success_rate
+
+
+class HorizonPool:
+    """
+    Horizon access layer spreading calls over several nodes, for use as the `server` of
+    `DefaultSep10Handler`.
+
+    Each call goes to the healthy node with the best score. When it has not answered
+    within the `hedge_percentile` latency of that node, a hedged request is sent to the
+    next node and the first answer wins, so a single slow node does not set the login
+    latency. A node that fails, by connection error or 5xx response, is skipped for the
+    next one at once and its circuit breaker counts the failure. Not found and other 4xx
+    answers are valid responses and are returned without failover. Nodes whose breaker is
+    open are not called, and when no node is left the call fails at once. Inside a
+    `deadline` block, the whole call, hedges included, is bounded by the time left.
+
+    With a `cache`, loaded accounts, i.e. their signers and thresholds, are cached for
+    `account_ttl` seconds, so the workers of a host share one lookup per account.
+
+    Attributes:
+        endpoints (list[HorizonEndpoint]): The Horizon nodes.
+        hedge_percentile (float): Latency percentile after which a hedged request is sent.
+        initial_hedge_delay (float): Hedge delay used until a node has `min_samples` latencies.
+        min_samples (int): Latency samples needed to trust a node's percentile.
+
+    Args:
+        endpoints (list[str | HorizonEndpoint]): Horizon URLs or endpoints.
+        hedge_percentile (float, optional): Defaults to 0.95.
+        initial_hedge_delay (float, optional): Defaults to 0.5 seconds.
+        min_samples (int, optional): Defaults to 20.
+        max_workers (int, optional): Threads running requests. Defaults to 32.
+        cache (CacheBackend, optional): Cache of loaded accounts. Defaults to None.
+        account_ttl (float, optional): Seconds an account is cached. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        endpoints: list,
+        hedge_percentile: float = 0.95,
+        initial_hedge_delay: float = 0.5,
+        min_samples: int = 20,
+        max_workers: int = 32,
+        cache: CacheBackend = None,
+        account_ttl: float = 5
+    ):
+        if not endpoints:
+            raise ValueError("At least one Horizon endpoint is required")
+        self.endpoints = [
+            endpoint if isinstance(endpoint, HorizonEndpoint) else HorizonEndpoint(endpoint)
+            for endpoint in endpoints
+        ]
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_samples = min_samples
+        self.cache = cache
+        self.account_ttl = account_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="horizon")
+        self.hedged = 0
+
+    def load_account(self, account_id: str) -> Account:
+        """
+        Loads an account from the fastest healthy node.
+
+        Raises:
+            NotFoundError: If the account does not exist.
+            ConnectionError: If no node could answer.
+        """
+        if self.cache is None:
+            return self.call(lambda server: server.load_account(account_id))
+
+        cache_key = f"horizon:account:{account_id}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            raw_data = json.loads(cached)
+            return Account(account_id, int(raw_data["sequence"]), raw_data=raw_data)
+
+        account = self.call(lambda server: server.load_account(account_id))
+        self.cache.set(cache_key, json.dumps(account.raw_data).encode(), self.account_ttl)
+        return account
+
+    def call(self, function: Callable[[Server], T], timeout: float = None) -> T:
+        """
+        Runs `function(server)` with hedging and failover over the nodes.
+
+        Args:
+            function (Callable[[Server], T]): The Horizon call.
+            timeout (float, optional): Seconds to wait for an answer in total. Defaults to the
+                time left before the current `deadline`, if any.
+
+        Raises:
+            ConnectionError: If every node failed, is open, or the timeout passed.
+        """
+        if timeout is None:
+            timeout = remaining_time()
+        candidates = sorted(self.endpoints, key=lambda endpoint: endpoint.score)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        pending = {}
+        last_error: Optional[Exception] = None
+
+        while True:
+            if not pending:
+                endpoint = self._next_endpoint(candidates)
+                if endpoint is None:
+                    raise last_error or ConnectionError("No healthy Horizon endpoint available")
+                pending[self._submit(endpoint, function)] = endpoint
+                continue
+
+            wait_timeout = self._hedge_delay(next(iter(pending.values()))) if candidates and len(pending) == 1 else None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionError("Horizon request timed out")
+                wait_timeout = remaining if wait_timeout is None else min(wait_timeout, remaining)
+
+            done, _ = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                endpoint = self._next_endpoint(candidates) if len(pending) == 1 else None
+                if endpoint is not None:
+                    self.hedged += 1
+                    pending[self._submit(endpoint, function)] = endpoint
+                continue
+
+            for future in done:
+                del pending[future]
+                error = future.exception()
+                if error is None or isinstance(error, (NotFoundError, BadRequestError)):
+                    return future.result()
+                last_error = error
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _next_endpoint(candidates: list[HorizonEndpoint]) -> Optional[HorizonEndpoint]:
+        while candidates:
+            endpoint = candidates.pop(0)
+            if endpoint.breaker.allow():
+                return endpoint
+        return None
+
+    def _hedge_delay(self, endpoint: HorizonEndpoint) -> float:
+        if len(endpoint._latencies) < self.min_samples:
+            return self.initial_hedge_delay
+        return endpoint.latency_percentile(self.hedge_percentile)
+
+    def _submit(self, endpoint: HorizonEndpoint, function: Callable[[Server], T]):
+        def run():
+            started = time.monotonic()
+            try:
+                result = function(endpoint.server)
+            except (NotFoundError, BadRequestError):
+                endpoint.record(time.monotonic() - started, True)
+                raise
+            except Exception:
+                endpoint.record(time.monotonic() - started, False)
+                raise
+            endpoint.record(time.monotonic() - started, True)
+            return result
+
+        return self._executor.submit(copy_context().run, run)
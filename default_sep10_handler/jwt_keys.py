@@ -0,0 +1,185 @@
+import json
+import threading
+from typing import Optional
+import jwt
+from jwt.algorithms import get_default_algorithms
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+_ALGORITHMS = get_default_algorithms()
+
+class JwtSigningKey:
+    """
+    An asymmetric key used to sign or verify SEP-10 JWTs, identified by its `kid`.
+
+    Only the public half is needed to verify tokens, so downstream services can build
+    keys from the anchor's JWKS without ever holding the private key.
+
+    Attributes:
+        kid (str): Key id, sent in the JWT header.
+        algorithm (str): Either "EdDSA" (Ed25519) or "ES256" (P-256).
+        private_key: The `cryptography` private key, or None for verification-only keys.
+        public_key: The `cryptography` public key.
+
+    Args:
+        kid (str): Key id.
+        algorithm (str): "EdDSA" or "ES256".
+        private_key (optional): Private key object. Defaults to None.
+        public_key (optional): Public key object. Derived from `private_key` when omitted.
+    """
+    ALGORITHMS = ("EdDSA", "ES256")
+
+    def __init__(self, kid: str, algorithm: str, private_key=None, public_key=None):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported JWT algorithm '{algorithm}'")
+        if private_key is None and public_key is None:
+            raise ValueError("A private or public key is required")
+
+        self.kid = kid
+        self.algorithm = algorithm
+        self.private_key = private_key
+        self.public_key = public_key if public_key is not None else private_key.public_key()
+
+    @classmethod
+    def generate(cls, kid: str, algorithm: str = "EdDSA") -> "JwtSigningKey":
+        private_key = (
+            ed25519.Ed25519PrivateKey.generate()
+            if algorithm == "EdDSA" else
+            ec.generate_private_key(ec.SECP256R1())
+        )
+        return cls(kid, algorithm, private_key)
+
+    @classmethod
+    def from_pem(cls, kid: str, algorithm: str, pem: str | bytes, password: bytes = None) -> "JwtSigningKey":
+        """
+        Loads a PEM private key, or a PEM public key for a verification-only key.
+        """
+        pem = pem.encode() if isinstance(pem, str) else pem
+        if b"PRIVATE KEY" in pem:
+            return cls(kid, algorithm, serialization.load_pem_private_key(pem, password))
+        return cls(kid, algorithm, public_key=serialization.load_pem_public_key(pem))
+
+    @classmethod
+    def from_jwk(cls, jwk: dict) -> "JwtSigningKey":
+        """
+        Builds a verification-only key from one entry of a JWKS document.
+        """
+        algorithm = jwk.get("alg") or ("EdDSA" if jwk.get("kty") == "OKP" else "ES256")
+        return cls(jwk["kid"], algorithm, public_key=_ALGORITHMS[algorithm].from_jwk(jwk))
+
+    def private_pem(self, password: bytes = None) -> bytes:
+        return self.private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.BestAvailableEncryption(password) if password else serialization.NoEncryption()
+        )
+
+    def jwk(self) -> dict:
+        """
+        Returns the public JWK of this key.
+        """
+        jwk = _ALGORITHMS[self.algorithm].to_jwk(self.public_key, as_dict=True)
+        jwk.update(kid=self.kid, alg=self.algorithm, use="sig")
+        return jwk
+
+
+class JwtKeySet:
+    """
+    The table of keys SEP-10 JWTs are signed and verified with.
+
+    Tokens are signed with the current key and carry its `kid`; verification looks the
+    key up by `kid` in a dictionary of preloaded key objects, so rotating keys never adds
+    a search or a key parse to the request path. Rotation adds the new key as current and
+    keeps the previous ones for verification until they are retired, once every token
+    they signed has expired (24 hours for SEP-10).
+
+    Attributes:
+        current (JwtSigningKey): The key new tokens are signed with.
+        keys (dict[str, JwtSigningKey]): Every key accepted for verification, by `kid`.
+
+    Args:
+        keys (list[JwtSigningKey]): Keys accepted for verification.
+        current_kid (str, optional): Key used for signing. Defaults to the last key holding a private key.
+    """
+
+    def __init__(self, keys: list[JwtSigningKey], current_kid: str = None):
+        self._lock = threading.Lock()
+        self.keys = {key.kid: key for key in keys}
+        if current_kid is None:
+            signing_keys = [key for key in keys if key.private_key is not None]
+            current_kid = signing_keys[-1].kid if signing_keys else None
+        self.current: Optional[JwtSigningKey] = self.keys[current_kid] if current_kid is not None else None
+        self._jwks_json: Optional[bytes] = None
+
+    @classmethod
+    def from_jwks(cls, jwks: dict | str | bytes) -> "JwtKeySet":
+        """
+        Builds a verification-only key set from a JWKS document, e.g. the anchor's
+        `/.well-known/jwks.json` fetched by a downstream service.
+        """
+        if isinstance(jwks, (str, bytes)):
+            jwks = json.loads(jwks)
+        return cls([JwtSigningKey.from_jwk(jwk) for jwk in jwks["keys"]])
+
+    def sign(self, payload: dict) -> str:
+        """
+        Signs `payload` with the current key.
+        """
+        key = self.current
+        if key is None:
+            raise ValueError("The key set has no signing key")
+        return jwt.encode(payload, key.private_key, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def verify(self, token: str, kid: str = None, **options) -> dict:
+        """
+        Verifies `token` against the key named by its `kid` header and returns its claims.
+
+        Args:
+            token (str): The JWT.
+            kid (str, optional): The token's `kid`, if the header was already read.
+            **options: Passed to `jwt.decode`, e.g. `audience`.
+
+        Raises:
+            jwt.InvalidTokenError: If the token has no known `kid`, or is invalid or expired.
+        """
+        if kid is None:
+            kid = jwt.get_unverified_header(token).get("kid")
+        key = self.keys.get(kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f"Unknown JWT key id '{kid}'")
+        return jwt.decode(token, key=key.public_key, algorithms=[key.algorithm], **options)
+
+    def rotate(self, key: JwtSigningKey):
+        """
+        Makes `key` the signing key, keeping the previous keys for verification.
+        """
+        with self._lock:
+            self.keys = {**self.keys, key.kid: key}
+            self.current = key
+            self._jwks_json = None
+
+    def retire(self, kid: str):
+        """
+        Stops accepting tokens signed with key `kid`.
+        """
+        with self._lock:
+            if self.current is not None and self.current.kid == kid:
+                raise ValueError("The current signing key cannot be retired")
+            self.keys = {key_id: key for key_id, key in self.keys.items() if key_id != kid}
+            self._jwks_json = None
+
+    def jwks(self) -> dict:
+        return {"keys": [key.jwk() for key in self.keys.values()]}
+
+    def jwks_json(self) -> bytes:
+        """
+        Returns the encoded JWKS document, rebuilt only after a rotation or retirement.
+        """
+        jwks_json = self._jwks_json
+        if jwks_json is None:
+            # built under the lock so a document of the keys before a rotation is never stored after it
+            with self._lock:
+                jwks_json = self._jwks_json
+                if jwks_json is None:
+                    jwks_json = self._jwks_json = json.dumps(self.jwks(), separators=(",", ":")).encode()
+        return jwks_json
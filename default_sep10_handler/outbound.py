@@ -0,0 +1,171 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from stellar_sdk.client.requests_client import RequestsClient
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import ConnectionError
+from requests import RequestException
+from urllib3.exceptions import NewConnectionError
+
+_deadline: ContextVar[Optional[float]] = ContextVar("sep10_deadline", default=None)
+
+@contextmanager
+def deadline(budget: float):
+    """
+    Gives the outbound I/O made inside the block a total budget of `budget` seconds.
+
+    Nested deadlines never extend an enclosing one. `DeadlineRequestsClient` and
+    `HorizonPool` bound each request by the remaining time.
+    """
+    expires_at = time.monotonic() + budget
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def remaining_time() -> Optional[float]:
+    """
+    Returns the seconds left before the current deadline, or None outside of one.
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return max(0.0, expires_at - time.monotonic())
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing dependency and probes it again after a cooldown.
+
+    After `failure_threshold` consecutive failures the breaker opens and `allow` returns
+    False. Once `reset_timeout` seconds have passed it is half-open: a single probe call
+    is allowed, which closes the breaker on success or reopens it on failure.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures opening the breaker.
+        reset_timeout (float): Seconds the breaker stays open before a probe.
+
+    Args:
+        failure_threshold (int, optional): Consecutive failures opening the breaker. Defaults to 5.
+        reset_timeout (float, optional): Seconds before a probe. Defaults to 30.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """
+        Returns whether a call may be made now. A True answer in the half-open state
+        reserves the probe; its outcome must be recorded.
+        """
+        if self._opened_at is None:
+            return True
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class DeadlineRequestsClient(RequestsClient):
+    """
+    A `RequestsClient` whose request timeout is cut to the time left before the current `deadline`.
+
+    Requests made once the deadline has passed fail at once with `ConnectionError`. Retries
+    default to none, since retrying with backoff would overrun the budget.
+    """
+
+    def __init__(self, *args, num_retries: int = 0, **kwargs):
+        super().__init__(*args, num_retries=num_retries, **kwargs)
+
+    def get(self, url: str, params: dict = None) -> Response:
+        timeout = self._timeout(self.request_timeout)
+        try:
+            resp = self._session.get(url, params=params, timeout=timeout)
+        except (RequestException, NewConnectionError) as err:
+            raise ConnectionError(err)
+        return Response(status_code=resp.status_code, text=resp.text, headers=dict(resp.headers), url=resp.url)
+
+    def post(self, url: str, data: dict = None, json_data: dict = None) -> Response:
+        timeout = self._timeout(self.post_timeout)
+        try:
+            resp = self._session.post(url, data=data, json=json_data, timeout=timeout)
+        except (RequestException, NewConnectionError) as err:
+            raise ConnectionError(err)
+        return Response(status_code=resp.status_code, text=resp.text, headers=dict(resp.headers), url=resp.url)
+
+    @staticmethod
+    def _timeout(timeout: float) -> float:
+        remaining = remaining_time()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise ConnectionError("Request deadline exceeded")
+        return min(timeout, remaining)
+
+
+class CircuitBreakers:
+    """
+    One `CircuitBreaker` per key, e.g. per client domain, created on first use.
+
+    The least recently used breakers are dropped beyond `max_entries`.
+
+    Args:
+        failure_threshold (int, optional): Consecutive failures opening a breaker. Defaults to 5.
+        reset_timeout (float, optional): Seconds before a half-open probe. Defaults to 30.
+        max_entries (int, optional): Breakers kept. Defaults to 10000.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30, max_entries: int = 10000):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._breakers: OrderedDict[str, CircuitBreaker] = OrderedDict()
+
+    def get(self, key: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                if len(self._breakers) > self.max_entries:
+                    self._breakers.popitem(last=False)
+            else:
+                self._breakers.move_to_end(key)
+            return breaker
@@ -0,0 +1,188 @@
+import math
+import sqlite3
+import threading
+import time
+from hashlib import blake2b
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter of strings.
+
+    Membership tests never give false negatives; false positives happen at about
+    `error_rate` while at most `capacity` items were added. One million items at 1%
+    take about 1.2 MB.
+
+    Attributes:
+        capacity (int): Number of items the filter is sized for.
+        error_rate (float): Target false positive rate at `capacity` items.
+        size (int): Number of bits.
+        hashes (int): Number of bit positions per item.
+
+    Args:
+        capacity (int): Number of items the filter is sized for.
+        error_rate (float, optional): Target false positive rate. Defaults to 0.01.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % size
+
+    def add(self, item: str):
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class RevocationList:
+    """
+    The revoked SEP-10 token ids, stored in SQLite and screened by an in-memory Bloom filter.
+
+    Pass an instance as `revoked_jtis` to `DefaultSep10Handler`. Almost every token checked
+    is not revoked, and the filter answers those without any I/O; only filter hits, i.e.
+    revoked tokens and the rare false positive, are confirmed with an indexed lookup in the
+    database, which is the authoritative set. The filter is the only per-worker memory,
+    about 1.2 MB per million revoked tokens at the default error rate.
+
+    Each worker process opens the same database file. Revocations made by other workers
+    are loaded incrementally, by sequence number, at most every `reload_interval` seconds,
+    so a token revoked elsewhere is rejected everywhere within that delay. Revoking records
+    the token's expiry so `purge_expired` can drop entries once the token is unusable anyway.
+
+    Attributes:
+        path (str): Database file.
+        error_rate (float): Target false positive rate of the filter.
+        reload_interval (float): Seconds between incremental reloads.
+        capacity (int): Entries the current filter is sized for; it is rebuilt twice as large when exceeded.
+
+    Args:
+        path (str, optional): Database file. Defaults to "revoked_tokens.sqlite3".
+        capacity (int, optional): Initial filter capacity. Defaults to 1000000.
+        error_rate (float, optional): Target false positive rate. Defaults to 0.01.
+        reload_interval (float, optional): Seconds between incremental reloads. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        path: str = "revoked_tokens.sqlite3",
+        capacity: int = 1000000,
+        error_rate: float = 0.01,
+        reload_interval: float = 5
+    ):
+        self.path = path
+        self.error_rate = error_rate
+        self.reload_interval = reload_interval
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS revoked_tokens ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, jti TEXT NOT NULL UNIQUE, expires_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS revoked_tokens_expiry ON revoked_tokens (expires_at)"
+            )
+            self._rebuild()
+
+    def __contains__(self, jti: str) -> bool:
+        if not jti:
+            return False
+        if time.monotonic() >= self._next_reload:
+            self.reload()
+        if jti not in self._filter:
+            return False
+        with self._lock:
+            return self._connection.execute(
+                "SELECT 1 FROM revoked_tokens WHERE jti = ?", (jti,)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM revoked_tokens").fetchone()[0]
+
+    def revoke(self, jti: str, expires_at: float = None):
+        """
+        Revokes the token `jti`.
+
+        Args:
+            jti (str): The token id.
+            expires_at (float, optional): The token's `exp`. Entries without expiry are never purged.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO revoked_tokens (jti, expires_at) VALUES (?, ?)", (jti, expires_at)
+            )
+            self._filter.add(jti)
+
+    def reload(self):
+        """
+        Adds the revocations recorded since the last reload, including other workers', to the filter.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT seq, jti FROM revoked_tokens WHERE seq > ? ORDER BY seq", (self._last_seq,)
+            ).fetchall()
+            if rows:
+                self._entries += len(rows)
+                self._last_seq = rows[-1][0]
+                if self._entries > self.capacity:
+                    self._rebuild()
+                else:
+                    for _, jti in rows:
+                        self._filter.add(jti)
+            self._next_reload = time.monotonic() + self.reload_interval
+
+    def purge_expired(self, now: float = None) -> int:
+        """
+        Deletes the entries of tokens that have expired and rebuilds the filter without them.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            deleted = self._connection.execute(
+                "DELETE FROM revoked_tokens WHERE expires_at < ?", (now,)
+            ).rowcount
+            if deleted:
+                self._rebuild()
+            return deleted
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _rebuild(self):
+        rows = self._connection.execute("SELECT seq, jti FROM revoked_tokens ORDER BY seq").fetchall()
+        while len(rows) > self.capacity:
+            self.capacity *= 2
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        for _, jti in rows:
+            self._filter.add(jti)
+        self._entries = len(rows)
+        self._last_seq = rows[-1][0] if rows else 0
+        self._next_reload = time.monotonic() + self.reload_interval
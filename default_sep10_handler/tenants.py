@@ -0,0 +1,265 @@
+from contextvars import ContextVar
+from typing import Optional
+from fastapi import Request, status
+from stellar_sdk import Network, Server
+from stellar_sdk.client.requests_client import RequestsClient
+from anchor_sdk.models import AnchorUser, TokenIntrospection
+from anchor_sdk.exceptions import AnchorSdkException
+from anchor_sdk.sep_handlers.sep1_handler import Sep1Handler
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.default_sep10_handler.handler import DefaultSep10Handler
+from anchor_sdk.default_sep10_handler.jwt_keys import JwtKeySet
+from anchor_sdk.default_sep10_handler.horizon import HorizonPool
+from anchor_sdk.default_sep10_handler.outbound import CircuitBreakers, DeadlineRequestsClient
+
+_current_tenant: ContextVar[Optional["AnchorTenant"]] = ContextVar("hitch_current_tenant", default=None)
+
+class AnchorTenant:
+    """
+    A single branded anchor served from a shared Hitch process.
+
+    Everything that depends on the tenant is computed once at registration: the SEP-10
+    signing keypair, the allowed client domain set and the encoded `stellar.toml`.
+    Network resources (Horizon and TOML HTTP pools) are owned by the `TenantRegistry`
+    and shared by every tenant.
+
+    Attributes:
+        key (str): Identifier used in path-prefix mode, e.g. "acme" for "/acme/auth".
+        home_domain (str): The tenant's SEP-10 home domain.
+        hosts (frozenset[str]): Host names that resolve to this tenant.
+        toml_bytes (bytes): Pre-encoded `stellar.toml` contents, if provided.
+        sep10_handler (DefaultSep10Handler): SEP-10 handler bound to the tenant's keys.
+
+    Args:
+        key (str): Tenant identifier for path-prefix mode.
+        jwt_secret_key (str): Secret used to sign the tenant's JWTs.
+        sep10_signing_key (str): The tenant's SEP-10 signing secret key.
+        web_auth_domain (str): The tenant's web auth domain.
+        home_domain (str): The tenant's home domain.
+        host_url (str): Base URL of the tenant, used as JWT issuer.
+        allowed_client_domains (list[str], optional): Client domains allowed to authenticate. Defaults to [].
+        client_attribution_required (bool, optional): Whether a client domain is mandatory. Defaults to False.
+        hosts (list[str], optional): Host names for host-based resolution. Defaults to [home_domain].
+        toml (str, optional): `stellar.toml` contents served for this tenant. Defaults to None.
+        jwt_keys (JwtKeySet, optional): Asymmetric keys for the tenant's JWTs. Defaults to None.
+        revoked_jtis (optional): Container of the tenant's revoked token ids, checked with `in`,
+            e.g. a `RevocationList`. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        jwt_secret_key: str,
+        sep10_signing_key: str,
+        web_auth_domain: str,
+        home_domain: str,
+        host_url: str,
+        allowed_client_domains: list[str] = [],
+        client_attribution_required: bool = False,
+        hosts: list[str] = None,
+        toml: str = None,
+        jwt_keys: JwtKeySet = None,
+        revoked_jtis = None
+    ):
+        self.key = key
+        self.home_domain = home_domain
+        self.hosts = frozenset(host.lower() for host in (hosts or [home_domain]))
+        self.toml_bytes = toml.encode() if toml is not None else None
+        self._sep10_config = dict(
+            jwt_secret_key=jwt_secret_key,
+            sep10_signing_key=sep10_signing_key,
+            web_auth_domain=web_auth_domain,
+            home_domain=home_domain,
+            host_url=host_url,
+            allowed_client_domains=allowed_client_domains,
+            client_attribution_required=client_attribution_required,
+            jwt_keys=jwt_keys,
+            revoked_jtis=revoked_jtis,
+        )
+        self.sep10_handler: Optional[DefaultSep10Handler] = None
+
+    def _bind(self, server: Server, toml_client: RequestsClient, network_passphrase: str, toml_breakers: CircuitBreakers):
+        self.sep10_handler = DefaultSep10Handler(
+            network_passphrase=network_passphrase,
+            server=server,
+            toml_client=toml_client,
+            toml_breakers=toml_breakers,
+            **self._sep10_config
+        )
+
+
+class TenantRegistry:
+    """
+    Resolves the tenant of each request and holds the resources shared by all tenants.
+
+    Tenants are resolved either from the `Host` header (mode "host") or from the first
+    path segment (mode "path", e.g. "/acme/auth" serves tenant "acme" on "/auth").
+    `TenantMiddleware` stores the resolved tenant in a context variable that the
+    multi-tenant handlers read.
+
+    Attributes:
+        mode (str): Either "host" or "path".
+        server (Server | HorizonPool): Horizon client shared by every tenant.
+        toml_client (RequestsClient): HTTP client used for client domain TOML lookups.
+        toml_breakers (CircuitBreakers): Client domain circuit breakers shared by every tenant.
+        network_passphrase (str): Network passphrase shared by every tenant.
+
+    Args:
+        mode (str, optional): Resolution mode. Defaults to "host".
+        server (Server | HorizonPool, optional): Shared Horizon client. Defaults to a pool of the testnet Horizon.
+        toml_client (RequestsClient, optional): Shared TOML HTTP client. Defaults to a `DeadlineRequestsClient` with a 3s timeout.
+        network_passphrase (str, optional): Network passphrase. Defaults to the testnet passphrase.
+    """
+
+    def __init__(
+        self,
+        mode: str = "host",
+        server: Server = None,
+        toml_client: RequestsClient = None,
+        network_passphrase: str = Network.TESTNET_NETWORK_PASSPHRASE
+    ):
+        if mode not in ("host", "path"):
+            raise ValueError(f"Unknown tenant resolution mode '{mode}'")
+        self.mode = mode
+        self.server = server if server is not None else HorizonPool(["https://horizon-testnet.stellar.org"])
+        self.toml_client = toml_client if toml_client is not None else DeadlineRequestsClient(request_timeout=3)
+        self.toml_breakers = CircuitBreakers()
+        self.network_passphrase = network_passphrase
+        self._by_key: dict[str, AnchorTenant] = {}
+        self._by_host: dict[str, AnchorTenant] = {}
+
+    def register(self, tenant: AnchorTenant) -> AnchorTenant:
+        if tenant.key in self._by_key:
+            raise ValueError(f"Tenant '{tenant.key}' is already registered")
+        for host in tenant.hosts:
+            if host in self._by_host:
+                raise ValueError(f"Host '{host}' is already registered to tenant '{self._by_host[host].key}'")
+
+        tenant._bind(self.server, self.toml_client, self.network_passphrase, self.toml_breakers)
+        self._by_key[tenant.key] = tenant
+        for host in tenant.hosts:
+            self._by_host[host] = tenant
+        return tenant
+
+    def tenants(self) -> list[AnchorTenant]:
+        return list(self._by_key.values())
+
+    def get(self, key: str) -> Optional[AnchorTenant]:
+        return self._by_key.get(key)
+
+    def resolve_host(self, host: str) -> Optional[AnchorTenant]:
+        if not host:
+            return None
+        return self._by_host.get(host.split(":", 1)[0].lower())
+
+    @staticmethod
+    def current() -> AnchorTenant:
+        """
+        Returns the tenant of the request being served.
+
+        Raises:
+            AnchorSdkException: If the request did not resolve to a tenant.
+        """
+        tenant = _current_tenant.get()
+        if tenant is None:
+            raise AnchorSdkException(status.HTTP_404_NOT_FOUND, "Unknown anchor domain")
+        return tenant
+
+
+class TenantMiddleware:
+    """
+    ASGI middleware that resolves the tenant of each request.
+
+    In "path" mode the tenant segment is moved from `path` to `root_path`, so routers are
+    mounted once and serve every tenant. Requests that match no tenant get a 404.
+
+    Args:
+        app: The ASGI application to wrap.
+        registry (TenantRegistry): The registry to resolve tenants from.
+    """
+
+    def __init__(self, app, registry: TenantRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            return await self.app(scope, receive, send)
+
+        if self.registry.mode == "host":
+            host = None
+            for name, value in scope.get("headers", ()):
+                if name == b"host":
+                    host = value.decode("latin-1")
+                    break
+            tenant = self.registry.resolve_host(host)
+        else:
+            path = scope["path"]
+            key, _, rest = path.lstrip("/").partition("/")
+            tenant = self.registry.get(key)
+            if tenant is not None:
+                prefix = "/" + key
+                scope = dict(scope, path="/" + rest, root_path=scope.get("root_path", "") + prefix)
+                if "raw_path" in scope and scope["raw_path"]:
+                    scope["raw_path"] = scope["raw_path"][len(prefix):] or b"/"
+
+        if tenant is None:
+            body = b'{"error":"Unknown anchor domain"}'
+            await send({
+                "type": "http.response.start",
+                "status": status.HTTP_404_NOT_FOUND,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        token = _current_tenant.set(tenant)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_tenant.reset(token)
+
+
+class MultiTenantSep10Handler(Sep10Handler):
+    """
+    SEP-10 handler that delegates to the `DefaultSep10Handler` of the current tenant.
+
+    Args:
+        registry (TenantRegistry): The registry tenants are resolved from.
+    """
+
+    def __init__(self, registry: TenantRegistry):
+        self.registry = registry
+
+    def create_challenge_transaction(self, user: AnchorUser) -> tuple[str, str]:
+        return self.registry.current().sep10_handler.create_challenge_transaction(user)
+
+    def verify_challenge_transaction(self, envelope_xdr: str) -> str:
+        return self.registry.current().sep10_handler.verify_challenge_transaction(envelope_xdr)
+
+    def authenticated_route(self, request: Request) -> AnchorUser:
+        return self.registry.current().sep10_handler.authenticated_route(request)
+
+    def _verify_token(self, token: str) -> AnchorUser:
+        return self.registry.current().sep10_handler._verify_token(token)
+
+    def introspect_tokens(self, tokens: list[str], check_revoked: bool = True) -> list[TokenIntrospection]:
+        return self.registry.current().sep10_handler.introspect_tokens(tokens, check_revoked)
+
+
+class MultiTenantSep1Handler(Sep1Handler):
+    """
+    SEP-1 handler that serves the pre-encoded `stellar.toml` of the current tenant.
+
+    Args:
+        registry (TenantRegistry): The registry tenants are resolved from.
+    """
+
+    def __init__(self, registry: TenantRegistry):
+        self.registry = registry
+
+    def return_toml_data(self, toml_file_path: str) -> bytes:
+        toml_bytes = self.registry.current().toml_bytes
+        if toml_bytes is None:
+            raise AnchorSdkException(status.HTTP_404_NOT_FOUND, "stellar.toml not configured for this domain")
+        return toml_bytes
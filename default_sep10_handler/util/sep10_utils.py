@@ -2,7 +2,13 @@ from stellar_sdk.client.requests_client import RequestsClient
 from stellar_sdk.sep.stellar_toml import fetch_stellar_toml
 from anchor_sdk.exceptions import Sep10AuthError
 from stellar_sdk import Keypair, Network, ManageData, MuxedAccount, Server
-from stellar_sdk.exceptions import Ed25519PublicKeyInvalidError, NotFoundError
+from stellar_sdk.exceptions import (
+    Ed25519PublicKeyInvalidError,
+    NotFoundError,
+    ConnectionError,
+    BadResponseError,
+    UnknownRequestError
+)
 from stellar_sdk.sep.exceptions import InvalidSep10ChallengeError
 from stellar_sdk.sep.stellar_web_authentication import (
     build_challenge_transaction,
@@ -11,11 +17,13 @@ from stellar_sdk.sep.stellar_web_authentication import (
     verify_challenge_transaction_signed_by_client_master_key,
 )
 import jwt
+from anchor_sdk.default_sep10_handler.jwt_keys import JwtKeySet
+from anchor_sdk.default_sep10_handler.outbound import DeadlineRequestsClient
 
-def get_client_signing_key(client_domain):
+def get_client_signing_key(client_domain, client : RequestsClient = None):
     client_toml_contents = fetch_stellar_toml(
         client_domain,
-        client=RequestsClient(
+        client=client if client is not None else DeadlineRequestsClient(
             request_timeout=3
         ),
     )
@@ -61,9 +69,13 @@ def validate_challenge_xdr(
         web_auth_domain : str,
         network_passphrase : str = Network.TESTNET_NETWORK_PASSPHRASE,
         home_domains : list[str] = [],
-        server : Server = Server("https://horizon-testnet.stellar.org")
+        server : Server = None,
+        server_account_public_key : str | None = None
     ):
-    server_account_public_key = Keypair.from_secret(server_account_secret).public_key
+    if server is None:
+        server = Server("https://horizon-testnet.stellar.org")
+    if server_account_public_key is None:
+        server_account_public_key = Keypair.from_secret(server_account_secret).public_key
     try:
         challenge = read_challenge_transaction(
             challenge_transaction=envelope_xdr,
@@ -113,6 +125,8 @@ def validate_challenge_xdr(
             raise Sep10AuthError(f"Missing or invalid signature(s) for {challenge.client_account_id}: {str(e)}")
         else:
             return client_domain
+    except (ConnectionError, BadResponseError, UnknownRequestError):
+        raise Sep10AuthError(f"Unable to load account '{stellar_account}', try again later")
 
     signers = account.load_ed25519_public_key_signers()
     threshold = account.thresholds.med_threshold
@@ -140,13 +154,19 @@ def generate_jwt(
         network_passphrase : str = Network.TESTNET_NETWORK_PASSPHRASE,
         client_domain: str | None = None,
         home_domains : list[str] = [],
+        server_account_public_key : str | None = None,
+        jwt_keys : JwtKeySet | None = None
     ) -> str:
     """
     Generates the JSON web token from the challenge transaction XDR.
 
+    The token is signed with the current key of `jwt_keys` when given, otherwise with
+    HS256 and `jwt_secret_key`.
+
     See: https://github.com/stellar/stellar-protocol/blob/master/ecosystem/sep-0010.md#token
     """
-    server_account_public_key = Keypair.from_secret(server_account_secret).public_key
+    if server_account_public_key is None:
+        server_account_public_key = Keypair.from_secret(server_account_secret).public_key
 
     challenge = read_challenge_transaction(
         challenge_transaction=envelope_xdr,
@@ -175,4 +195,6 @@ def generate_jwt(
         "jti": challenge.transaction.hash().hex(),
         "client_domain": client_domain,
     }
+    if jwt_keys is not None:
+        return jwt_keys.sign(jwt_dict)
     return jwt.encode(jwt_dict, jwt_secret_key, algorithm="HS256")
@@ -158,6 +158,28 @@ class Sep6TransferError(AnchorSdkException):
         self.status_code = status_code
         self.error_message = error_message
 
+class Sep38QuoteError(AnchorSdkException):
+    """
+    Exception raised for errors related to SEP-38 prices and quotes.
+
+    Inherits from AnchorSdkException.
+
+    Attributes:
+        status_code (int): HTTP status code specific to the quote error.
+        error_message (str): Detailed message about the quote error.
+    """
+
+    def __init__(self, status_code: int, error_message: str):
+        """
+        Initialize the Sep38QuoteError with a status code and an error message.
+
+        Args:
+            status_code (int): HTTP status code for the quote error.
+            error_message (str): Detailed message about the quote error.
+        """
+        self.status_code = status_code
+        self.error_message = error_message
+
 class Sep9FieldsError(AnchorSdkException):
     def __init__(self, field_name : str):
         self.status_code = status.HTTP_400_BAD_REQUEST
@@ -172,3 +194,27 @@ class Sep9InvalidType(AnchorSdkException):
     def __init__(self, type : str):
         self.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         self.error_message = f"'{type}' is not a valid SEP-9 datatype."
+
+class ServiceOverloaded(AnchorSdkException):
+    """
+    Exception raised when admission control sheds a request.
+
+    Attributes:
+        status_code (int): Always 503.
+        error_message (str): Detailed message about the shed request.
+        retry_after (int): Seconds the client should wait before retrying.
+    """
+
+    def __init__(self, error_message: str, retry_after: int = 1):
+        self.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        self.error_message = error_message
+        self.retry_after = retry_after
+
+    def default_exception_anchor_response(self) -> JSONResponse:
+        return JSONResponse(
+            content = {
+                "error" : self.error_message,
+            },
+            status_code = self.status_code,
+            headers = {"Retry-After": str(self.retry_after)}
+        )
@@ -0,0 +1,133 @@
+import json
+import os
+from types import MappingProxyType
+from typing import Mapping
+
+class LocalizedMessages:
+    """
+    The frozen messages of one language, with its fallback chain already applied.
+
+    Attributes:
+        lang (str): The language code these messages were resolved for.
+        messages (Mapping[str, str]): Every message by dotted key, e.g. "sep9.first_name.description".
+        field_descriptions (Mapping[str, str]): SEP-9 field descriptions by field name.
+        status_messages (Mapping[str, str]): SEP-12 customer status messages by status.
+    """
+    __slots__ = ("lang", "messages", "field_descriptions", "status_messages")
+
+    def __init__(self, lang: str, messages: dict[str, str]):
+        self.lang = lang
+        self.messages = MappingProxyType(messages)
+        self.field_descriptions = MappingProxyType(self._section(messages, "sep9.", ".description"))
+        self.status_messages = MappingProxyType(self._section(messages, "sep12.status.", ""))
+
+    @staticmethod
+    def _section(messages: dict[str, str], prefix: str, suffix: str) -> dict[str, str]:
+        section = {}
+        for key, message in messages.items():
+            if key.startswith(prefix) and key.endswith(suffix):
+                name = key[len(prefix):len(key) - len(suffix)] if suffix else key[len(prefix):]
+                section[name] = message
+        return section
+
+    def get(self, key: str, default: str = None) -> str:
+        return self.messages.get(key, default)
+
+
+class MessageCatalog:
+    """
+    Translations for SEP-9 field descriptions, SEP-12 status messages and SEP-6 `/info`
+    texts, frozen into one dictionary per language at startup.
+
+    Each language is resolved through its fallback chain once (e.g. "pt-BR" -> "pt" -> "en"),
+    so a request only performs a dictionary lookup for its language and then for each key.
+
+    Messages are keyed by dotted names and may be given nested:
+        {"sep9": {"first_name": {"description": "Nome"}}, "sep12": {"status": {"NEEDS_INFO": "..."}}}
+    is equivalent to
+        {"sep9.first_name.description": "Nome", "sep12.status.NEEDS_INFO": "..."}
+
+    Attributes:
+        default_lang (str): Language used when the requested one is unknown.
+        languages (frozenset[str]): Languages with a frozen message set.
+
+    Args:
+        translations (dict[str, dict]): Messages per language code.
+        default_lang (str, optional): The default language. Defaults to "en".
+        fallbacks (dict[str, list[str]], optional): Explicit fallback chains per language.
+            By default a regional language falls back to its base language, then to `default_lang`.
+    """
+
+    def __init__(self, translations: dict[str, dict], default_lang: str = "en", fallbacks: dict[str, list[str]] = None):
+        self.default_lang = self._normalize(default_lang)
+        catalogs = {
+            self._normalize(lang): self._flatten(messages)
+            for lang, messages in translations.items()
+        }
+        fallbacks = {
+            self._normalize(lang): [self._normalize(fallback) for fallback in chain]
+            for lang, chain in (fallbacks or {}).items()
+        }
+
+        frozen = {}
+        for lang in set(catalogs) | {self.default_lang}:
+            chain = [lang] + fallbacks.get(lang, self._default_chain(lang))
+            messages = {}
+            for fallback in reversed(chain):
+                messages.update(catalogs.get(fallback, {}))
+            frozen[lang] = LocalizedMessages(lang, messages)
+
+        self._frozen = frozen
+        self.languages = frozenset(frozen)
+
+    @classmethod
+    def from_directory(cls, path: str, default_lang: str = "en", fallbacks: dict[str, list[str]] = None) -> "MessageCatalog":
+        """
+        Loads one `<lang>.json` file per language from `path`.
+        """
+        translations = {}
+        for file_name in sorted(os.listdir(path)):
+            lang, extension = os.path.splitext(file_name)
+            if extension != ".json":
+                continue
+            with open(os.path.join(path, file_name), encoding="utf-8") as file:
+                translations[lang] = json.load(file)
+        return cls(translations, default_lang, fallbacks)
+
+    def messages(self, lang: str = None) -> LocalizedMessages:
+        """
+        Returns the frozen messages for `lang`, falling back to its base language and then
+        to the default language when it has no translations.
+        """
+        if lang:
+            frozen = self._frozen.get(lang)
+            if frozen is not None:
+                return frozen
+            normalized = self._normalize(lang)
+            frozen = self._frozen.get(normalized) or self._frozen.get(normalized.split("-", 1)[0])
+            if frozen is not None:
+                return frozen
+        return self._frozen[self.default_lang]
+
+    def _default_chain(self, lang: str) -> list[str]:
+        chain = []
+        base = lang.split("-", 1)[0]
+        if base != lang:
+            chain.append(base)
+        if self.default_lang not in chain and self.default_lang != lang:
+            chain.append(self.default_lang)
+        return chain
+
+    @staticmethod
+    def _normalize(lang: str) -> str:
+        return lang.replace("_", "-").lower()
+
+    @classmethod
+    def _flatten(cls, messages: Mapping, prefix: str = "") -> dict[str, str]:
+        flat = {}
+        for key, value in messages.items():
+            if isinstance(value, Mapping):
+                flat.update(cls._flatten(value, f"{prefix}{key}."))
+            else:
+                flat[f"{prefix}{key}"] = value
+        return flat
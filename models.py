@@ -1,4 +1,4 @@
-from anchor_sdk.exceptions import Sep9InvalidFieldResponded
+from anchor_sdk.exceptions import Sep9InvalidFieldResponded, Sep9InvalidType
 from anchor_sdk import SEP9_FIELDS, SEP9_VERIFICATION_FIELDS
 
 class AnchorUser:
@@ -27,24 +27,27 @@ class Sep12KycField:
     Attributes:
         field_name (str): The name of the KYC field.
         description (str): A description of the KYC field.
-        value (str, optional): The value submitted by the user for this field. Defaults to None.
+        value (str | BlobHandle, optional): The value submitted by the user for this field. Binary fields
+            reference a `BlobHandle` of the blob store instead of carrying bytes. Defaults to None.
         is_accepted (bool, optional): Whether the field has been accepted. Defaults to False.
         is_processing (bool, optional): Whether the field is currently being processed. Defaults to False.
         is_rejected (bool, optional): Whether the field has been rejected. Defaults to False.
         requires_verification (bool, optional): Whether the field requires verification. Defaults to False.
         type (str, optional): The type of the field (e.g., "string"). Defaults to "string".
         choices (list[str], optional): A list of choices for the field, if applicable. Defaults to an empty list.
+        optional (bool, optional): Whether the customer may omit the field. Defaults to False.
 
     Args:
         field_name (str): The name of the field.
         description (str): The description of the field.
-        value (str, optional): The value of the field. Defaults to None.
+        value (str | BlobHandle, optional): The value of the field, or a blob handle for binary fields. Defaults to None.
         is_accepted (bool, optional): Flag indicating if the field is accepted. Defaults to False.
         is_processing (bool, optional): Flag indicating if the field is under processing. Defaults to False.
         is_rejected (bool, optional): Flag indicating if the field is rejected. Defaults to False.
         requires_verification (bool, optional): Flag indicating if the field requires verification. Defaults to False.
         type (str, optional): The data type of the field. Defaults to "string".
         choices (list[str], optional): Possible choices for the field. Defaults to [].
+        optional (bool, optional): Flag indicating if the field may be omitted. Defaults to False.
     """
     def __init__(
         self, 
@@ -56,13 +59,14 @@ class Sep12KycField:
         is_rejected: bool = False,
         requires_verification: bool = False,
         type: str = "string",
-        choices: list[str] = []
+        choices: list[str] = [],
+        optional: bool = False
     ):  
         if not field_name in SEP9_FIELDS and not field_name in SEP9_VERIFICATION_FIELDS:
             raise Sep9InvalidFieldResponded(field_name)
         
         if not type in ["string", "bytes"]:
-            raise S
+            raise Sep9InvalidType(type)
 
         self.field_name = field_name
         self.description = description
@@ -73,4 +77,76 @@ class Sep12KycField:
         self.requires_verification = requires_verification
         self.type = type
         self.choices = choices
-    
\ No newline at end of file
+        self.optional = optional
+    
+class FieldStatusUpdate:
+    """
+    A status transition of one SEP-12 field, applied by back-office tooling.
+
+    Attributes:
+        field_name (str): The name of the KYC field.
+        status (str): The new status: "ACCEPTED", "REJECTED", "PROCESSING" or "VERIFICATION_REQUIRED".
+        error (str, optional): Why the field was rejected, shown to the customer. Defaults to None.
+
+    Args:
+        field_name (str): The name of the field.
+        status (str): The new status of the field.
+        error (str, optional): The rejection reason. Defaults to None.
+    """
+    STATUSES = ("ACCEPTED", "REJECTED", "PROCESSING", "VERIFICATION_REQUIRED")
+
+    def __init__(self, field_name: str, status: str, error: str = None):
+        if not field_name in SEP9_FIELDS and not field_name in SEP9_VERIFICATION_FIELDS:
+            raise Sep9InvalidFieldResponded(field_name)
+        if not status in self.STATUSES:
+            raise ValueError(f"Invalid field status '{status}'")
+
+        self.field_name = field_name
+        self.status = status
+        self.error = error
+
+    def apply_to(self, field: Sep12KycField) -> Sep12KycField:
+        """
+        Sets the status flags of `field` to this transition's status.
+        """
+        field.is_accepted = self.status == "ACCEPTED"
+        field.is_rejected = self.status == "REJECTED"
+        field.is_processing = self.status == "PROCESSING"
+        field.requires_verification = self.status == "VERIFICATION_REQUIRED"
+        return field
+
+class CustomerStatusChange:
+    """
+    The SEP-12 status of a customer after a batch of field status transitions.
+
+    Attributes:
+        user (AnchorUser): The customer.
+        customer_id (str): The customer UUID.
+        status (str): The recomputed customer status, e.g. "ACCEPTED" or "NEEDS_INFO".
+    """
+    __slots__ = ("user", "customer_id", "status")
+
+    def __init__(self, user: AnchorUser, customer_id: str, status: str):
+        self.user = user
+        self.customer_id = customer_id
+        self.status = status
+
+class TokenIntrospection:
+    """
+    The result of verifying one SEP-10 JWT.
+
+    Attributes:
+        active (bool): Whether the token is valid, unexpired and not revoked.
+        user (AnchorUser): The authenticated user, for active tokens.
+        jti (str): The token id, if the token could be decoded.
+        exp (int): The expiry UNIX timestamp, if the token could be decoded.
+        error (str): Why the token is not active.
+    """
+    __slots__ = ("active", "user", "jti", "exp", "error")
+
+    def __init__(self, active: bool, user: AnchorUser = None, jti: str = None, exp: int = None, error: str = None):
+        self.active = active
+        self.user = user
+        self.jti = jti
+        self.exp = exp
+        self.error = error
@@ -0,0 +1,41 @@
+from fastapi import APIRouter
+from anchor_sdk.default_sep10_handler.jwt_keys import JwtKeySet
+from anchor_sdk.sep_serializations.encoders import PreEncodedJSONResponse
+
+class JwksEndpoints:
+    """
+    Publishes the public keys SEP-10 JWTs are signed with at `/.well-known/jwks.json`.
+
+    Downstream services fetch this document (e.g. into `JwtKeySet.from_jwks`) and verify
+    tokens locally instead of calling back into the anchor. The encoded document is
+    cached by the key set and only rebuilt after a rotation.
+
+    Attributes:
+        key_set (JwtKeySet): The anchor's JWT keys.
+        router (APIRouter): FastAPI router object to which API routes are added.
+        max_age (int): Seconds clients may cache the document.
+
+    Args:
+        router (APIRouter): FastAPI router object for route registration.
+        key_set (JwtKeySet): The anchor's JWT keys.
+        max_age (int, optional): `Cache-Control` max-age in seconds. Defaults to 300.
+    """
+
+    def __init__(self, router: APIRouter, key_set: JwtKeySet, max_age: int = 300):
+        self.router = router
+        self.key_set = key_set
+        self.max_age = max_age
+
+        self.router.add_api_route(
+            "/.well-known/jwks.json",
+            self.jwks,
+            methods=["GET"],
+            response_class=PreEncodedJSONResponse,
+            description="Public keys of the SEP-10 JWT signing keys"
+        )
+
+    async def jwks(self) -> PreEncodedJSONResponse:
+        return PreEncodedJSONResponse(
+            self.key_set.jwks_json(),
+            headers={"Cache-Control": f"public, max-age={self.max_age}"}
+        )
@@ -0,0 +1,116 @@
+import hmac
+import re
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+from anchor_sdk.exceptions import AnchorSdkException
+from anchor_sdk.sep_services.profiling import RouteProfile, RouteProfiler
+
+class ProfilerEndpoints:
+    """
+    Admin API listing and downloading the profiles collected by a `RouteProfiler`.
+
+    The router is meant to be mounted on an internal-only listener or path; requests must
+    also carry `Authorization: Bearer <admin_token>`.
+
+    Routes are identified by the `route` query parameter, e.g. `?route=POST /auth`:
+
+    - `GET /admin/profiles` lists the profiled routes with their sample counts and timings;
+    - `GET /admin/profiles/pstats` downloads a route's profile for `pstats`, snakeviz or gprof2dot;
+    - `GET /admin/profiles/collapsed` downloads its collapsed stacks for flame graph tools;
+    - `DELETE /admin/profiles` discards a route's profile, or every profile without `route`.
+
+    Attributes:
+        router (APIRouter): FastAPI router object to which API routes are added.
+        profiler (RouteProfiler): The profiler whose results are served.
+
+    Args:
+        router (APIRouter): FastAPI router object for route registration.
+        profiler (RouteProfiler): The profiler whose results are served.
+        admin_token (str): Shared secret expected as bearer token.
+    """
+
+    def __init__(self, router: APIRouter, profiler: RouteProfiler, admin_token: str):
+        self.router = router
+        self.profiler = profiler
+        self._admin_token = admin_token.encode()
+
+        self.router.add_api_route(
+            "/admin/profiles",
+            self.list_profiles,
+            methods=["GET"],
+            response_class=JSONResponse,
+            description="List the profiled routes"
+        )
+        self.router.add_api_route(
+            "/admin/profiles/pstats",
+            self.download_pstats,
+            methods=["GET"],
+            response_class=Response,
+            description="Download the cProfile statistics of a route"
+        )
+        self.router.add_api_route(
+            "/admin/profiles/collapsed",
+            self.download_collapsed_stacks,
+            methods=["GET"],
+            response_class=PlainTextResponse,
+            description="Download the collapsed stacks of a route for flame graphs"
+        )
+        self.router.add_api_route(
+            "/admin/profiles",
+            self.reset_profiles,
+            methods=["DELETE"],
+            response_class=JSONResponse,
+            description="Discard collected profiles"
+        )
+
+    def list_profiles(self, request: Request) -> JSONResponse:
+        self._authorize(request)
+        return JSONResponse({
+            "profiles": [
+                {
+                    "route": route,
+                    "samples": profile.samples,
+                    "total_time": profile.total_time,
+                    "mean_time": profile.total_time / profile.samples if profile.samples else 0.0,
+                    "sample_rate": self.profiler.rate(route),
+                }
+                for route, profile in sorted(self.profiler.profiles().items())
+            ]
+        })
+
+    def download_pstats(self, request: Request, route: str) -> Response:
+        self._authorize(request)
+        profile = self._profile(route)
+        return Response(
+            profile.pstats_bytes(),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{self._file_name(route)}.pstats"'}
+        )
+
+    def download_collapsed_stacks(self, request: Request, route: str) -> PlainTextResponse:
+        self._authorize(request)
+        profile = self._profile(route)
+        return PlainTextResponse(
+            profile.collapsed_stacks(),
+            headers={"Content-Disposition": f'attachment; filename="{self._file_name(route)}.collapsed"'}
+        )
+
+    def reset_profiles(self, request: Request, route: str = None) -> JSONResponse:
+        self._authorize(request)
+        self.profiler.reset(route)
+        return JSONResponse({"reset": route if route is not None else "all"})
+
+    def _authorize(self, request: Request):
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), self._admin_token):
+            raise AnchorSdkException(401, "Invalid admin token")
+
+    def _profile(self, route: str) -> RouteProfile:
+        profile = self.profiler.get(route)
+        if profile is None:
+            raise AnchorSdkException(404, f"No profile for route '{route}'")
+        return profile
+
+    @staticmethod
+    def _file_name(route: str) -> str:
+        return re.sub(r"[^A-Za-z0-9_.-]+", "_", route).strip("_")
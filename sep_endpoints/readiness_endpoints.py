@@ -0,0 +1,33 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from anchor_sdk.sep_services.warmup import WarmUp
+
+class ReadinessEndpoints:
+    """
+    Exposes `GET /ready` for readiness probes, answering 503 until the warm-up has completed.
+
+    Attributes:
+        router (APIRouter): Router the route is added to.
+        warm_up (WarmUp): The application's warm-up.
+
+    Args:
+        router (APIRouter): Router the route is added to.
+        warm_up (WarmUp): The application's warm-up.
+    """
+
+    def __init__(self, router: APIRouter, warm_up: WarmUp):
+        self.router = router
+        self.warm_up = warm_up
+
+        self.router.add_api_route(
+            "/ready",
+            self.ready,
+            methods=['GET'],
+            response_class=JSONResponse,
+            description="Report whether the application finished warming up"
+        )
+
+    def ready(self) -> JSONResponse:
+        if not self.warm_up.is_ready:
+            return JSONResponse({"status": "warming_up"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return JSONResponse({"status": "ready", "failures": self.warm_up.failures})
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends
+import hmac
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
-from anchor_sdk.models import AnchorUser
+from anchor_sdk.models import AnchorUser, TokenIntrospection
+from anchor_sdk.exceptions import AnchorSdkException, Sep10AuthError
 from anchor_sdk.sep_serializations.sep10_serializations import (
     ChallengeRequest,
     ChallengeResponse,
     TokenRequest,
-    TokenResponse
+    TokenResponse,
+    IntrospectRequest,
+    IntrospectResponse,
+    TokenIntrospectionResult,
 )
+from anchor_sdk.sep_serializations.encoders import PreEncodedJSONResponse, dump_json
 
 class Sep10Endpoints:
     """
@@ -20,22 +26,42 @@ class Sep10Endpoints:
     Attributes:
         handler (Sep10Handler): Handler for SEP-10 operations.
         router (APIRouter): FastAPI router object for adding API routes.
+        fast_responses (bool): Whether responses are pre-encoded instead of validated by FastAPI.
+        max_introspection_batch (int): Maximum number of tokens per introspection request.
 
     Args:
         handler (Sep10Handler): A handler instance responsible for SEP-10 logic.
         router (APIRouter): A router instance for setting up API routes.
+        fast_responses (bool, optional): Enable the pre-encoded response path. Defaults to False.
+        introspection_secret (str, optional): Enables `POST /introspect` for back-end services. Defaults to None.
+        max_introspection_batch (int, optional): Maximum tokens per introspection request. Defaults to 1000.
     """
 
-    def __init__(self, handler: Sep10Handler, router: APIRouter):
+    def __init__(
+        self,
+        handler: Sep10Handler,
+        router: APIRouter,
+        fast_responses: bool = False,
+        introspection_secret: str = None,
+        max_introspection_batch: int = 1000
+    ):
         """
         Constructs a `Sep10Endpoints` instance with specified handler and router.
 
         Args:
             handler (Sep10Handler): The handler responsible for SEP-10 logic.
             router (APIRouter): The router for adding API endpoints.
+            fast_responses (bool, optional): Return pre-encoded JSON built from trusted handler
+                output, skipping FastAPI's response validation. Defaults to False.
+            introspection_secret (str, optional): Shared secret back-end services send as bearer
+                token to `POST /introspect`. The route is only registered when set. Defaults to None.
+            max_introspection_batch (int, optional): Maximum tokens per introspection request. Defaults to 1000.
         """
         self.handler = handler
         self.router = router
+        self.fast_responses = fast_responses
+        self.max_introspection_batch = max_introspection_batch
+        self._introspection_secret = introspection_secret.encode() if introspection_secret else None
 
         self.router.add_api_route(
             "", 
@@ -53,6 +79,15 @@ class Sep10Endpoints:
             description="Submit a SEP-10 challenge transaction for authentication JWT"
         )
 
+        if self._introspection_secret is not None:
+            self.router.add_api_route(
+                "/introspect",
+                self.introspect_tokens,
+                methods=['POST'],
+                response_class=JSONResponse,
+                description="Verify a batch of SEP-10 JWTs for back-end services"
+            )
+
     def create_challenge_transaction(self, transaction_request: ChallengeRequest = Depends()) -> ChallengeResponse:
         """
         Endpoint to create a SEP-10 challenge transaction.
@@ -74,6 +109,12 @@ class Sep10Endpoints:
 
         transaction, network_passphrase = self.handler.create_challenge_transaction(user)
 
+        if self.fast_responses:
+            return PreEncodedJSONResponse(dump_json(ChallengeResponse.model_construct(
+                transaction=transaction,
+                network_passphrase=network_passphrase
+            )))
+
         return ChallengeResponse(
             transaction=transaction,
             network_passphrase=network_passphrase
@@ -96,6 +137,48 @@ class Sep10Endpoints:
             envelope_xdr=token_request.transaction
         )
 
+        if self.fast_responses:
+            return PreEncodedJSONResponse(dump_json(TokenResponse.model_construct(token=token)))
+
         return TokenResponse(
             token=token
         )
+
+    def introspect_tokens(self, request: Request, introspect_request: IntrospectRequest) -> IntrospectResponse:
+        """
+        Internal endpoint verifying a batch of SEP-10 JWTs in one round trip.
+
+        Requires `Authorization: Bearer <introspection_secret>`; wallet tokens are not accepted.
+
+        Args:
+            request (Request): The FastAPI request object.
+            introspect_request (IntrospectRequest): The tokens to verify.
+
+        Returns:
+            IntrospectResponse: One result per token, in request order.
+        """
+        scheme, _, secret = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(secret.encode(), self._introspection_secret):
+            raise Sep10AuthError("Invalid introspection credentials")
+        if len(introspect_request.tokens) > self.max_introspection_batch:
+            raise AnchorSdkException(413, f"At most {self.max_introspection_batch} tokens can be introspected at once")
+
+        results = self.handler.introspect_tokens(introspect_request.tokens, introspect_request.check_revoked)
+        response = {"results": [self._introspection_result(result) for result in results]}
+
+        if self.fast_responses:
+            return PreEncodedJSONResponse(dump_json(response))
+        return IntrospectResponse(**response)
+
+    @staticmethod
+    def _introspection_result(result: TokenIntrospection) -> dict:
+        introspection = {"active": result.active}
+        if result.user is not None:
+            introspection["account"] = result.user.account_id
+            introspection["memo"] = str(result.user.memo_id) if result.user.memo_id else None
+            introspection["client_domain"] = result.user.client_domain
+        for name in ("jti", "exp", "error"):
+            value = getattr(result, name)
+            if value is not None:
+                introspection[name] = value
+        return introspection
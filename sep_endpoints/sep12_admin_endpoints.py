@@ -0,0 +1,115 @@
+import hmac
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from anchor_sdk.exceptions import Sep12KycError, Sep9InvalidFieldResponded
+from anchor_sdk.models import AnchorUser, FieldStatusUpdate, CustomerStatusChange
+from anchor_sdk.sep_handlers.sep12_handler import AsyncSep12Handler
+from anchor_sdk.sep_services.sep12_admin import Sep12StatusService
+from anchor_sdk.sep_serializations.sep12_serializations import (
+    BulkStatusUpdateRequest,
+    BulkStatusUpdateResponse,
+    CustomerStatusInfo,
+)
+
+class Sep12AdminEndpoints:
+    """
+    Optional back-office API for bulk SEP-12 field status updates.
+
+    The router is meant to be mounted on an internal-only listener or path; requests must
+    also carry `Authorization: Bearer <admin_token>`. SEP-10 tokens are not accepted.
+
+    Attributes:
+        router (APIRouter): FastAPI router object to which API routes are added.
+        service (Sep12StatusService): Service applying the transitions.
+
+    Methods:
+        update_statuses(self, request: Request, update_request: BulkStatusUpdateRequest) -> BulkStatusUpdateResponse:
+            Applies field status transitions to many customers and returns their new status.
+    """
+
+    def __init__(self, router: APIRouter, service: Sep12StatusService, admin_token: str):
+        """
+        Initializes the admin endpoints.
+
+        Args:
+            router (APIRouter): FastAPI router object for route registration.
+            service (Sep12StatusService): Service applying the transitions.
+            admin_token (str): Shared secret expected as bearer token.
+        """
+        self.router = router
+        self.service = service
+        self._admin_token = admin_token.encode()
+
+        self.router.add_api_route(
+            "/admin/sep12/customers/status",
+            (
+                self.update_statuses_async
+                if isinstance(service.handler, AsyncSep12Handler) else
+                self.update_statuses
+            ),
+            methods=["POST"],
+            response_class=JSONResponse,
+            description="Apply SEP-12 field status transitions to many customers"
+        )
+
+    def update_statuses(self, request: Request, update_request: BulkStatusUpdateRequest) -> BulkStatusUpdateResponse:
+        """
+        Applies field status transitions to many customers and returns their new status.
+
+        Args:
+            request (Request): The FastAPI request object.
+            update_request (BulkStatusUpdateRequest): The transitions per customer.
+
+        Returns:
+            BulkStatusUpdateResponse: The recomputed status of each customer.
+        """
+        self._authorize(request)
+        return self._response(self.service.apply(self._updates(update_request)))
+
+    async def update_statuses_async(self, request: Request, update_request: BulkStatusUpdateRequest) -> BulkStatusUpdateResponse:
+        """
+        Applies field status transitions with an `AsyncSep12Handler`.
+
+        Args:
+            request (Request): The FastAPI request object.
+            update_request (BulkStatusUpdateRequest): The transitions per customer.
+
+        Returns:
+            BulkStatusUpdateResponse: The recomputed status of each customer.
+        """
+        self._authorize(request)
+        return self._response(await self.service.apply_async(self._updates(update_request)))
+
+    def _authorize(self, request: Request):
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), self._admin_token):
+            raise Sep12KycError(401, "Invalid admin token")
+
+    @staticmethod
+    def _updates(update_request: BulkStatusUpdateRequest) -> list:
+        updates = []
+        for customer in update_request.customers:
+            field_updates = []
+            for field_name, field in customer.fields.items():
+                try:
+                    field_updates.append(FieldStatusUpdate(field_name, field.status, field.error))
+                except Sep9InvalidFieldResponded:
+                    raise Sep12KycError(400, f"'{field_name}' is not a valid SEP-9 field")
+            try:
+                memo_id = int(customer.memo or 0)
+            except ValueError:
+                raise Sep12KycError(400, f"Invalid memo for customer '{customer.account}'")
+            updates.append((AnchorUser(customer.account, memo_id), field_updates))
+        return updates
+
+    @staticmethod
+    def _response(changes: list[CustomerStatusChange]) -> BulkStatusUpdateResponse:
+        return BulkStatusUpdateResponse(customers=[
+            CustomerStatusInfo(
+                account=change.user.account_id,
+                memo=str(change.user.memo_id),
+                id=change.customer_id,
+                status=change.status
+            )
+            for change in changes
+        ])
@@ -1,6 +1,8 @@
-from fastapi.responses import JSONResponse
+import time
+from fastapi.responses import JSONResponse, Response
 from fastapi import APIRouter, Request, Depends
-from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from fastapi.concurrency import run_in_threadpool
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler, AsyncSep12Handler
 from anchor_sdk.sep_serializations.sep12_serializations import (
     CustomerGetRequest,
     CustomerGetResponse,
@@ -8,11 +10,21 @@ from anchor_sdk.sep_serializations.sep12_serializations import (
     CustomerPutRequestParams,
     CustomerPutResponse,
     CustomerCallbackPutRequest,
+    CustomerDeleteRequest,
 )
-from anchor_sdk.exceptions import Sep9FieldsError
-from anchor_sdk.models import Sep12KycField
+from anchor_sdk.sep_serializations.sep12_schemas import Sep12SchemaRegistry
+from anchor_sdk.i18n import MessageCatalog
+from anchor_sdk.sep_services.sep12_cache import CustomerResponseCache, CachedCustomerResponse
+from anchor_sdk.sep_services.single_flight import SingleFlight, coalesce
+from anchor_sdk.sep_services.sep12_jobs import KycProcessor
+from anchor_sdk.sep_services.blob_store import BlobStore, store_binary_fields
+from anchor_sdk.sep_services.sep12_idempotency import SubmissionIndex, fingerprint_fields
+from anchor_sdk.sep_services.sep12_purge import CustomerPurgeWorker
+from anchor_sdk.exceptions import Sep9FieldsError, Sep12KycError
+from anchor_sdk.models import AnchorUser, Sep12KycField
 from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
-from anchor_sdk.util import sep12_fields_to_json
+from anchor_sdk.util import sep12_fields_to_json, sep12_status_from_fields
+from anchor_sdk.sep_serializations.encoders import PreEncodedJSONResponse, dump_json
 from anchor_sdk import SEP9_ALL_FIELDS
 class Sep12Endpoints:
     """
@@ -25,9 +37,19 @@ class Sep12Endpoints:
         handler (Sep12Handler): The handler for SEP-12 operations.
         router (APIRouter): FastAPI router object to which API routes are added.
         auth_handler (Sep10Handler): The handler for SEP-10 authentication.
+        fast_responses (bool): Whether responses are pre-encoded instead of validated by FastAPI.
+        schemas (Sep12SchemaRegistry): Compiled customer type declarations of the handler.
+        catalog (MessageCatalog): Translations used to localize field descriptions and status messages.
+        response_cache (CustomerResponseCache): Cache of encoded `GET /customer` responses.
+        single_flight (SingleFlight): Group coalescing concurrent identical `fetch_required_fields` calls.
+        kyc_processor (KycProcessor): Background processor of submitted fields.
+        blob_store (BlobStore): Store receiving the binary fields of submissions.
+        submission_index (SubmissionIndex): Recent submissions used to answer resent `PUT /customer` requests.
+        purge_worker (CustomerPurgeWorker): Background worker deleting customers.
+        is_async (bool): Whether the handler is an `AsyncSep12Handler` and routes await it.
 
     Methods:
-        __init__(self, router: APIRouter, handler: Sep12Handler, auth_handler: Sep10Handler):
+        __init__(self, router: APIRouter, handler: Sep12Handler, auth_handler: Sep10Handler, fast_responses: bool = False):
             Initializes the SEP-12 endpoints with a router, SEP-12 handler, and SEP-10 authentication handler.
         fetch_required_fields(self, request: Request, fields_request: CustomerGetRequest = Depends()) -> CustomerGetResponse:
             Fetches the required KYC fields for a customer.
@@ -35,24 +57,90 @@ class Sep12Endpoints:
             Handles the submission of new or updated customer fields.
         register_callback(self, request: Request, callback_submission: CustomerCallbackPutRequest) -> dict:
             Registers callback URLs for receiving webhooks related to customer data.
+        delete_customer(self, request: Request, account: str, delete_request: CustomerDeleteRequest = None) -> Response:
+            Deletes, or queues the deletion of, all data of the authenticated customer.
+        fetch_required_fields_async, put_customer_fields_async, register_callback_async, delete_customer_async:
+            Coroutine variants registered instead when the handler is an `AsyncSep12Handler`.
     """
-    def __init__(self, router: APIRouter, handler: Sep12Handler, auth_handler: Sep10Handler):
+    def __init__(
+        self,
+        router: APIRouter,
+        handler: Sep12Handler,
+        auth_handler: Sep10Handler,
+        fast_responses: bool = False,
+        catalog: MessageCatalog = None,
+        response_cache: CustomerResponseCache = None,
+        single_flight: SingleFlight = None,
+        kyc_processor: KycProcessor = None,
+        blob_store: BlobStore = None,
+        submission_index: SubmissionIndex = None,
+        purge_worker: CustomerPurgeWorker = None,
+        delete_timeout: float = 30
+    ):
         """
         Initializes the SEP-12 endpoints.
 
         Args:
             router (APIRouter): FastAPI router object for route registration.
-            handler (Sep12Handler): Handler for SEP-12 operations.
-            auth_handler (Sep10Handler): Handler for SEP-10 authentication.
+            handler (Sep12Handler): Handler for SEP-12 operations. An `AsyncSep12Handler`
+                is awaited from `async def` routes instead of running in the threadpool.
+            auth_handler (Sep10Handler): Handler for SEP-10 authentication. Its `authenticated_route`
+                may block, so `async def` routes call it in the threadpool.
+            fast_responses (bool, optional): Return pre-encoded JSON built from trusted handler
+                output, skipping FastAPI's response validation. Defaults to False.
+            catalog (MessageCatalog, optional): Translations selected by the `lang` parameter. Defaults to None.
+            response_cache (CustomerResponseCache, optional): Cache `GET /customer` responses per
+                (account, memo, type, lang) and answer `If-None-Match` with 304. Defaults to None.
+            single_flight (SingleFlight, optional): Share one `handler.fetch_required_fields` execution
+                between concurrent requests for the same customer and type. Defaults to None.
+            kyc_processor (KycProcessor, optional): Answer `PUT /customer` once the handler's
+                `accept_submission` recorded the fields, and run `process_submitted_fields` in
+                the processor's background workers. Defaults to None.
+            blob_store (BlobStore, optional): Store binary fields (e.g. `photo_id_front`) before
+                calling the handler, which then receives `BlobHandle`s instead of bytes. Defaults to None.
+            submission_index (SubmissionIndex, optional): Answer exact duplicates of a customer's last
+                submission, and replays of an `Idempotency-Key`, with the previous customer id
+                without calling the handler. Defaults to None.
+            purge_worker (CustomerPurgeWorker, optional): Queue `DELETE /customer/{account}` requests
+                for batched background deletion instead of calling `delete_user_data` inline. The
+                worker also deletes the customers' jobs from `kyc_processor`'s queue. Defaults to None.
+            delete_timeout (float, optional): Without `purge_worker`, seconds an inline delete waits
+                for a submission of the customer that `kyc_processor` is applying before answering
+                409. Defaults to 30.
         """
         self.handler = handler
         self.router = router
         self.auth_handler = auth_handler
+        self.fast_responses = fast_responses
+        self.catalog = catalog
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.is_async = isinstance(handler, AsyncSep12Handler)
+        self.kyc_processor = kyc_processor
+        self.blob_store = blob_store
+        self.submission_index = submission_index
+        self.purge_worker = purge_worker
+        self.delete_timeout = delete_timeout
+        if purge_worker is not None:
+            purge_worker.add_listener(self.invalidate_customer)
+            if purge_worker.job_queue is None and kyc_processor is not None:
+                purge_worker.job_queue = kyc_processor.queue
+        if kyc_processor is not None:
+            kyc_processor.add_listener(self.invalidate_customer)
+        fetch_fields = self._fetch_fields_with_generation_async if self.is_async else self._fetch_fields_with_generation
+        # the generation is read inside the coalesced call, so callers joining a fetch that
+        # started before an invalidation store its result under the old generation
+        self._fetch_fields = (
+            coalesce(single_flight, fetch_fields, "Sep12Handler.fetch_required_fields")
+            if single_flight is not None else
+            fetch_fields
+        )
+        self.schemas = Sep12SchemaRegistry(handler.customer_types(), catalog)
 
         # Register API routes
         self.router.add_api_route(
             "/customer",
-            self.fetch_required_fields,
+            self.fetch_required_fields_async if self.is_async else self.fetch_required_fields,
             methods=['GET'],
             description="Get required fields for SEP12 KYC",
             response_class=JSONResponse,
@@ -60,7 +148,11 @@ class Sep12Endpoints:
         )
         self.router.add_api_route(
             "/customer",
-            self.put_customer_fields,
+            (
+                self.put_typed_customer_fields if self.schemas else
+                self.put_customer_fields_async if self.is_async else
+                self.put_customer_fields
+            ),
             methods=["PUT"],
             description="Handle submission for new fields",
             response_class=JSONResponse,
@@ -68,11 +160,18 @@ class Sep12Endpoints:
 
         self.router.add_api_route(
             "/customer/callback",
-            self.register_callback,
+            self.register_callback_async if self.is_async else self.register_callback,
             methods=['PUT'],
             description="Register callback URLs for webhooks",
         )
 
+        self.router.add_api_route(
+            "/customer/{account}",
+            self.delete_customer_async if self.is_async else self.delete_customer,
+            methods=['DELETE'],
+            description="Delete all data of a customer",
+        )
+
     def fetch_required_fields(self, request: Request, fields_request: CustomerGetRequest = Depends()) -> CustomerGetResponse:
         """
         Fetches the required KYC fields for a customer.
@@ -85,24 +184,121 @@ class Sep12Endpoints:
             CustomerGetResponse: The response containing required KYC fields for the customer.
         """
         user = self.auth_handler.authenticated_route(request)
+        cached, messages, template = self._prepare_fetch(request, user, fields_request)
+        if cached is not None:
+            return cached
+
+        generation, result = (
+            self._fetch_fields(user, fields_request.type)
+            if fields_request.type is not None else
+            self._fetch_fields(user)
+        )
+
+        return self._fields_response(request, user, fields_request, result, generation, messages, template)
+
+    async def fetch_required_fields_async(self, request: Request, fields_request: CustomerGetRequest = Depends()) -> CustomerGetResponse:
+        """
+        Fetches the required KYC fields for a customer from an `AsyncSep12Handler`.
+
+        Args:
+            request (Request): The FastAPI request object.
+            fields_request (CustomerGetRequest, optional): Dependency that extracts customer get request parameters.
+
+        Returns:
+            CustomerGetResponse: The response containing required KYC fields for the customer.
+        """
+        user = await run_in_threadpool(self.auth_handler.authenticated_route, request)
+        cached, messages, template = self._prepare_fetch(request, user, fields_request)
+        if cached is not None:
+            return cached
 
-        id, message, fields = (
-            self.handler.fetch_required_fields(user, fields_request.type) 
+        generation, result = await (
+            self._fetch_fields(user, fields_request.type)
             if fields_request.type is not None else
-            self.handler.fetch_required_fields(user)
+            self._fetch_fields(user)
         )
 
-        fields, provided_fields = sep12_fields_to_json(fields)
+        return self._fields_response(request, user, fields_request, result, generation, messages, template)
+
+    def _prepare_fetch(self, request: Request, user, fields_request: CustomerGetRequest) -> tuple:
+        """
+        Returns a cached response if there is one, otherwise the localized messages and
+        the fields template to build the response with.
+        """
+        cache = self.response_cache
+        if cache is not None:
+            entry = cache.get(user.account_id, user.memo_id, fields_request.type, fields_request.lang)
+            if entry is not None:
+                return self._cached_response(request, entry), None, None
+
+        messages = self.catalog.messages(fields_request.lang) if self.catalog is not None else None
+
+        template = None
+        if self.schemas and fields_request.type is not None:
+            template = self.schemas.get(fields_request.type).template(messages)
+
+        return None, messages, template
+
+    def _fetch_generation(self, user) -> int:
+        if self.response_cache is None:
+            return None
+        return self.response_cache.generation(user.account_id, user.memo_id)
+
+    def _fetch_fields_with_generation(self, user, *type_argument) -> tuple:
+        """
+        Reads the response cache generation, then calls `handler.fetch_required_fields`.
+        """
+        generation = self._fetch_generation(user)
+        return generation, self.handler.fetch_required_fields(user, *type_argument)
+
+    async def _fetch_fields_with_generation_async(self, user, *type_argument) -> tuple:
+        generation = self._fetch_generation(user)
+        return generation, await self.handler.fetch_required_fields(user, *type_argument)
+
+    def _fields_response(
+        self,
+        request: Request,
+        user,
+        fields_request: CustomerGetRequest,
+        result: tuple,
+        generation: int,
+        messages,
+        template: dict
+    ):
+        id, message, fields = result
+
+        fields, provided_fields = sep12_fields_to_json(fields, template, messages)
+        status = self.get_status_from_fields(fields, provided_fields)
+        if message is None and messages is not None:
+            message = messages.status_messages.get(status)
         
         return_object =  {
             "id" : id,
-            "status" : self.get_status_from_fields(fields, provided_fields),
+            "status" : status,
             "message" : message,
         }
         
         if fields: return_object['fields'] = fields
         if provided_fields: return_object['provided_fields'] = provided_fields
 
+        cache = self.response_cache
+        if cache is not None:
+            body = dump_json({key: value for key, value in return_object.items() if value is not None})
+            entry = cache.put(
+                user.account_id,
+                user.memo_id,
+                fields_request.type,
+                fields_request.lang,
+                body,
+                generation
+            )
+            return self._cached_response(request, entry)
+
+        if self.fast_responses:
+            return PreEncodedJSONResponse(dump_json(
+                {key: value for key, value in return_object.items() if value is not None}
+            ))
+
         return return_object
 
     def put_customer_fields(self, request: Request, fields_submission: CustomerPutRequestBody, type : str = None) -> CustomerPutResponse:
@@ -117,24 +313,308 @@ class Sep12Endpoints:
             CustomerPutResponse: The response containing the ID of the updated customer.
         """
         user = self.auth_handler.authenticated_route(request)
-        fields = {}
-        for field, value in fields_submission:
-            if field in SEP9_ALL_FIELDS and value:
-                fields[field] = value
-        
-        user_id = (
-                self.handler.process_submitted_fields(
-                    user, 
-                    fields,
-                    type
-                ) 
+        fields = self._submitted_fields(fields_submission)
+        fingerprint, user_id = self._find_duplicate(request, user, type, fields)
+        if user_id is not None:
+            return self._put_response(user_id)
+
+        try:
+            user_id = self._submit_fields(user, fields, type)
+        except BaseException:
+            self._release_submission(request, user, type, fingerprint)
+            raise
+        self._invalidate_responses(user.account_id, user.memo_id)
+        self._record_submission(request, user, type, fingerprint, user_id)
+
+        return self._put_response(user_id)
+
+    async def put_customer_fields_async(self, request: Request, fields_submission: CustomerPutRequestBody, type : str = None) -> CustomerPutResponse:
+        """
+        Handles the submission of new or updated customer fields to an `AsyncSep12Handler`.
+
+        Args:
+            request (Request): The FastAPI request object.
+            fields_submission (CustomerPutRequest): The submitted customer fields.
+
+        Returns:
+            CustomerPutResponse: The response containing the ID of the updated customer.
+        """
+        user = await run_in_threadpool(self.auth_handler.authenticated_route, request)
+        fields = self._submitted_fields(fields_submission)
+        fingerprint, user_id = await self._find_duplicate_async(request, user, type, fields)
+        if user_id is not None:
+            return self._put_response(user_id)
+
+        try:
+            user_id = await self._submit_fields_async(user, fields, type)
+        except BaseException:
+            self._release_submission(request, user, type, fingerprint)
+            raise
+        self._invalidate_responses(user.account_id, user.memo_id)
+        self._record_submission(request, user, type, fingerprint, user_id)
+
+        return self._put_response(user_id)
+
+    def _find_duplicate(self, request : Request, user, type : str, fields : dict) -> tuple:
+        """
+        Returns the submission's fingerprint and, for a duplicate, the customer id it was answered with.
+
+        A submission that is not a duplicate is reserved until it is recorded or released,
+        and an identical one arriving meanwhile waits for its result.
+        """
+        if self.submission_index is None:
+            return None, None
+        fingerprint = fingerprint_fields(fields)
+        return fingerprint, self.submission_index.reserve(
+            user.account_id,
+            user.memo_id,
+            type,
+            fingerprint,
+            request.headers.get("idempotency-key")
+        )
+
+    async def _find_duplicate_async(self, request : Request, user, type : str, fields : dict) -> tuple:
+        if self.submission_index is None:
+            return None, None
+        # waiting for an identical submission in flight must not block the event loop
+        return await run_in_threadpool(self._find_duplicate, request, user, type, fields)
+
+    def _release_submission(self, request : Request, user, type : str, fingerprint : str):
+        if self.submission_index is not None:
+            self.submission_index.release(
+                user.account_id,
+                user.memo_id,
+                type,
+                fingerprint,
+                request.headers.get("idempotency-key")
+            )
+
+    def _record_submission(self, request : Request, user, type : str, fingerprint : str, user_id : str):
+        if self.submission_index is not None:
+            self.submission_index.record(
+                user.account_id,
+                user.memo_id,
+                type,
+                fingerprint,
+                user_id,
+                request.headers.get("idempotency-key")
+            )
+
+    def _submit_fields(self, user, fields : dict, type : str = None) -> str:
+        if self.blob_store is not None:
+            fields = store_binary_fields(self.blob_store, fields)
+
+        if self.kyc_processor is None:
+            return (
+                self.handler.process_submitted_fields(user, fields, type)
                 if type is not None else
-                self.handler.process_submitted_fields(
-                    user, 
-                    fields
-                )
+                self.handler.process_submitted_fields(user, fields)
             )
 
+        customer_id = self.handler.accept_submission(user, fields, type)
+        self.kyc_processor.submit(user, fields, type, customer_id)
+        return customer_id
+
+    async def _submit_fields_async(self, user, fields : dict, type : str = None) -> str:
+        if self.blob_store is not None:
+            fields = await run_in_threadpool(store_binary_fields, self.blob_store, fields)
+
+        if self.kyc_processor is None:
+            return await (
+                self.handler.process_submitted_fields(user, fields, type)
+                if type is not None else
+                self.handler.process_submitted_fields(user, fields)
+            )
+
+        customer_id = await self.handler.accept_submission(user, fields, type)
+        await run_in_threadpool(self.kyc_processor.submit, user, fields, type, customer_id)
+        return customer_id
+
+    @staticmethod
+    def _submitted_fields(fields_submission: CustomerPutRequestBody) -> dict:
+        return {
+            field: value
+            for field, value in fields_submission.model_dump(by_alias=True, exclude_none=True).items()
+            if value
+        }
+
+    async def put_typed_customer_fields(self, request: Request, type : str = None) -> CustomerPutResponse:
+        """
+        Handles the submission of customer fields when the handler declares customer types.
+
+        The body is validated against the model compiled for the customer `type` (taken from
+        the query string or the body), so only the fields declared for that type are accepted.
+
+        Args:
+            request (Request): The FastAPI request object.
+            type (str, optional): The customer type. Defaults to the `type` field of the body.
+
+        Returns:
+            CustomerPutResponse: The response containing the ID of the updated customer.
+        """
+        user = await run_in_threadpool(self.auth_handler.authenticated_route, request)
+        try:
+            submission = await request.json()
+        except ValueError:
+            raise Sep12KycError(400, "Invalid JSON")
+        if not isinstance(submission, dict):
+            raise Sep12KycError(400, "Invalid JSON")
+
+        if type is None:
+            type = submission.get("type")
+        compiled = self.schemas.get(type)
+
+        # identical raw submissions validate identically, so duplicates skip validation too
+        fingerprint, user_id = await self._find_duplicate_async(request, user, type, {
+            field_name: value
+            for field_name, value in submission.items()
+            if field_name in compiled.allowed_fields and value
+        })
+        if user_id is not None:
+            return self._put_response(user_id)
+
+        try:
+            fields = compiled.validate_submission(submission)
+            user_id = await (
+                self._submit_fields_async(user, fields, type)
+                if self.is_async else
+                run_in_threadpool(self._submit_fields, user, fields, type)
+            )
+        except BaseException:
+            self._release_submission(request, user, type, fingerprint)
+            raise
+        self._invalidate_responses(user.account_id, user.memo_id)
+        self._record_submission(request, user, type, fingerprint, user_id)
+
+        return self._put_response(user_id)
+
+    def delete_customer(self, request: Request, account: str, delete_request: CustomerDeleteRequest = None) -> Response:
+        """
+        Deletes all data of the authenticated customer.
+
+        With a purge worker the deletion is only queued, so the response does not wait
+        for the database.
+
+        Args:
+            request (Request): The FastAPI request object.
+            account (str): The customer's Stellar account, which must be the authenticated one.
+            delete_request (CustomerDeleteRequest, optional): The customer's memo, for shared accounts.
+
+        Raises:
+            Sep12KycError: If the account or memo is not the authenticated one.
+
+        Returns:
+            Response: An empty 200 response.
+        """
+        customer = self._customer_to_delete(request, account, delete_request)
+
+        if self.purge_worker is not None:
+            self.purge_worker.enqueue(customer)
+        else:
+            self._delete_jobs(customer)
+            self._purge_blobs(self.handler.delete_user_data(customer))
+        self.invalidate_customer(customer.account_id, customer.memo_id)
+
+        return Response(status_code=200)
+
+    async def delete_customer_async(self, request: Request, account: str, delete_request: CustomerDeleteRequest = None) -> Response:
+        """
+        Deletes all data of the authenticated customer with an `AsyncSep12Handler`.
+
+        Args:
+            request (Request): The FastAPI request object.
+            account (str): The customer's Stellar account, which must be the authenticated one.
+            delete_request (CustomerDeleteRequest, optional): The customer's memo, for shared accounts.
+
+        Raises:
+            Sep12KycError: If the account or memo is not the authenticated one.
+
+        Returns:
+            Response: An empty 200 response.
+        """
+        customer = await run_in_threadpool(self._customer_to_delete, request, account, delete_request)
+
+        if self.purge_worker is not None:
+            await run_in_threadpool(self.purge_worker.enqueue, customer)
+        else:
+            await run_in_threadpool(self._delete_jobs, customer)
+            blobs = await self.handler.delete_user_data(customer)
+            await run_in_threadpool(self._purge_blobs, blobs)
+        self.invalidate_customer(customer.account_id, customer.memo_id)
+
+        return Response(status_code=200)
+
+    def _customer_to_delete(self, request: Request, account: str, delete_request: CustomerDeleteRequest) -> AnchorUser:
+        user = self.auth_handler.authenticated_route(request)
+        memo = delete_request.memo if delete_request is not None else None
+
+        if account != user.account_id:
+            raise Sep12KycError(401, "Not authorized to delete this customer")
+        if memo:
+            try:
+                memo_id = int(memo)
+            except ValueError:
+                raise Sep12KycError(400, "Invalid memo")
+            if memo_id != user.memo_id:
+                raise Sep12KycError(401, "Not authorized to delete this customer")
+
+        return AnchorUser(user.account_id, user.memo_id, user.client_domain)
+
+    def _delete_jobs(self, customer: AnchorUser):
+        # queued submissions hold the customer's fields and would recreate the customer,
+        # so one being processed is waited for before the data is deleted
+        if self.kyc_processor is None:
+            return
+        queue = self.kyc_processor.queue
+        deadline = time.monotonic() + self.delete_timeout
+        while True:
+            queue.delete_customer_jobs([customer])
+            if not queue.processing_customers([customer]):
+                return
+            if time.monotonic() >= deadline:
+                raise Sep12KycError(409, "A submission of this customer is being processed, retry later")
+            time.sleep(0.05)
+
+    def _purge_blobs(self, blobs):
+        if self.blob_store is not None:
+            for blob in blobs or ():
+                self.blob_store.delete(blob)
+
+    def invalidate_customer(self, account_id : str, memo_id : int = 0):
+        """
+        Drops the cached `GET /customer` responses and the remembered submissions of a customer.
+
+        Call this after changing a customer's KYC status outside of `PUT /customer`,
+        e.g. when a compliance officer approves or rejects fields, so that the customer
+        sending the same fields again is processed instead of answered as a duplicate.
+
+        Args:
+            account_id (str): The customer's Stellar account.
+            memo_id (int, optional): The customer's memo, for shared accounts. Defaults to 0.
+        """
+        self._invalidate_responses(account_id, memo_id)
+        if self.submission_index is not None:
+            self.submission_index.forget_customer(account_id, memo_id)
+
+    def _invalidate_responses(self, account_id : str, memo_id : int = 0):
+        if self.response_cache is not None:
+            self.response_cache.invalidate_customer(account_id, memo_id)
+
+    @staticmethod
+    def _cached_response(request : Request, entry : CachedCustomerResponse) -> Response:
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or entry.etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+        ):
+            return Response(status_code=304, headers=headers)
+        return PreEncodedJSONResponse(entry.body, headers=headers)
+
+    def _put_response(self, user_id : str):
+        if self.fast_responses:
+            return PreEncodedJSONResponse(dump_json(CustomerPutResponse.model_construct(id=user_id)))
+
         return CustomerPutResponse(
             id=user_id
         )
@@ -157,24 +637,26 @@ class Sep12Endpoints:
             user=user,
             callback_url=callback_submission.url
         )
+
+    async def register_callback_async(self, request: Request, callback_submission: CustomerCallbackPutRequest) -> int:
+        """
+        Registers callback URLs with an `AsyncSep12Handler`.
+
+        Args:
+            request (Request): The FastAPI request object.
+            callback_submission (CustomerCallbackPutRequest): The submitted callback URL data.
+
+        Returns:
+            dict: The result of the callback registration operation.
+        """
+        user = await run_in_threadpool(self.auth_handler.authenticated_route, request)
+
+        return await self.handler.register_callback_url(
+            user=user,
+            callback_url=callback_submission.url
+        )
     
 
     @staticmethod
     def get_status_from_fields(fields, provided_fields) -> str:
-        if len(fields) > 0:
-            return "NEEDS_INFO"
-        
-        all_statuses = [provided_fields[field]['status'] for field in provided_fields]
-        all_fields_rejected = all([status == "REJECTED" for status in all_statuses])
-
-        if all_fields_rejected: return "REJECTED"
-        elif (
-            ("VERIFICATION_REQUIRED" in all_statuses)
-                or 
-            (not all_fields_rejected and "REJECTED" in all_statuses)
-            ): 
-            return "NEEDS_INFO"
-        
-        elif "PROCESSING" in all_statuses : return "PROCESSING"
-
-        return "ACCEPTED"
\ No newline at end of file
+        return sep12_status_from_fields(fields, provided_fields)
@@ -14,6 +14,7 @@ class Sep1Endpoints:
                                for SEP-1 operations.
         router (APIRouter): An instance of APIRouter from FastAPI to define and handle
                             API routes.
+        static_toml (bool): Whether the TOML is rendered once and served from memory.
 
     Methods:
         return_toml_data(): Handles the GET request for '/stellar.toml' and returns
@@ -23,7 +24,8 @@ class Sep1Endpoints:
     def __init__(
         self,
         handler: Sep1Handler,
-        router: APIRouter
+        router: APIRouter,
+        static_toml: bool = False
     ):
         """
         Initializes the Sep1Endpoints instance with a handler and router.
@@ -33,9 +35,14 @@ class Sep1Endpoints:
                                    handling the logic related to SEP-1 operations.
             router (APIRouter): An APIRouter instance from FastAPI, used to define 
                                 and manage API routes.
+            static_toml (bool, optional): Render the TOML once, at `warm_up` or on the first
+                                request, and serve it from memory afterwards. Leave disabled
+                                when the handler's TOML varies, e.g. per tenant. Defaults to False.
         """
         self.handler = handler
         self.router = router
+        self.static_toml = static_toml
+        self._toml = None
 
         # Adding the '/stellar.toml' route to the API router
         self.router.add_api_route(
@@ -55,4 +62,15 @@ class Sep1Endpoints:
         Returns:
             A response containing the Stellar TOML data.
         """
-        return self.handler.return_toml_data(None)
+        if not self.static_toml:
+            return self.handler.return_toml_data(None)
+        if self._toml is None:
+            self.warm_up()
+        return PlainTextResponse(self._toml)
+
+    def warm_up(self):
+        """
+        Renders the static TOML ahead of the first request.
+        """
+        if self.static_toml:
+            self._toml = self.handler.return_toml_data(None)
@@ -0,0 +1,225 @@
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from fastapi import APIRouter, Request, Depends
+from fastapi.responses import JSONResponse
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.exceptions import Sep38QuoteError
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.sep_handlers.sep38_handler import Sep38Handler
+from anchor_sdk.sep_services.sep38_rates import Sep38RateCache, Sep38QuoteStore, quote_account
+from anchor_sdk.sep_serializations.sep38_serializations import (
+    InfoResponse,
+    PricesRequest,
+    PricesResponse,
+    AssetPrice,
+    PriceRequest,
+    PriceResponse,
+    QuoteRequest,
+    QuoteResponse,
+    Fee,
+)
+
+class Sep38Endpoints:
+    """
+    Provides API endpoints for SEP-38 (Anchor RFQ) prices and firm quotes.
+
+    Every price is computed from the in-memory snapshot held by `Sep38RateCache`, so no
+    request waits on the upstream rate provider. Firm quotes are kept in a `Sep38QuoteStore`
+    where SEP-6 `/deposit-exchange` and `/withdraw-exchange` can look them up.
+
+    Attributes:
+        handler (Sep38Handler): Handler for SEP-38 operations.
+        router (APIRouter): FastAPI router object to which API routes are added.
+        auth_handler (Sep10Handler): The handler for SEP-10 authentication.
+        rate_cache (Sep38RateCache): Cache of asset-pair prices.
+        quote_store (Sep38QuoteStore): Store of firm quotes.
+        quote_ttl (float): Default lifetime of a firm quote in seconds.
+        max_quote_ttl (float): Longest lifetime a wallet may request with `expire_after`.
+    """
+
+    def __init__(
+        self,
+        router: APIRouter,
+        handler: Sep38Handler,
+        auth_handler: Sep10Handler,
+        rate_cache: Sep38RateCache = None,
+        quote_store: Sep38QuoteStore = None,
+        quote_ttl: float = 60,
+        max_quote_ttl: float = 3600
+    ):
+        """
+        Initializes the SEP-38 endpoints.
+
+        Args:
+            router (APIRouter): FastAPI router object for route registration.
+            handler (Sep38Handler): Handler for SEP-38 operations.
+            auth_handler (Sep10Handler): Handler for SEP-10 authentication.
+            rate_cache (Sep38RateCache, optional): Rate cache to price requests from. If omitted,
+                one is created for `handler`. The cache must be started, e.g. in the application
+                lifespan, which `create_anchor_app` does.
+            quote_store (Sep38QuoteStore, optional): Store for firm quotes. Defaults to an in-memory store.
+            quote_ttl (float, optional): Default quote lifetime in seconds. Defaults to 60.
+            max_quote_ttl (float, optional): Maximum quote lifetime in seconds. Defaults to 3600.
+        """
+        self.router = router
+        self.handler = handler
+        self.auth_handler = auth_handler
+        self.quote_ttl = quote_ttl
+        self.max_quote_ttl = max_quote_ttl
+        self.quote_store = quote_store if quote_store is not None else Sep38QuoteStore()
+
+        self.rate_cache = rate_cache if rate_cache is not None else Sep38RateCache(handler)
+
+        self.router.add_api_route(
+            "/info",
+            self.info,
+            methods=['GET'],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="List the assets available for SEP-38 quotes"
+        )
+        self.router.add_api_route(
+            "/prices",
+            self.prices,
+            methods=['GET'],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="Fetch indicative prices for every asset that can be exchanged"
+        )
+        self.router.add_api_route(
+            "/price",
+            self.price,
+            methods=['GET'],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="Fetch an indicative price for an asset pair"
+        )
+        self.router.add_api_route(
+            "/quote",
+            self.create_quote,
+            methods=['POST'],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="Request a firm quote for an asset pair"
+        )
+        self.router.add_api_route(
+            "/quote/{quote_id}",
+            self.fetch_quote,
+            methods=['GET'],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="Fetch a previously issued firm quote"
+        )
+
+    def info(self) -> InfoResponse:
+        return self.handler.info()
+
+    def prices(self, prices_request: PricesRequest = Depends()) -> PricesResponse:
+        snapshot = self.rate_cache.snapshot
+
+        if prices_request.sell_asset and prices_request.sell_amount:
+            self._parse_amount(prices_request.sell_amount, "sell_amount")
+            pairs = snapshot.by_sell.get(prices_request.sell_asset)
+            if pairs is None:
+                raise Sep38QuoteError(400, f"Unsupported asset '{prices_request.sell_asset}'")
+            decimals = self.handler.decimals(prices_request.sell_asset)
+            return PricesResponse(buy_assets=[
+                AssetPrice(asset=asset, price=self._format(price, decimals), decimals=self.handler.decimals(asset))
+                for asset, price in pairs
+            ])
+
+        if prices_request.buy_asset and prices_request.buy_amount:
+            self._parse_amount(prices_request.buy_amount, "buy_amount")
+            pairs = snapshot.by_buy.get(prices_request.buy_asset)
+            if pairs is None:
+                raise Sep38QuoteError(400, f"Unsupported asset '{prices_request.buy_asset}'")
+            return PricesResponse(sell_assets=[
+                AssetPrice(asset=asset, price=self._format(price, self.handler.decimals(asset)), decimals=self.handler.decimals(asset))
+                for asset, price in pairs
+            ])
+
+        raise Sep38QuoteError(400, "Provide either 'sell_asset' and 'sell_amount' or 'buy_asset' and 'buy_amount'")
+
+    def price(self, price_request: PriceRequest = Depends()) -> PriceResponse:
+        return PriceResponse(**self._price(None, price_request))
+
+    def create_quote(self, request: Request, quote_request: QuoteRequest) -> QuoteResponse:
+        user = self.auth_handler.authenticated_route(request)
+        pricing = self._price(user, quote_request)
+
+        now = time.time()
+        expires_at = now + self.quote_ttl
+        if quote_request.expire_after:
+            try:
+                expire_after = datetime.fromisoformat(quote_request.expire_after.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                raise Sep38QuoteError(400, "Invalid 'expire_after' timestamp")
+            if expire_after - now > self.max_quote_ttl:
+                raise Sep38QuoteError(400, "'expire_after' is too far in the future")
+            expires_at = max(expires_at, expire_after)
+
+        quote = QuoteResponse(
+            id=str(uuid.uuid4()),
+            expires_at=datetime.fromtimestamp(expires_at, timezone.utc).isoformat().replace("+00:00", "Z"),
+            sell_asset=quote_request.sell_asset,
+            buy_asset=quote_request.buy_asset,
+            **pricing
+        )
+        self.quote_store.put(quote, quote_account(user), expires_at)
+        return quote
+
+    def fetch_quote(self, request: Request, quote_id: str) -> QuoteResponse:
+        user = self.auth_handler.authenticated_route(request)
+        stored = self.quote_store.get(quote_id)
+        if stored is None or stored.account != quote_account(user):
+            raise Sep38QuoteError(404, f"Quote '{quote_id}' not found")
+        return stored.quote
+
+    def _price(self, user: AnchorUser, price_request: PriceRequest) -> dict:
+        if price_request.context not in ("sep6", "sep31"):
+            raise Sep38QuoteError(400, f"Unsupported context '{price_request.context}'")
+        if (price_request.sell_amount is None) == (price_request.buy_amount is None):
+            raise Sep38QuoteError(400, "Provide exactly one of 'sell_amount' or 'buy_amount'")
+
+        sell_asset = price_request.sell_asset
+        buy_asset = price_request.buy_asset
+        price = self.rate_cache.price(sell_asset, buy_asset)
+
+        if price_request.sell_amount is not None:
+            sell_amount = self._parse_amount(price_request.sell_amount, "sell_amount")
+            fee = Decimal(self.handler.fee(user, sell_asset, buy_asset, sell_amount, price_request.context))
+            buy_amount = (sell_amount - fee) / price
+        else:
+            buy_amount = self._parse_amount(price_request.buy_amount, "buy_amount")
+            net_sell_amount = buy_amount * price
+            fee = Decimal(self.handler.fee(user, sell_asset, buy_asset, net_sell_amount, price_request.context))
+            sell_amount = net_sell_amount + fee
+
+        if buy_amount <= 0:
+            raise Sep38QuoteError(400, "Amount is too small to cover fees")
+
+        sell_decimals = self.handler.decimals(sell_asset)
+        buy_decimals = self.handler.decimals(buy_asset)
+        return {
+            "total_price": self._format(sell_amount / buy_amount, sell_decimals),
+            "price": self._format(price, sell_decimals),
+            "sell_amount": self._format(sell_amount, sell_decimals),
+            "buy_amount": self._format(buy_amount, buy_decimals),
+            "fee": Fee(total=self._format(fee, sell_decimals), asset=sell_asset),
+        }
+
+    @staticmethod
+    def _parse_amount(amount: str, field: str) -> Decimal:
+        try:
+            value = Decimal(amount)
+        except InvalidOperation:
+            raise Sep38QuoteError(400, f"Invalid '{field}'")
+        if not value.is_finite() or value <= 0:
+            raise Sep38QuoteError(400, f"Invalid '{field}'")
+        return value
+
+    @staticmethod
+    def _format(value: Decimal, decimals: int) -> str:
+        return str(value.quantize(Decimal(1).scaleb(-decimals)))
@@ -1,9 +1,28 @@
-from fastapi import APIRouter
+from decimal import Decimal, InvalidOperation
+from fastapi import APIRouter, Request, Depends
+from fastapi.concurrency import run_in_threadpool
+from starlette.background import BackgroundTask
 from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
 from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
 from anchor_sdk.sep_handlers.sep6_handler import Sep6Handler
 from anchor_sdk.sep_serializations.sep6_fields import InfoResponse
-from fastapi.responses import JSONResponse
+from anchor_sdk.sep_serializations.sep6_serializations import (
+    DepositRequest,
+    DepositResponse,
+    DepositExchangeRequest,
+    WithdrawExchangeRequest,
+    WithdrawResponse,
+)
+from anchor_sdk.sep_services.sep6_deposit_pool import DepositInstructionPool
+from anchor_sdk.sep_services.sep38_rates import Sep38QuoteStore, StoredQuote, quote_account
+from anchor_sdk.sep_services.sep6_events import TransactionEventHub
+from anchor_sdk.sep_services.single_flight import SingleFlight, coalesce
+from anchor_sdk.sep_serializations.encoders import PreEncodedJSONResponse, dump_json
+from anchor_sdk.exceptions import Sep6TransferError
+from anchor_sdk.i18n import MessageCatalog, LocalizedMessages
+from anchor_sdk.sep_services.shared_cache import CacheBackend
+from anchor_sdk.models import AnchorUser
+from fastapi.responses import JSONResponse, StreamingResponse
 
 class Sep6Endpoints:
 
@@ -12,12 +31,32 @@ class Sep6Endpoints:
             router : APIRouter,
             handler : Sep6Handler,
             auth_handler : Sep10Handler,
-            kyc_handler : Sep12Handler
+            kyc_handler : Sep12Handler,
+            deposit_pool : DepositInstructionPool = None,
+            quote_store : Sep38QuoteStore = None,
+            event_hub : TransactionEventHub = None,
+            catalog : MessageCatalog = None,
+            single_flight : SingleFlight = None,
+            cache : CacheBackend = None,
+            info_ttl : float = 300
     ):
         self.router = router
         self.auth_handler = auth_handler
         self.kyc_handler = kyc_handler
         self.handler = handler
+        self.deposit_pool = deposit_pool
+        self.quote_store = quote_store
+        self.event_hub = event_hub
+        self.catalog = catalog
+        self.single_flight = single_flight
+        self.cache = cache
+        self.info_ttl = info_ttl
+        self._info_responses = {}
+        self._handler_info = (
+            coalesce(single_flight, handler.info, "Sep6Handler.info")
+            if single_flight is not None else
+            handler.info
+        )
 
         self.router.add_api_route(
             "/info",
@@ -27,13 +66,14 @@ class Sep6Endpoints:
             description="Fetch SEP-6 information"
        )
         
-        # self.router.add_api_route(
-        #     "/deposit",
-        #     self.deposit,
-        #     methods=['GET'],
-        #     response_class=JSONResponse,
-        #     description="Create or access a SEP-6 programmatic deposit"
-        # )
+        self.router.add_api_route(
+            "/deposit",
+            self.deposit,
+            methods=['GET'],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="Create or access a SEP-6 programmatic deposit"
+        )
 
         # self.router.add_api_route(
         #     "/withdraw",
@@ -43,21 +83,23 @@ class Sep6Endpoints:
         #     description="Create or access a SEP-6 programmatic withdrawal"
         # )
 
-        # self.router.add_api_route(
-        #     "/deposit-exchange",
-        #     self.deposit_exchange,
-        #     methods=["GET"],
-        #     response_class=JSONResponse,
-        #     description="Create or access a SEP-6 programmatic deposit between inequivalent assets"
-        # )
+        self.router.add_api_route(
+            "/deposit-exchange",
+            self.deposit_exchange,
+            methods=["GET"],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="Create or access a SEP-6 programmatic deposit between inequivalent assets"
+        )
 
-        # self.router.add_api_route(
-        #     "/withdraw-exchange",
-        #     self.withdraw_exchange,
-        #     methods=["GET"],
-        #     response_class=JSONResponse,
-        #     description="Create or access a SEP-6 programmatic withdrawal between inequivalent assets"
-        # )
+        self.router.add_api_route(
+            "/withdraw-exchange",
+            self.withdraw_exchange,
+            methods=["GET"],
+            response_class=JSONResponse,
+            response_model_exclude_none=True,
+            description="Create or access a SEP-6 programmatic withdrawal between inequivalent assets"
+        )
 
         # self.router.add_api_route(
         #     "/fee",
@@ -82,8 +124,176 @@ class Sep6Endpoints:
         #     response_class=JSONResponse,
         #     description="Query transaction details for a particular transaction"
         # )
+
+        if self.event_hub is not None:
+            self.router.add_api_route(
+                "/transaction/stream",
+                self.transaction_stream,
+                methods=["GET"],
+                response_class=StreamingResponse,
+                description="Stream status changes of the account's transactions as Server-Sent Events"
+            )
         
     def info(self, lang : str = "en") -> InfoResponse:
-        response = self.handler.info()
-        return InfoResponse()
+        if self.catalog is None:
+            return self._handler_info()
+
+        # /info is static, so each language is rendered and encoded once,
+        # and once per host when a shared cache is configured and can store it
+        messages = self.catalog.messages(lang)
+        body = self.cache.get(f"sep6:info:{messages.lang}") if self.cache is not None else None
+        if body is None:
+            body = self._info_responses.get(messages.lang)
+        if body is None:
+            info = self.localize_info(self._handler_info(), messages)
+            body = dump_json(info, exclude_none=True)
+            if self.cache is None or not self.cache.set(f"sep6:info:{messages.lang}", body, self.info_ttl):
+                self._info_responses[messages.lang] = body
+        return PreEncodedJSONResponse(body)
+
+    @staticmethod
+    def localize_info(info : InfoResponse, messages : LocalizedMessages) -> InfoResponse:
+        """
+        Returns a copy of `info` with its field and fee descriptions translated.
+
+        Field descriptions are looked up as `sep6.<operation>.<asset>.fields.<field>.description`,
+        then as `sep6.fields.<field>.description`; the fee description as `sep6.fee.description`.
+        """
+        info = InfoResponse.model_validate(info).model_copy(deep=True)
+
+        for operation, assets in (("deposit", info.deposit), ("withdraw", info.withdraw)):
+            for asset, operation_info in assets.items():
+                for field_name, field in (operation_info.fields or {}).items():
+                    field.description = messages.get(
+                        f"sep6.{operation}.{asset}.fields.{field_name}.description",
+                        messages.get(f"sep6.fields.{field_name}.description", field.description)
+                    )
+
+        info.fee.description = messages.get("sep6.fee.description", info.fee.description)
+        return info
+
+    def warm_up(self):
+        """
+        Renders `/info` for every catalog language ahead of the first request.
+        """
+        if self.catalog is None:
+            self._handler_info()
+            return
+        for lang in self.catalog.languages:
+            self.info(lang)
+
+    def clear_info_cache(self):
+        """
+        Drops the rendered `/info` responses, e.g. after the handler's configuration changed.
+
+        With a shared cache, the responses are dropped for every worker, except those too
+        large for the cache, which each worker keeps for itself.
+        """
+        self._info_responses = {}
+        if self.cache is not None and self.catalog is not None:
+            for lang in self.catalog.languages:
+                self.cache.delete(f"sep6:info:{lang}")
+
+    def deposit(self, request: Request, deposit_request: DepositRequest = Depends()) -> DepositResponse:
+        user = self.auth_handler.authenticated_route(request)
+
+        if self.deposit_pool is None:
+            return self.handler.deposit(user, deposit_request)
+
+        instruction = self.deposit_pool.acquire()
+        try:
+            return self.handler.deposit(user, deposit_request, instruction)
+        except Exception:
+            self.deposit_pool.release(instruction)
+            raise
+
+    def deposit_exchange(self, request: Request, deposit_request: DepositExchangeRequest = Depends()) -> DepositResponse:
+        user = self.auth_handler.authenticated_route(request)
+        quote = self._resolve_quote(
+            user,
+            deposit_request.quote_id,
+            sell_asset=deposit_request.source_asset,
+            buy_asset_code=deposit_request.destination_asset,
+            sell_amount=deposit_request.amount
+        )
+
+        if self.deposit_pool is None:
+            return self.handler.deposit_exchange(user, deposit_request, quote)
+
+        instruction = self.deposit_pool.acquire()
+        try:
+            return self.handler.deposit_exchange(user, deposit_request, quote, instruction)
+        except Exception:
+            self.deposit_pool.release(instruction)
+            raise
+
+    def withdraw_exchange(self, request: Request, withdraw_request: WithdrawExchangeRequest = Depends()) -> WithdrawResponse:
+        user = self.auth_handler.authenticated_route(request)
+        quote = self._resolve_quote(
+            user,
+            withdraw_request.quote_id,
+            sell_asset_code=withdraw_request.source_asset,
+            buy_asset=withdraw_request.destination_asset,
+            sell_amount=withdraw_request.amount
+        )
+        return self.handler.withdraw_exchange(user, withdraw_request, quote)
+
+    async def transaction_stream(self, request: Request, id: str = None) -> StreamingResponse:
+        user = await run_in_threadpool(self.auth_handler.authenticated_route, request)
+        subscription = self.event_hub.subscribe(user.account_id, user.memo_id, transaction_id=id)
+
+        return StreamingResponse(
+            self.event_hub.stream(subscription),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            background=BackgroundTask(self.event_hub.unsubscribe, subscription)
+        )
+
+    def _resolve_quote(
+        self,
+        user: AnchorUser,
+        quote_id: str,
+        sell_amount: str,
+        sell_asset: str = None,
+        sell_asset_code: str = None,
+        buy_asset: str = None,
+        buy_asset_code: str = None
+    ) -> StoredQuote:
+        """
+        Looks up a firm SEP-38 quote and checks that it matches the exchange request.
+
+        SEP-6 identifies the on-chain side of an exchange by asset code only, so that side
+        is compared against the code part of the quote's SEP-38 asset identifier.
+        """
+        if not quote_id:
+            return None
+        if self.quote_store is None:
+            raise Sep6TransferError(400, "Quotes are not supported")
+
+        stored = self.quote_store.get(quote_id)
+        if stored is None or stored.account != quote_account(user):
+            raise Sep6TransferError(400, f"Quote '{quote_id}' not found or expired")
+
+        quote = stored.quote
+        matches = (
+            (sell_asset is None or quote.sell_asset == sell_asset)
+            and (sell_asset_code is None or self._asset_code(quote.sell_asset) == sell_asset_code)
+            and (buy_asset is None or quote.buy_asset == buy_asset)
+            and (buy_asset_code is None or self._asset_code(quote.buy_asset) == buy_asset_code)
+        )
+        if not matches:
+            raise Sep6TransferError(400, f"Quote '{quote_id}' does not match the requested assets")
+
+        try:
+            amount_matches = Decimal(sell_amount) == Decimal(quote.sell_amount)
+        except InvalidOperation:
+            raise Sep6TransferError(400, "Invalid 'amount'")
+        if not amount_matches:
+            raise Sep6TransferError(400, f"'amount' does not match the sell amount of quote '{quote_id}'")
+
+        return stored
 
+    @staticmethod
+    def _asset_code(asset: str) -> str:
+        parts = asset.split(":")
+        return parts[1] if len(parts) > 1 else asset
@@ -1,7 +1,7 @@
-from anchor_sdk.models import AnchorUser
+from anchor_sdk.models import AnchorUser, TokenIntrospection
 from stellar_sdk import Network, Server
 from fastapi import Request
-from anchor_sdk.exceptions import MethodNotImplementedError
+from anchor_sdk.exceptions import MethodNotImplementedError, Sep10AuthError
 
 class Sep10Handler:
     """
@@ -12,6 +12,7 @@ class Sep10Handler:
     Methods:
         create_challenge_transaction: Creates a challenge transaction for a user.
         verify_challenge_transaction: Verifies a signed challenge transaction.
+        introspect_tokens: Verifies a batch of JWTs for back-end services.
 
     Note: This implementation serves as a template and requires specific 
           method implementations.
@@ -67,3 +68,26 @@ class Sep10Handler:
 
     def _verify_token(self, token : str) -> AnchorUser:
         raise MethodNotImplementedError("sep10", "verify_token_private")
+
+    def introspect_tokens(self, tokens: list[str], check_revoked: bool = True) -> list[TokenIntrospection]:
+        """
+        Verifies a batch of JWTs, e.g. for a gateway validating the tokens of many requests at once.
+
+        By default each token goes through `_verify_token`; handlers that can read the
+        token id and expiry override this.
+
+        Args:
+            tokens (list[str]): The JWTs to verify.
+            check_revoked (bool, optional): Whether revoked tokens are reported inactive,
+                if the handler supports revocation. Defaults to True.
+
+        Returns:
+            list[TokenIntrospection]: One result per token, in input order.
+        """
+        results = []
+        for token in tokens:
+            try:
+                results.append(TokenIntrospection(True, self._verify_token(token)))
+            except Sep10AuthError as e:
+                results.append(TokenIntrospection(False, error=e.error_message))
+        return results
@@ -1,6 +1,7 @@
-from anchor_sdk.models import AnchorUser, Sep12KycField
+from anchor_sdk.models import AnchorUser, Sep12KycField, FieldStatusUpdate, CustomerStatusChange
 from anchor_sdk.exceptions import MethodNotImplementedError
 from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.sep_services.blob_store import BlobHandle
 
 class Sep12Handler:
     """
@@ -11,21 +12,49 @@ class Sep12Handler:
     and deleting user data.
 
     Methods:
+        customer_types(self) -> dict[str, list[Sep12KycField]]:
+            Declares the fields required for each customer type.
         fetch_required_fields(self, user: User) -> tuple[str, str, str, list[Sep12KycField]]:
             Fetches the required KYC fields for a customer.
         process_submitted_fields(user: User, fields: list[Sep12KycField]) -> str:
             Processes the submitted KYC fields for a customer.
+        accept_submission(user: User, fields: dict[str], customer_type: str) -> str:
+            Records submitted fields as processing when they are processed in the background.
+        processing_failed(user: User, customer_id: str, customer_type: str, error: str):
+            Handles a submission whose background processing kept failing.
+        update_field_statuses(updates: list[tuple[User, list[FieldStatusUpdate]]]) -> list[tuple[str, list[Sep12KycField]]]:
+            Applies field status transitions to a batch of customers.
+        notify_status_changes(changes: list[CustomerStatusChange]):
+            Notifies a batch of customers whose status was recomputed.
         register_callback_url(user: User, callback_url: str) -> int:
             Registers a callback URL for receiving webhooks.
         process_file_submissions(user: User, files):
             Processes file submissions related to KYC requirements.
         delete_user_data(user: User):
             Deletes all data related to a specific user.
+        delete_users_data(users: list[User]) -> list[BlobHandle]:
+            Deletes the data of several users at once.
 
     Note:
         All methods are placeholders and raise a `MethodNotImplementedError` indicating they need to be
         implemented by the developer.
     """
+    def customer_types(self) -> dict[str, list[Sep12KycField]]:
+        """
+        Declares the fields required for each SEP-12 customer `type`.
+
+        Called once when `Sep12Endpoints` is created. Each declaration is compiled into a
+        dedicated validation model, a pre-built GET `fields` template and an allow-list, so
+        PUT requests only accept the declared fields and `fetch_required_fields` only needs
+        to return the fields that have a status (descriptions are taken from the declaration).
+
+        Returns:
+            dict[str, list[Sep12KycField]]: Declared fields per customer type, e.g.
+                {"sep31-sender": [Sep12KycField("first_name", "Given name"), ...]}.
+                Defaults to no declarations, in which case every SEP-9 field is accepted.
+        """
+        return {}
+
     def fetch_required_fields(self, user: AnchorUser, customer_type : str) -> tuple[
         str,  # user uuid
         str,  # message
@@ -61,6 +90,78 @@ class Sep12Handler:
         """
         raise MethodNotImplementedError("sep12", "process_submitted_fields")
 
+    def accept_submission(self, user: AnchorUser, fields: dict[str], customer_type : str) -> str:
+        """
+        Records submitted KYC fields as processing, before `process_submitted_fields` runs in the background.
+
+        Only called when `Sep12Endpoints` has a `KycProcessor`. It should be quick: store the
+        fields with a processing status (so `fetch_required_fields` reports them with
+        `is_processing=True`) and return the customer id the wallet receives.
+
+        Args:
+            user (User): The user for whom KYC fields are submitted.
+            fields (dict[str]): The KYC fields being submitted.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            str: The customer UUID.
+        """
+        raise MethodNotImplementedError("sep12", "accept_submission")
+
+    def processing_failed(self, user: AnchorUser, customer_id: str, customer_type : str, error: str):
+        """
+        Called when background processing of a submission failed on every attempt.
+
+        Override to update the field statuses, e.g. reject the fields or require
+        verification, so the customer does not stay `PROCESSING`. Does nothing by default.
+
+        Args:
+            user (User): The user whose submission failed.
+            customer_id (str): The customer UUID returned by `accept_submission`.
+            customer_type (str): The SEP-12 customer type, if given.
+            error (str): The last processing error.
+        """
+        pass
+
+    def update_field_statuses(
+        self,
+        updates: list[tuple[AnchorUser, list[FieldStatusUpdate]]]
+    ) -> list[tuple[str, list[Sep12KycField]]]:
+        """
+        Applies field status transitions to a batch of customers, for `Sep12StatusService`.
+
+        Implementations should write the whole batch in as few statements as possible.
+        `FieldStatusUpdate.apply_to` sets the flags of a `Sep12KycField` accordingly.
+
+        Args:
+            updates (list[tuple[User, list[FieldStatusUpdate]]]): Transitions per customer.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            list[tuple[str, list[Sep12KycField]]]: For each customer, in the same order, its
+                UUID and all of its fields after the update, as `fetch_required_fields` returns them.
+                When `customer_types` declares types, add the customer's type as a third item,
+                e.g. `(customer_id, fields, "sep31-sender")`, so the status accounts for the
+                declared fields the customer has not provided.
+        """
+        raise MethodNotImplementedError("sep12", "update_field_statuses")
+
+    def notify_status_changes(self, changes: list[CustomerStatusChange]):
+        """
+        Notifies the callback URLs of a batch of customers whose status was recomputed.
+
+        Called once per batch by `Sep12StatusService`, so the callbacks can be sent
+        concurrently or handed to a queue in one operation. Does nothing by default.
+
+        Args:
+            changes (list[CustomerStatusChange]): The customers and their new status.
+        """
+        pass
+
     def register_callback_url(self, user: AnchorUser, callback_url: str) -> int:
         """
         Registers a callback URL for receiving webhooks.
@@ -99,5 +200,234 @@ class Sep12Handler:
 
         Raises:
             MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            list[BlobHandle], optional: Blobs of the user that no other customer references
+                and may be purged from the blob store.
+        """
+        raise MethodNotImplementedError("sep12", "delete_user_data")
+
+    def delete_users_data(self, users: list[AnchorUser]) -> list[BlobHandle]:
+        """
+        Deletes the data of several users at once, for the background purge worker.
+
+        Override to delete a whole batch in one statement per table. By default
+        `delete_user_data` is called for each user.
+
+        Args:
+            users (list[User]): The users whose data is to be deleted.
+
+        Returns:
+            list[BlobHandle]: Blobs that may be purged from the blob store.
+        """
+        blobs = []
+        for user in users:
+            blobs.extend(self.delete_user_data(user) or ())
+        return blobs
+
+
+class AsyncSep12Handler(Sep12Handler):
+    """
+    Handles SEP-12 operations with coroutine methods.
+
+    `Sep12Endpoints` detects handlers of this class and registers `async def` routes that
+    await the handler on the event loop instead of running it in the threadpool, so KYC
+    lookups can use async database drivers without holding a worker thread per request.
+    Implementations must not block; `customer_types` stays synchronous as it is only
+    called at startup.
+
+    Methods:
+        fetch_required_fields(self, user: AnchorUser, customer_type: str) -> tuple[str, str, list[Sep12KycField]]:
+            Fetches the required KYC fields for a customer.
+        process_submitted_fields(self, user: AnchorUser, fields: dict[str], customer_type: str) -> str:
+            Processes the submitted KYC fields for a customer.
+        accept_submission(self, user: AnchorUser, fields: dict[str], customer_type: str) -> str:
+            Records submitted fields as processing when they are processed in the background.
+        processing_failed(self, user: AnchorUser, customer_id: str, customer_type: str, error: str):
+            Handles a submission whose background processing kept failing.
+        update_field_statuses(self, updates: list[tuple[AnchorUser, list[FieldStatusUpdate]]]) -> list[tuple[str, list[Sep12KycField]]]:
+            Applies field status transitions to a batch of customers.
+        notify_status_changes(self, changes: list[CustomerStatusChange]):
+            Notifies a batch of customers whose status was recomputed.
+        register_callback_url(self, user: AnchorUser, callback_url: str) -> int:
+            Registers a callback URL for receiving webhooks.
+        process_file_submissions(self, user: AnchorUser, files, customer_type: str):
+            Processes file submissions related to KYC requirements.
+        delete_user_data(self, user: AnchorUser):
+            Deletes all data related to a specific user.
+        delete_users_data(self, users: list[AnchorUser]) -> list[BlobHandle]:
+            Deletes the data of several users at once.
+
+    Note:
+        All methods are placeholders and raise a `MethodNotImplementedError` indicating they need to be
+        implemented by the developer.
+    """
+    async def fetch_required_fields(self, user: AnchorUser, customer_type : str) -> tuple[
+        str,  # user uuid
+        str,  # message
+        list[Sep12KycField],  # fields
+    ]:
+        """
+        Fetches the required KYC fields for a customer.
+
+        Args:
+            user (User): The user for whom KYC fields are being fetched.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            tuple[str, str, list[Sep12KycField]]: User UUID, message, and required KYC fields.
+        """
+        raise MethodNotImplementedError("sep12", "fetch_required_fields")
+
+    async def process_submitted_fields(self, user: AnchorUser, fields: dict[str], customer_type : str) -> str:
+        """
+        Processes the submitted KYC fields for a customer.
+
+        Args:
+            user (User): The user for whom KYC fields are submitted.
+            fields (dict[str]): The KYC fields being submitted.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            str: The user UUID indicating the operation was successful.
+        """
+        raise MethodNotImplementedError("sep12", "process_submitted_fields")
+
+    async def accept_submission(self, user: AnchorUser, fields: dict[str], customer_type : str) -> str:
+        """
+        Records submitted KYC fields as processing, before `process_submitted_fields` runs in the background.
+
+        Only called when `Sep12Endpoints` has a `KycProcessor`. It should be quick: store the
+        fields with a processing status (so `fetch_required_fields` reports them with
+        `is_processing=True`) and return the customer id the wallet receives.
+
+        Args:
+            user (User): The user for whom KYC fields are submitted.
+            fields (dict[str]): The KYC fields being submitted.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            str: The customer UUID.
+        """
+        raise MethodNotImplementedError("sep12", "accept_submission")
+
+    async def processing_failed(self, user: AnchorUser, customer_id: str, customer_type : str, error: str):
+        """
+        Called when background processing of a submission failed on every attempt.
+
+        Override to update the field statuses, e.g. reject the fields or require
+        verification, so the customer does not stay `PROCESSING`. Does nothing by default.
+
+        Args:
+            user (User): The user whose submission failed.
+            customer_id (str): The customer UUID returned by `accept_submission`.
+            customer_type (str): The SEP-12 customer type, if given.
+            error (str): The last processing error.
+        """
+        pass
+
+    async def update_field_statuses(
+        self,
+        updates: list[tuple[AnchorUser, list[FieldStatusUpdate]]]
+    ) -> list[tuple[str, list[Sep12KycField]]]:
+        """
+        Applies field status transitions to a batch of customers, for `Sep12StatusService`.
+
+        Implementations should write the whole batch in as few statements as possible.
+        `FieldStatusUpdate.apply_to` sets the flags of a `Sep12KycField` accordingly.
+
+        Args:
+            updates (list[tuple[User, list[FieldStatusUpdate]]]): Transitions per customer.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            list[tuple[str, list[Sep12KycField]]]: For each customer, in the same order, its
+                UUID and all of its fields after the update, as `fetch_required_fields` returns them.
+                When `customer_types` declares types, add the customer's type as a third item,
+                e.g. `(customer_id, fields, "sep31-sender")`, so the status accounts for the
+                declared fields the customer has not provided.
+        """
+        raise MethodNotImplementedError("sep12", "update_field_statuses")
+
+    async def notify_status_changes(self, changes: list[CustomerStatusChange]):
+        """
+        Notifies the callback URLs of a batch of customers whose status was recomputed.
+
+        Called once per batch by `Sep12StatusService`, so the callbacks can be sent
+        concurrently or handed to a queue in one operation. Does nothing by default.
+
+        Args:
+            changes (list[CustomerStatusChange]): The customers and their new status.
+        """
+        pass
+
+    async def register_callback_url(self, user: AnchorUser, callback_url: str) -> int:
+        """
+        Registers a callback URL for receiving webhooks.
+
+        Args:
+            user (User): The user for whom the callback URL is registered.
+            callback_url (str): The URL to be registered for callbacks.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            int: The status code indicating the operation was successful.
+        """
+        raise MethodNotImplementedError("sep12", "register_callback_url")
+
+    async def process_file_submissions(self, user: AnchorUser, files, customer_type : str):
+        """
+        Processes file submissions related to KYC requirements.
+
+        Args:
+            user (User): The user submitting the files.
+            files: The files being submitted.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+        """
+        raise MethodNotImplementedError("sep12", "process_file_submissions")
+
+    async def delete_user_data(self, user: AnchorUser):
+        """
+        Deletes all data related to a specific user.
+
+        Args:
+            user (User): The user whose data is to be deleted.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            list[BlobHandle], optional: Blobs of the user that no other customer references
+                and may be purged from the blob store.
         """
         raise MethodNotImplementedError("sep12", "delete_user_data")
+
+    async def delete_users_data(self, users: list[AnchorUser]) -> list[BlobHandle]:
+        """
+        Deletes the data of several users at once, for the background purge worker.
+
+        Override to delete a whole batch in one statement per table. By default
+        `delete_user_data` is called for each user.
+
+        Args:
+            users (list[User]): The users whose data is to be deleted.
+
+        Returns:
+            list[BlobHandle]: Blobs that may be purged from the blob store.
+        """
+        blobs = []
+        for user in users:
+            blobs.extend(await self.delete_user_data(user) or ())
+        return blobs
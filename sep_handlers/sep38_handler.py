@@ -0,0 +1,85 @@
+from decimal import Decimal
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.exceptions import MethodNotImplementedError
+from anchor_sdk.sep_serializations.sep38_serializations import InfoResponse
+
+class Sep38Handler:
+    """
+    Handles SEP-38 (Anchor RFQ) operations for a Stellar anchor service.
+
+    Rates are never requested on the request path: `Sep38RateCache` calls `fetch_rates`
+    from a background thread and the endpoints price every request from the cached snapshot.
+
+    Methods:
+        info() -> InfoResponse:
+            Returns the assets supported for quotes.
+        fetch_rates() -> dict[str, Decimal]:
+            Returns the reference price of every supported asset.
+        fee(user, sell_asset, buy_asset, sell_amount, context) -> Decimal:
+            Returns the fee charged on a conversion, in units of `sell_asset`.
+        decimals(asset) -> int:
+            Returns the number of decimals used to present amounts of `asset`.
+    """
+
+    def info(self) -> InfoResponse:
+        """
+        Returns the assets supported for quotes.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            InfoResponse: The supported assets and their delivery methods.
+        """
+        raise MethodNotImplementedError("sep38", "info")
+
+    def fetch_rates(self) -> dict[str, Decimal]:
+        """
+        Fetches the price of one unit of every supported asset, expressed in a single
+        reference unit of the anchor's choice (e.g. USD).
+
+        Called periodically by `Sep38RateCache`, so this method may call slow upstream
+        rate providers.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            dict[str, Decimal]: Mapping of SEP-38 asset identifier to reference price.
+        """
+        raise MethodNotImplementedError("sep38", "fetch_rates")
+
+    def fee(
+        self,
+        user: AnchorUser,
+        sell_asset: str,
+        buy_asset: str,
+        sell_amount: Decimal,
+        context: str
+    ) -> Decimal:
+        """
+        Returns the fee charged for converting `sell_amount` of `sell_asset`.
+
+        Args:
+            user (AnchorUser): The authenticated user, or None for unauthenticated price requests.
+            sell_asset (str): The asset being sold.
+            buy_asset (str): The asset being bought.
+            sell_amount (Decimal): The amount of `sell_asset` before fees.
+            context (str): The SEP the conversion is used in ("sep6" or "sep31").
+
+        Returns:
+            Decimal: The fee in units of `sell_asset`. Defaults to no fee.
+        """
+        return Decimal(0)
+
+    def decimals(self, asset: str) -> int:
+        """
+        Returns the number of decimals used to present amounts of `asset`.
+
+        Args:
+            asset (str): A SEP-38 asset identifier.
+
+        Returns:
+            int: 7 for Stellar assets, 2 otherwise.
+        """
+        return 7 if asset.startswith("stellar:") else 2
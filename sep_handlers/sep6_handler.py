@@ -1,20 +1,92 @@
+from anchor_sdk.models import AnchorUser
 from anchor_sdk.exceptions import MethodNotImplementedError
+from anchor_sdk.sep_serializations.sep6_serializations import (
+    DepositRequest,
+    DepositResponse,
+    DepositExchangeRequest,
+    WithdrawExchangeRequest,
+    WithdrawResponse,
+)
+from anchor_sdk.sep_services.sep6_deposit_pool import DepositInstruction
+from anchor_sdk.sep_services.sep38_rates import StoredQuote
 
 class Sep6Handler:
     
     def info(self):
         raise MethodNotImplementedError("sep6", "info")
 
-    def deposit(self):
+    def deposit(
+        self,
+        user: AnchorUser,
+        deposit_request: DepositRequest,
+        deposit_instruction: DepositInstruction = None
+    ) -> DepositResponse:
+        """
+        Creates a SEP-6 programmatic deposit.
+
+        Args:
+            user (AnchorUser): The authenticated user requesting the deposit.
+            deposit_request (DepositRequest): The deposit request parameters.
+            deposit_instruction (DepositInstruction, optional): A unique memo/address reserved
+                for this deposit when `Sep6Endpoints` is configured with a `DepositInstructionPool`.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            DepositResponse: The deposit instructions for the user.
+        """
         raise MethodNotImplementedError("sep6", "deposit")
 
     def withdraw(self):
         raise MethodNotImplementedError("sep6", "withdraw")
 
-    def deposit_exchange(self):
+    def deposit_exchange(
+        self,
+        user: AnchorUser,
+        deposit_request: DepositExchangeRequest,
+        quote: StoredQuote = None,
+        deposit_instruction: DepositInstruction = None
+    ) -> DepositResponse:
+        """
+        Creates a SEP-6 programmatic deposit between inequivalent assets.
+
+        Args:
+            user (AnchorUser): The authenticated user requesting the deposit.
+            deposit_request (DepositExchangeRequest): The deposit request parameters.
+            quote (StoredQuote, optional): The firm SEP-38 quote referenced by `quote_id`,
+                already checked to belong to `user` and to match the requested assets and amount.
+            deposit_instruction (DepositInstruction, optional): A unique memo/address reserved for this deposit.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            DepositResponse: The deposit instructions for the user.
+        """
         raise MethodNotImplementedError("sep6", "deposit-exchange")
 
-    def withdraw_exchange(self):
+    def withdraw_exchange(
+        self,
+        user: AnchorUser,
+        withdraw_request: WithdrawExchangeRequest,
+        quote: StoredQuote = None
+    ) -> WithdrawResponse:
+        """
+        Creates a SEP-6 programmatic withdrawal between inequivalent assets.
+
+        Args:
+            user (AnchorUser): The authenticated user requesting the withdrawal.
+            withdraw_request (WithdrawExchangeRequest): The withdrawal request parameters.
+            quote (StoredQuote, optional): The firm SEP-38 quote referenced by `quote_id`,
+                already checked to belong to `user` and to match the requested assets and amount.
+
+        Raises:
+            MethodNotImplementedError: Indicates the method is not implemented.
+
+        Returns:
+            WithdrawResponse: The withdrawal instructions for the user.
+        """
         raise MethodNotImplementedError("sep6", "withdraw-exchange")
     
     def fee(self):
@@ -0,0 +1,47 @@
+from typing import Any
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_any_adapter = TypeAdapter(Any)
+
+def dump_json(content: Any, exclude_none: bool = False) -> bytes:
+    """
+    Encodes trusted, already-valid response data to JSON bytes in a single pass.
+
+    Pydantic models are serialized by their compiled core serializer, without the
+    validation round trip FastAPI performs on returned values. Other content is encoded
+    with `orjson` when it is installed, and with pydantic-core otherwise.
+
+    Args:
+        content (Any): A pydantic model, or JSON-compatible data.
+        exclude_none (bool, optional): Drop `None` fields of pydantic models. Defaults to False.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content, exclude_none=exclude_none)
+    if orjson is not None:
+        return orjson.dumps(content)
+    return _any_adapter.dump_json(content)
+
+
+class PreEncodedJSONResponse(Response):
+    """
+    JSON response that is sent as-is when given bytes, and encoded with `dump_json` otherwise.
+
+    Returning a `Response` instance from an endpoint makes FastAPI skip response model
+    validation and `jsonable_encoder`, so endpoints in fast response mode build this
+    response directly from trusted data.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from anchor_sdk.sep_serializations.common import SepStellarAccountParams
 
 class ChallengeRequest(SepStellarAccountParams):
@@ -17,4 +17,21 @@ class TokenRequest(BaseModel):
 
 # Token Response
 class TokenResponse(BaseModel):
-    token: str
\ No newline at end of file
+    token: str
+
+# Token introspection, for back-end services
+class IntrospectRequest(BaseModel):
+    tokens: List[str] = Field(..., description="SEP-10 JWTs to verify")
+    check_revoked: bool = Field(True, description="Report revoked tokens as inactive")
+
+class TokenIntrospectionResult(BaseModel):
+    active: bool
+    account: Optional[str] = None
+    memo: Optional[str] = None
+    client_domain: Optional[str] = None
+    jti: Optional[str] = None
+    exp: Optional[int] = None
+    error: Optional[str] = None
+
+class IntrospectResponse(BaseModel):
+    results: List[TokenIntrospectionResult]
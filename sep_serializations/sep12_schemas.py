@@ -0,0 +1,204 @@
+from typing import Optional, Any
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model, field_validator
+from anchor_sdk import SEP9_ALL_FIELDS
+from anchor_sdk.models import Sep12KycField
+from anchor_sdk.exceptions import Sep9InvalidFieldResponded, Sep12KycError
+from anchor_sdk.i18n import MessageCatalog, LocalizedMessages
+from anchor_sdk.util import (
+    validate_email_address as vea,
+    validate_phone_number as vpn,
+    validate_country_code as vcc
+)
+from anchor_sdk.sep_serializations.sep9_fields import (
+    NaturalPerson,
+    FinancialAccount,
+    Organization,
+    NaturalPersonVerification
+)
+
+def _sep9_field_types() -> dict[str, Any]:
+    field_types = {field_name: Optional[str] for field_name in SEP9_ALL_FIELDS}
+    for model in (Organization, FinancialAccount, NaturalPersonVerification, NaturalPerson):
+        for attribute, info in model.model_fields.items():
+            field_types[info.alias or attribute] = info.annotation
+    return field_types
+
+SEP9_FIELD_TYPES = _sep9_field_types()
+
+SEP9_FIELD_VALIDATORS = {
+    "email_address": (vea,),
+    "mobile_number": (vpn,),
+    "address_country_code": (vcc, "address"),
+    "organization.email": (vea,),
+    "organization.phone": (vpn,),
+    "organization.address_country_code": (vcc, "organization address"),
+}
+
+def _attribute_name(field_name: str) -> str:
+    return field_name.replace(".", "__")
+
+def _make_validator(check, *args):
+    def validate(cls, v):
+        if not v: return v
+        check(v, *args)
+        return v
+    return validate
+
+def compile_fields_model(model_name: str, field_names) -> type[BaseModel]:
+    """
+    Builds a pydantic model that accepts exactly the given SEP-9 fields.
+
+    Dotted SEP-9 names (e.g. `organization.city`) are exposed through aliases, so
+    organization and natural person fields with the same suffix do not collide.
+
+    Args:
+        model_name (str): Name of the generated model.
+        field_names (Iterable[str]): SEP-9 field names accepted by the model.
+
+    Raises:
+        Sep9InvalidFieldResponded: If a field is not a SEP-9 field.
+
+    Returns:
+        type[BaseModel]: The generated model. Unknown keys are ignored on validation.
+    """
+    definitions = {}
+    validators = {}
+    for field_name in field_names:
+        if field_name not in SEP9_FIELD_TYPES:
+            raise Sep9InvalidFieldResponded(field_name)
+        attribute = _attribute_name(field_name)
+        definitions[attribute] = (SEP9_FIELD_TYPES[field_name], Field(None, alias=field_name))
+        if field_name in SEP9_FIELD_VALIDATORS:
+            validators[f"validate_{attribute}"] = field_validator(attribute)(
+                _make_validator(*SEP9_FIELD_VALIDATORS[field_name])
+            )
+
+    return create_model(
+        model_name,
+        __config__=ConfigDict(populate_by_name=True, extra="ignore"),
+        __validators__=validators,
+        **definitions
+    )
+
+
+class CompiledCustomerType:
+    """
+    The compiled form of one SEP-12 customer `type` declaration.
+
+    Attributes:
+        name (str): The customer type, e.g. "sep31-sender".
+        model (type[BaseModel]): Pydantic model validating PUT submissions for this type.
+        allowed_fields (frozenset[str]): SEP-9 field names accepted for this type.
+        fields_template (dict[str, dict]): Pre-built GET `fields` descriptors for every declared field.
+        localized_templates (dict[str, dict[str, dict]]): `fields_template` rendered for each catalog language.
+
+    Args:
+        name (str): The customer type.
+        fields (list[Sep12KycField]): Declared fields, with description, type, choices and optional flag.
+    """
+
+    def __init__(self, name: str, fields: list[Sep12KycField]):
+        self.name = name
+        self.allowed_fields = frozenset(field.field_name for field in fields)
+        self.model = compile_fields_model(
+            f"CustomerPutRequest_{name.replace('-', '_')}",
+            [field.field_name for field in fields]
+        )
+
+        fields_template = {}
+        for field in fields:
+            descriptor = {"type": field.type, "description": field.description}
+            if field.choices:
+                descriptor["choices"] = list(field.choices)
+            if field.optional:
+                descriptor["optional"] = True
+            fields_template[field.field_name] = descriptor
+        self.fields_template = fields_template
+        self.localized_templates = {}
+
+    def localize(self, catalog: MessageCatalog):
+        """
+        Pre-renders `fields_template` for every language of `catalog`.
+        """
+        localized_templates = {}
+        for lang in catalog.languages:
+            descriptions = catalog.messages(lang).field_descriptions
+            localized_templates[lang] = {
+                field_name: (
+                    dict(descriptor, description=descriptions[field_name])
+                    if field_name in descriptions else descriptor
+                )
+                for field_name, descriptor in self.fields_template.items()
+            }
+        self.localized_templates = localized_templates
+
+    def template(self, messages: LocalizedMessages = None) -> dict:
+        """
+        Returns the GET `fields` template, localized for `messages` when available.
+        """
+        if messages is None:
+            return self.fields_template
+        return self.localized_templates.get(messages.lang, self.fields_template)
+
+    def validate_submission(self, submission: dict) -> dict:
+        """
+        Validates a raw PUT body and returns only the non-empty fields declared for this type.
+
+        Raises:
+            Sep12KycError: If a declared field has an invalid value.
+        """
+        try:
+            validated = self.model.model_validate(submission)
+        except ValidationError as e:
+            error = e.errors()[0]
+            raise Sep12KycError(400, f"Invalid value for '{error['loc'][0]}': {error['msg']}")
+
+        return {
+            field_name: value
+            for field_name, value in validated.model_dump(by_alias=True, exclude_none=True).items()
+            if value
+        }
+
+
+class Sep12SchemaRegistry:
+    """
+    Compiles SEP-12 customer type declarations once, at startup.
+
+    Attributes:
+        types (dict[str, CompiledCustomerType]): Compiled declarations by customer type.
+
+    Args:
+        declarations (dict[str, list[Sep12KycField]]): Fields required for each customer type.
+        catalog (MessageCatalog, optional): Catalog to pre-render localized templates from. Defaults to None.
+    """
+
+    def __init__(self, declarations: dict[str, list[Sep12KycField]], catalog: MessageCatalog = None):
+        self.types = {
+            name: CompiledCustomerType(name, fields)
+            for name, fields in declarations.items()
+        }
+        if catalog is not None:
+            for compiled in self.types.values():
+                compiled.localize(catalog)
+        self.untyped = CompiledCustomerType(
+            "untyped",
+            [Sep12KycField(field_name) for field_name in SEP9_ALL_FIELDS]
+        )
+
+    def get(self, customer_type: str) -> CompiledCustomerType:
+        """
+        Returns the compiled declaration for `customer_type`, or one accepting every
+        SEP-9 field when no type is given.
+
+        Raises:
+            Sep12KycError: If the type was not declared.
+        """
+        if customer_type is None:
+            return self.untyped
+        compiled = self.types.get(customer_type)
+        if compiled is None:
+            raise Sep12KycError(400, f"Unknown customer type '{customer_type}'")
+        return compiled
+
+    def __bool__(self) -> bool:
+        return bool(self.types)
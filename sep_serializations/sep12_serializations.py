@@ -1,7 +1,8 @@
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Literal
 from pydantic import BaseModel, HttpUrl
-from anchor_sdk.sep_serializations.sep9_fields import NaturalPerson, NaturalPersonVerification
+from anchor_sdk import SEP9_ALL_FIELDS
 from anchor_sdk.sep_serializations.common import SepStellarAccountParams
+from anchor_sdk.sep_serializations.sep12_schemas import compile_fields_model
 
 class CustomerGetRequest(SepStellarAccountParams):
     id: Optional[str] = None
@@ -32,12 +33,9 @@ class CustomerPutRequestParams(
     type: Optional[str] = None
 
 
-class CustomerPutRequestBody(
-    NaturalPerson, 
-    NaturalPersonVerification, 
-):
-    pass
-    # Additional SEP-9 fields as needed
+# Accepts every SEP-9 field, including financial account and organization fields.
+# Dotted organization fields are exposed through aliases, see `compile_fields_model`.
+CustomerPutRequestBody = compile_fields_model("CustomerPutRequestBody", SEP9_ALL_FIELDS)
 
 
 class CustomerPutResponse(BaseModel):
@@ -46,3 +44,27 @@ class CustomerPutResponse(BaseModel):
 class CustomerCallbackPutRequest(SepStellarAccountParams):
     id : Optional[str] = None
     url : HttpUrl
+
+class CustomerDeleteRequest(BaseModel):
+    memo : Optional[str] = None
+    memo_type : Optional[str] = None
+
+class FieldStatusUpdateRequest(BaseModel):
+    status : Literal["ACCEPTED", "REJECTED", "PROCESSING", "VERIFICATION_REQUIRED"]
+    error : Optional[str] = None
+
+class CustomerStatusUpdateRequest(SepStellarAccountParams):
+    account : str
+    fields : Dict[str, FieldStatusUpdateRequest]
+
+class BulkStatusUpdateRequest(BaseModel):
+    customers : List[CustomerStatusUpdateRequest]
+
+class CustomerStatusInfo(BaseModel):
+    account : str
+    memo : str
+    id : Optional[str]
+    status : str
+
+class BulkStatusUpdateResponse(BaseModel):
+    customers : List[CustomerStatusInfo]
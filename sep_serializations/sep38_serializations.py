@@ -0,0 +1,74 @@
+from typing import Optional, List
+from pydantic import BaseModel, Field
+
+class DeliveryMethod(BaseModel):
+    name: str
+    description: str
+
+class Sep38Asset(BaseModel):
+    asset: str
+    sell_delivery_methods: Optional[List[DeliveryMethod]] = None
+    buy_delivery_methods: Optional[List[DeliveryMethod]] = None
+    country_codes: Optional[List[str]] = None
+
+class InfoResponse(BaseModel):
+    assets: List[Sep38Asset]
+
+class PricesRequest(BaseModel):
+    sell_asset: Optional[str] = None
+    sell_amount: Optional[str] = None
+    sell_delivery_method: Optional[str] = None
+    buy_asset: Optional[str] = None
+    buy_amount: Optional[str] = None
+    buy_delivery_method: Optional[str] = None
+    country_code: Optional[str] = None
+
+class AssetPrice(BaseModel):
+    asset: str
+    price: str
+    decimals: int
+
+class PricesResponse(BaseModel):
+    buy_assets: Optional[List[AssetPrice]] = None
+    sell_assets: Optional[List[AssetPrice]] = None
+
+class PriceRequest(BaseModel):
+    sell_asset: str
+    buy_asset: str
+    context: str = Field(..., description="Either 'sep6' or 'sep31'")
+    sell_amount: Optional[str] = None
+    buy_amount: Optional[str] = None
+    sell_delivery_method: Optional[str] = None
+    buy_delivery_method: Optional[str] = None
+    country_code: Optional[str] = None
+
+class FeeDetail(BaseModel):
+    name: str
+    amount: str
+    description: Optional[str] = None
+
+class Fee(BaseModel):
+    total: str
+    asset: str
+    details: Optional[List[FeeDetail]] = None
+
+class PriceResponse(BaseModel):
+    total_price: str
+    price: str
+    sell_amount: str
+    buy_amount: str
+    fee: Fee
+
+class QuoteRequest(PriceRequest):
+    expire_after: Optional[str] = None
+
+class QuoteResponse(BaseModel):
+    id: str
+    expires_at: str
+    total_price: str
+    price: str
+    sell_asset: str
+    sell_amount: str
+    buy_asset: str
+    buy_amount: str
+    fee: Fee
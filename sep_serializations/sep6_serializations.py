@@ -0,0 +1,83 @@
+from typing import Optional, Dict
+from pydantic import BaseModel, Field
+from anchor_sdk.sep_serializations.common import SepStellarAccountParams
+
+class DepositRequest(SepStellarAccountParams):
+    asset_code: str
+    memo_type: Optional[str] = None
+    email_address: Optional[str] = None
+    type: Optional[str] = None
+    wallet_name: Optional[str] = None
+    wallet_url: Optional[str] = None
+    lang: Optional[str] = None
+    on_change_callback: Optional[str] = None
+    amount: Optional[str] = None
+    country_code: Optional[str] = None
+    claimable_balance_supported: Optional[str] = None
+    customer_id: Optional[str] = None
+    location_id: Optional[str] = None
+
+class DepositInstructionInfo(BaseModel):
+    value: str
+    description: str
+
+class ExtraInfo(BaseModel):
+    message: Optional[str] = None
+
+class DepositResponse(BaseModel):
+    how: Optional[str] = Field(None, description="Deprecated, use 'instructions' instead")
+    instructions: Optional[Dict[str, DepositInstructionInfo]] = None
+    id: Optional[str] = None
+    eta: Optional[int] = None
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    fee_fixed: Optional[float] = None
+    fee_percent: Optional[float] = None
+    extra_info: Optional[ExtraInfo] = None
+
+class DepositExchangeRequest(SepStellarAccountParams):
+    destination_asset: str
+    source_asset: str
+    amount: str
+    quote_id: Optional[str] = None
+    memo_type: Optional[str] = None
+    email_address: Optional[str] = None
+    type: Optional[str] = None
+    wallet_name: Optional[str] = None
+    wallet_url: Optional[str] = None
+    lang: Optional[str] = None
+    on_change_callback: Optional[str] = None
+    country_code: Optional[str] = None
+    claimable_balance_supported: Optional[str] = None
+    customer_id: Optional[str] = None
+    location_id: Optional[str] = None
+
+class WithdrawExchangeRequest(SepStellarAccountParams):
+    source_asset: str
+    destination_asset: str
+    amount: str
+    type: str
+    quote_id: Optional[str] = None
+    dest: Optional[str] = None
+    dest_extra: Optional[str] = None
+    wallet_name: Optional[str] = None
+    wallet_url: Optional[str] = None
+    lang: Optional[str] = None
+    on_change_callback: Optional[str] = None
+    country_code: Optional[str] = None
+    refund_memo: Optional[str] = None
+    refund_memo_type: Optional[str] = None
+    customer_id: Optional[str] = None
+    location_id: Optional[str] = None
+
+class WithdrawResponse(BaseModel):
+    account_id: Optional[str] = None
+    memo_type: Optional[str] = None
+    memo: Optional[str] = None
+    id: str
+    eta: Optional[int] = None
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    fee_fixed: Optional[float] = None
+    fee_percent: Optional[float] = None
+    extra_info: Optional[ExtraInfo] = None
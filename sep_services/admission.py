@@ -0,0 +1,368 @@
+import asyncio
+import bisect
+import heapq
+import itertools
+from typing import Iterable, Optional
+from anchor_sdk.exceptions import ServiceOverloaded
+
+PRIORITY_BULK = 0
+PRIORITY_INTERACTIVE = 10
+PRIORITY_DISCOVERY = 20
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+class QueueTimeHistogram:
+    """
+    Histogram of the seconds admitted requests waited in a queue.
+
+    Attributes:
+        buckets (tuple[float, ...]): Upper bounds of the buckets, in seconds.
+        counts (list[int]): Observations per bucket, the last one counting those above every bound.
+        count (int): Number of observations.
+        sum (float): Sum of the observations, in seconds.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Returns the upper bound of the bucket holding the given fraction of observations,
+        or infinity when it falls above every bound.
+        """
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        """
+        Returns the cumulative counts by upper bound, Prometheus style, with the count and sum.
+        """
+        cumulative = list(itertools.accumulate(self.counts))
+        buckets = {str(bound): count for bound, count in zip(self.buckets, cumulative)}
+        buckets["+Inf"] = self.count
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+class ConcurrencyLimit:
+    """
+    Bounds the requests running at once, with a bounded priority queue for the others.
+
+    Requests over the limit wait in the queue, highest priority first and in arrival order
+    within a priority, and a released slot is handed directly to the next one. A request is
+    shed with `ServiceOverloaded` when it has waited `queue_timeout` seconds, or when the
+    queue is full and it has no higher priority than the queued requests; otherwise it
+    takes the place of the last arrived request of the lowest queued priority, which is shed.
+
+    A limit is used from the event loop serving the application, without locking.
+
+    Attributes:
+        name (str): Name of the limit, reported in errors and statistics.
+        limit (int): Requests allowed to run at once.
+        max_queue (int): Requests allowed to wait.
+        queue_timeout (float): Seconds a request may wait.
+        retry_after (int): Seconds sent in the `Retry-After` header of shed requests.
+        active (int): Requests running.
+        queued (int): Requests waiting.
+        admitted (int): Requests admitted.
+        shed (int): Requests shed because the queue was full.
+        expired (int): Requests shed because they waited `queue_timeout` seconds.
+        histogram (QueueTimeHistogram): Queue time of admitted requests.
+
+    Args:
+        name (str): Name of the limit.
+        limit (int): Requests allowed to run at once.
+        max_queue (int, optional): Requests allowed to wait. Defaults to twice `limit`.
+        queue_timeout (float, optional): Seconds a request may wait. Defaults to 1.
+        retry_after (int, optional): `Retry-After` of shed requests. Defaults to 1.
+        buckets (Iterable[float], optional): Bounds of the queue time histogram.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        max_queue: int = None,
+        queue_timeout: float = 1,
+        retry_after: int = 1,
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue if max_queue is not None else 2 * limit
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.histogram = QueueTimeHistogram(buckets)
+        self.active = 0
+        self.queued = 0
+        self.admitted = 0
+        self.shed = 0
+        self.expired = 0
+        # heap of [-priority, arrival, future]; entries of settled futures are skipped when popped
+        self._waiters: list[list] = []
+        self._arrivals = itertools.count()
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE, timeout: float = None):
+        """
+        Waits for a slot, at most `queue_timeout` seconds or `timeout` if shorter.
+
+        Raises:
+            ServiceOverloaded: If the request was shed.
+        """
+        if self.active < self.limit and not self.queued:
+            self.active += 1
+            self.admitted += 1
+            self.histogram.observe(0.0)
+            return
+
+        timeout = self.queue_timeout if timeout is None else min(timeout, self.queue_timeout)
+        if timeout <= 0:
+            self.expired += 1
+            raise self._overloaded()
+        if self.queued >= self.max_queue:
+            victim = self._last_of_lowest_priority()
+            if victim is None or -victim[0] >= priority:
+                self.shed += 1
+                raise self._overloaded()
+            victim[2].set_exception(self._overloaded())
+            self.queued -= 1
+            self.shed += 1
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if len(self._waiters) > 2 * self.max_queue:
+            self._waiters = [entry for entry in self._waiters if not entry[2].done()]
+            heapq.heapify(self._waiters)
+        heapq.heappush(self._waiters, [-priority, next(self._arrivals), future])
+        self.queued += 1
+
+        started = loop.time()
+        expiry = loop.call_later(timeout, self._expire, future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self.queued -= 1
+            elif future.exception() is None:
+                # the slot was handed over before the request was cancelled
+                self.release()
+            raise
+        finally:
+            expiry.cancel()
+        self.admitted += 1
+        self.histogram.observe(loop.time() - started)
+
+    def release(self):
+        """
+        Hands the slot to the next queued request, or frees it.
+        """
+        while self._waiters:
+            future = heapq.heappop(self._waiters)[2]
+            if not future.done():
+                self.queued -= 1
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "expired": self.expired,
+            "queue_time": self.histogram.snapshot(),
+        }
+
+    def _expire(self, future: asyncio.Future):
+        if not future.done():
+            self.queued -= 1
+            self.expired += 1
+            future.set_exception(self._overloaded())
+
+    def _last_of_lowest_priority(self) -> Optional[list]:
+        waiting = [entry for entry in self._waiters if not entry[2].done()]
+        return max(waiting, key=lambda entry: (entry[0], entry[1])) if waiting else None
+
+    def _overloaded(self) -> ServiceOverloaded:
+        return ServiceOverloaded(f"Too many requests for '{self.name}', retry later", self.retry_after)
+
+
+class AdmissionRule:
+    """
+    Admission of the requests to a path.
+
+    Attributes:
+        path (str): The path, matching itself and every path below it.
+        methods (Optional[frozenset[str]]): Methods matched, every method when None.
+        limits (list[ConcurrencyLimit]): Limits acquired in order, from the most specific.
+        priority (int): Priority of the requests in the queues of the limits.
+    """
+
+    __slots__ = ("path", "methods", "limits", "priority")
+
+    def __init__(self, path: str, methods: Optional[Iterable[str]], limits: list[ConcurrencyLimit], priority: int):
+        self.path = path.rstrip("/")
+        self.methods = frozenset(method.upper() for method in methods) if methods is not None else None
+        self.limits = limits
+        self.priority = priority
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return path == self.path or path.startswith(self.path + "/")
+
+
+class AdmissionController:
+    """
+    Maps routes to concurrency limits and priority classes.
+
+    Rules are matched in the order they were added and the first match applies; requests
+    matching no rule, or a rule without limits, are admitted immediately. A rule usually
+    lists a per-route limit, then the limit of its handler, then a limit shared by every
+    limited route, so expensive routes cannot take every worker thread. Every rule must
+    list shared limits in the same order, to avoid waiting in cycles.
+
+    Cheap discovery routes such as `stellar.toml` and `/info` are given
+    `PRIORITY_DISCOVERY` and no limits, or share limits where their higher priority moves
+    them ahead of `PRIORITY_INTERACTIVE` and `PRIORITY_BULK` requests and makes those
+    shed first.
+
+    Example:
+        admission = AdmissionController()
+        admission.add_limit("anchor", 30)
+        admission.add_limit("sep10_verify", 8)
+        admission.add_rule("/.well-known/stellar.toml", priority=PRIORITY_DISCOVERY)
+        admission.add_rule("/auth", ["sep10_verify", "anchor"], methods=["POST"])
+        app.add_middleware(AdmissionMiddleware, controller=admission)
+
+    Attributes:
+        limits (dict[str, ConcurrencyLimit]): The limits, by name.
+        rules (list[AdmissionRule]): The rules, in matching order.
+    """
+
+    def __init__(self):
+        self.limits: dict[str, ConcurrencyLimit] = {}
+        self.rules: list[AdmissionRule] = []
+
+    def add_limit(
+        self,
+        name: str,
+        limit: int,
+        max_queue: int = None,
+        queue_timeout: float = 1,
+        retry_after: int = 1
+    ) -> ConcurrencyLimit:
+        """
+        Adds a limit that rules refer to by `name`. See `ConcurrencyLimit` for the arguments.
+        """
+        self.limits[name] = ConcurrencyLimit(name, limit, max_queue, queue_timeout, retry_after)
+        return self.limits[name]
+
+    def add_rule(
+        self,
+        path: str,
+        limits: Iterable[str] = (),
+        methods: Iterable[str] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> "AdmissionController":
+        """
+        Adds a rule for `path` and the paths below it, matched after the rules already added.
+
+        Args:
+            path (str): The path, including the prefix of its router.
+            limits (Iterable[str], optional): Names of the limits to acquire, in order.
+            methods (Iterable[str], optional): Methods matched. Defaults to every method.
+            priority (int, optional): Priority class. Defaults to `PRIORITY_INTERACTIVE`.
+
+        Raises:
+            KeyError: If a limit was not added.
+        """
+        self.rules.append(AdmissionRule(path, methods, [self.limits[name] for name in limits], priority))
+        return self
+
+    def match(self, method: str, path: str) -> Optional[AdmissionRule]:
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return None
+
+    async def admit(self, rule: AdmissionRule) -> list[ConcurrencyLimit]:
+        """
+        Acquires the limits of `rule`, waiting at most the shortest `queue_timeout` of them in total.
+
+        Returns:
+            list[ConcurrencyLimit]: The acquired limits, to pass to `release`.
+
+        Raises:
+            ServiceOverloaded: If the request was shed. Limits acquired before are released.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(limit.queue_timeout for limit in rule.limits)
+        acquired = []
+        try:
+            for limit in rule.limits:
+                await limit.acquire(rule.priority, deadline - loop.time())
+                acquired.append(limit)
+        except BaseException:
+            self.release(acquired)
+            raise
+        return acquired
+
+    def release(self, acquired: list[ConcurrencyLimit]):
+        for limit in reversed(acquired):
+            limit.release()
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Returns the state, counters and queue time histogram of every limit, by name.
+        """
+        return {name: limit.stats() for name, limit in self.limits.items()}
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware applying an `AdmissionController` to HTTP requests.
+
+    Shed requests are answered with a 503 and a `Retry-After` header without reaching the
+    application. A request holds its slots until its response is complete.
+
+    Args:
+        app: The ASGI application to wrap.
+        controller (AdmissionController): The rules and limits to apply.
+    """
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        rule = self.controller.match(scope["method"], scope["path"])
+        if rule is None or not rule.limits:
+            return await self.app(scope, receive, send)
+
+        try:
+            acquired = await self.controller.admit(rule)
+        except ServiceOverloaded as e:
+            return await e.default_exception_anchor_response()(scope, receive, send)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(acquired)
@@ -0,0 +1,225 @@
+import hashlib
+import mmap
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Union
+from anchor_sdk.exceptions import MethodNotImplementedError
+
+class BlobHandle:
+    """
+    Reference to an immutable blob, identified by the SHA-256 digest of its content.
+
+    Handles compare and hash by digest, and `str(handle)` gives "sha256:<hex digest>",
+    which `BlobHandle.parse` turns back into a handle.
+
+    Attributes:
+        digest (str): Hex SHA-256 digest of the content.
+        size (int): Content length in bytes.
+    """
+    __slots__ = ("digest", "size")
+
+    def __init__(self, digest: str, size: int = None):
+        self.digest = digest
+        self.size = size
+
+    @classmethod
+    def parse(cls, reference: str) -> "BlobHandle":
+        algorithm, _, digest = reference.partition(":")
+        if algorithm != "sha256" or len(digest) != 64:
+            raise ValueError(f"Invalid blob reference '{reference}'")
+        return cls(digest)
+
+    def __str__(self) -> str:
+        return f"sha256:{self.digest}"
+
+    def __repr__(self) -> str:
+        return f"BlobHandle('{self.digest}', size={self.size})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BlobHandle) and other.digest == self.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+
+class BlobStore:
+    """
+    Stores binary SEP-9 fields (ID photos, proofs of address, ...) by content.
+
+    Integrators extend this class to keep blobs in object storage. Content addressing
+    makes writes idempotent: storing a document that was already uploaded returns the
+    existing handle. Each `put` takes a reference on the content and each `delete`
+    releases one, so a document shared by several customers outlives the purge of one.
+
+    Methods:
+        put(data: bytes | BinaryIO) -> BlobHandle:
+            Stores content, takes a reference on it and returns its handle.
+        read(handle: BlobHandle) -> memoryview | mmap.mmap:
+            Returns a read-only buffer over the content, usable as a context manager.
+        exists(handle: BlobHandle) -> bool:
+            Returns whether the content is stored.
+        delete(handle: BlobHandle):
+            Releases a reference, removing the content once none is left.
+    """
+
+    def put(self, data: Union[bytes, BinaryIO]) -> BlobHandle:
+        raise MethodNotImplementedError("sep12", "put")
+
+    def read(self, handle: BlobHandle):
+        raise MethodNotImplementedError("sep12", "read")
+
+    def exists(self, handle: BlobHandle) -> bool:
+        raise MethodNotImplementedError("sep12", "exists")
+
+    def delete(self, handle: BlobHandle):
+        raise MethodNotImplementedError("sep12", "delete")
+
+
+class LocalBlobStore(BlobStore):
+    """
+    `BlobStore` on the local filesystem.
+
+    Content is streamed into a temporary file while it is hashed, then renamed to
+    `<root>/<2 hex>/<2 hex>/<digest>`; if that file already exists the upload is a
+    duplicate and the temporary file is discarded. Reads map the file into memory,
+    so large documents are paged in lazily and shared between readers.
+
+    Reference counts are kept in `<root>/refs.sqlite3`. The rename or discard of an
+    upload and the removal of the last reference run in the same immediate transaction,
+    so a purge cannot remove a blob that another process just deduplicated to, even when
+    several processes share the directory. Blobs stored without a count are treated as
+    holding one reference.
+
+    Only file-like input is streamed from its source. `Sep12Endpoints` parses `PUT /customer`
+    bodies as JSON, so binary fields reach `put` as `bytes` and are hashed from memory.
+
+    Args:
+        root (str): Directory holding the blobs. Created if missing.
+        chunk_size (int, optional): Bytes read and hashed at a time from file-like input. Defaults to 1 MiB.
+    """
+
+    def __init__(self, root: str, chunk_size: int = 1 << 20):
+        self.root = root
+        self.chunk_size = chunk_size
+        self._tmp = os.path.join(root, "tmp")
+        os.makedirs(self._tmp, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(root, "refs.sqlite3"), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS blob_refs (digest TEXT PRIMARY KEY, refs INTEGER NOT NULL)"
+            )
+
+    def path(self, handle: BlobHandle) -> str:
+        digest = handle.digest
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def put(self, data: Union[bytes, BinaryIO]) -> BlobHandle:
+        sha256 = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                for chunk in self._chunks(data):
+                    sha256.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+
+            handle = BlobHandle(sha256.hexdigest(), size)
+            path = self.path(handle)
+            with self._transaction() as connection:
+                if os.path.exists(path):
+                    os.unlink(tmp_path)
+                    if connection.execute("SELECT 1 FROM blob_refs WHERE digest = ?", (handle.digest,)).fetchone() is None:
+                        connection.execute("INSERT INTO blob_refs VALUES (?, 1)", (handle.digest,))
+                else:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    os.replace(tmp_path, path)
+                    connection.execute("INSERT OR REPLACE INTO blob_refs VALUES (?, 0)", (handle.digest,))
+                connection.execute("UPDATE blob_refs SET refs = refs + 1 WHERE digest = ?", (handle.digest,))
+            return handle
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def read(self, handle: BlobHandle):
+        """
+        Returns a read-only memory map of the blob, or an empty `memoryview` for empty blobs.
+
+        Raises:
+            FileNotFoundError: If the blob is not stored.
+        """
+        with open(self.path(handle), "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return memoryview(b"")
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def exists(self, handle: BlobHandle) -> bool:
+        return os.path.exists(self.path(handle))
+
+    def delete(self, handle: BlobHandle):
+        with self._transaction() as connection:
+            row = connection.execute("SELECT refs FROM blob_refs WHERE digest = ?", (handle.digest,)).fetchone()
+            if row is not None and row[0] > 1:
+                connection.execute("UPDATE blob_refs SET refs = refs - 1 WHERE digest = ?", (handle.digest,))
+                return
+            connection.execute("DELETE FROM blob_refs WHERE digest = ?", (handle.digest,))
+            try:
+                os.unlink(self.path(handle))
+            except FileNotFoundError:
+                pass
+
+    def references(self, handle: BlobHandle) -> int:
+        """
+        Returns the number of references held on a blob, 0 if it is not stored.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT refs FROM blob_refs WHERE digest = ?", (handle.digest,)).fetchone()
+        if row is not None:
+            return row[0]
+        return 1 if self.exists(handle) else 0
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _chunks(self, data: Union[bytes, BinaryIO]):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            view = memoryview(data)
+            for offset in range(0, len(view), self.chunk_size):
+                yield view[offset:offset + self.chunk_size]
+            return
+        while True:
+            chunk = data.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def store_binary_fields(store: BlobStore, fields: dict) -> dict:
+    """
+    Replaces the `bytes` values of submitted SEP-9 fields with handles of stored blobs.
+    """
+    return {
+        name: store.put(value) if isinstance(value, (bytes, bytearray)) else value
+        for name, value in fields.items()
+    }
@@ -0,0 +1,274 @@
+import asyncio
+import cProfile
+import functools
+import marshal
+import pstats
+import random
+import threading
+import time
+from typing import Callable, Optional
+from fastapi.routing import APIRoute
+
+class RouteProfile:
+    """
+    Profile aggregated over the sampled requests of one route.
+
+    Attributes:
+        route (str): The route, as "METHOD /path".
+        samples (int): Number of sampled requests.
+        total_time (float): Wall-clock seconds spent in the sampled endpoint calls.
+        stats (Optional[pstats.Stats]): Merged cProfile statistics, None before the first sample.
+    """
+
+    def __init__(self, route: str):
+        self.route = route
+        self.samples = 0
+        self.total_time = 0.0
+        self.stats: Optional[pstats.Stats] = None
+        self._lock = threading.Lock()
+
+    def add(self, profile: cProfile.Profile, elapsed: float):
+        with self._lock:
+            if self.stats is None:
+                self.stats = pstats.Stats(profile)
+            else:
+                self.stats.add(profile)
+            self.samples += 1
+            self.total_time += elapsed
+
+    def _entries(self) -> dict:
+        with self._lock:
+            return dict(self.stats.stats) if self.stats is not None else {}
+
+    def pstats_bytes(self) -> bytes:
+        """
+        Returns the statistics in the format written by `cProfile` and read by `pstats.Stats(path)`,
+        snakeviz or gprof2dot.
+        """
+        return marshal.dumps(self._entries())
+
+    def collapsed_stacks(self, min_time: float = 1e-6, max_depth: int = 64) -> str:
+        """
+        Returns the profile as collapsed stacks, one `frame;frame;frame microseconds` line per
+        stack, the input of flamegraph.pl, speedscope and inferno.
+
+        cProfile records calls between pairs of functions rather than whole stacks, so the
+        time of a function called from several places is split across its callers' stacks
+        in proportion to the time spent in each call site. Stacks below `min_time` seconds
+        or deeper than `max_depth` frames are left out, and recursive calls are folded.
+        """
+        entries = self._entries()
+        callees: dict[tuple, list[tuple[tuple, float]]] = {}
+        for function, (_, _, _, _, callers) in entries.items():
+            for caller, (_, _, _, cumulative) in callers.items():
+                callees.setdefault(caller, []).append((function, cumulative))
+
+        lines: dict[str, float] = {}
+
+        def walk(function: tuple, stack: list[str], on_path: set, time_on_path: float):
+            _, _, self_time, cumulative, _ = entries[function]
+            # the coroutine steps driven by the profiler are not part of the endpoint's stacks
+            frames = stack if not stack and function[2] in _DRIVER_FRAMES else stack + [_frame_name(function)]
+            if cumulative > 0:
+                own = time_on_path * self_time / cumulative
+                if own >= min_time:
+                    key = ";".join(frames)
+                    lines[key] = lines.get(key, 0.0) + own
+            if len(frames) >= max_depth:
+                return
+            on_path.add(function)
+            for callee, call_time in callees.get(function, ()):
+                if callee in on_path or callee not in entries or cumulative <= 0:
+                    continue
+                callee_time = time_on_path * call_time / cumulative
+                if callee_time >= min_time:
+                    walk(callee, frames, on_path, callee_time)
+            on_path.discard(function)
+
+        for function, (_, _, _, cumulative, callers) in entries.items():
+            if not callers and function[2] != _DISABLE_FRAME:
+                walk(function, [], set(), cumulative)
+
+        return "".join(
+            f"{stack} {round(seconds * 1e6)}\n"
+            for stack, seconds in sorted(lines.items())
+            if round(seconds * 1e6) > 0
+        )
+
+
+_DISABLE_FRAME = "<method 'disable' of '_lsprof.Profiler' objects>"
+_DRIVER_FRAMES = ("<method 'send' of 'coroutine' objects>", "<method 'throw' of 'coroutine' objects>")
+
+# On Python 3.12+ cProfile registers with the interpreter-wide `sys.monitoring`, where a
+# second enabled profiler raises ValueError, so one sample is taken at a time everywhere.
+_sampling = threading.Lock()
+
+def _frame_name(function: tuple) -> str:
+    return pstats.func_std_string(function).replace(";", ":")
+
+
+class _ProfiledCoroutine:
+    """
+    Runs a coroutine with a profiler enabled only while the coroutine itself is running,
+    not while other tasks run on the event loop during its awaits.
+    """
+
+    __slots__ = ("coroutine", "profile")
+
+    def __init__(self, coroutine, profile: cProfile.Profile):
+        self.coroutine = coroutine
+        self.profile = profile
+
+    def __await__(self):
+        value, error = None, None
+        while True:
+            self.profile.enable()
+            try:
+                if error is not None:
+                    yielded = self.coroutine.throw(error)
+                else:
+                    yielded = self.coroutine.send(value)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self.profile.disable()
+            try:
+                value, error = (yield yielded), None
+            except BaseException as e:
+                value, error = None, e
+
+
+class RouteProfiler:
+    """
+    Profiles a random sample of the requests of each route with `cProfile` and aggregates
+    the results per route.
+
+    Routes are profiled by creating their routers with `route_class=profiler.route_class`,
+    e.g. `APIRouter(route_class=profiler.route_class)` before passing the router to an
+    endpoints class, or with `create_anchor_app(profiler=...)`. The profile covers the
+    endpoint call: synchronous endpoints are profiled in the worker thread that runs them
+    and asynchronous ones only while their own coroutine runs, so concurrent requests do
+    not leak into each other's profiles. Request parsing and response serialization by
+    FastAPI are not included.
+
+    An unsampled request costs one random draw. Results are exposed by `ProfilerEndpoints`
+    as pstats files and collapsed stacks for flame graphs.
+
+    Only one request is profiled at a time in the process: a request drawn for sampling
+    while another is profiled runs unprofiled. Up to Python 3.11 each profiler only sees
+    its own thread; from Python 3.12 cProfile uses `sys.monitoring`, which allows a single
+    active profiler per interpreter, so concurrent samples are not possible there.
+
+    Example:
+        profiler = RouteProfiler(sample_rate=0.001, route_rates={"POST /auth": 0.05})
+        router = APIRouter(route_class=profiler.route_class)
+        Sep10Endpoints(sep10_handler, router)
+
+    Attributes:
+        sample_rate (float): Fraction of the requests profiled on routes without their own rate.
+        route_rates (dict[str, float]): Fraction of the requests profiled, by "METHOD /path" route.
+        route_class (type[APIRoute]): Route class that profiles with this profiler.
+
+    Args:
+        sample_rate (float, optional): Default fraction of requests profiled. Defaults to 0.01.
+        route_rates (dict[str, float], optional): Fraction per route, e.g. {"GET /kyc/customer": 0.1}.
+    """
+
+    def __init__(self, sample_rate: float = 0.01, route_rates: dict[str, float] = None):
+        self.sample_rate = sample_rate
+        self.route_rates = dict(route_rates or {})
+        self._profiles: dict[str, RouteProfile] = {}
+        self._lock = threading.Lock()
+        self.route_class = type("ProfiledAPIRoute", (ProfiledAPIRoute,), {"profiler": self})
+
+    def rate(self, route: str) -> float:
+        return self.route_rates.get(route, self.sample_rate)
+
+    def set_rate(self, route: str, rate: float):
+        """
+        Changes the fraction of requests profiled on `route`, taking effect on its next request.
+        """
+        self.route_rates[route] = rate
+
+    def profiles(self) -> dict[str, RouteProfile]:
+        with self._lock:
+            return dict(self._profiles)
+
+    def get(self, route: str) -> Optional[RouteProfile]:
+        return self._profiles.get(route)
+
+    def reset(self, route: str = None):
+        """
+        Discards the profiles of `route`, or of every route.
+        """
+        with self._lock:
+            if route is None:
+                self._profiles.clear()
+            else:
+                self._profiles.pop(route, None)
+
+    def record(self, route: str, profile: cProfile.Profile, elapsed: float):
+        with self._lock:
+            route_profile = self._profiles.get(route)
+            if route_profile is None:
+                route_profile = self._profiles[route] = RouteProfile(route)
+        route_profile.add(profile, elapsed)
+
+    def wrap(self, route: str, endpoint: Callable) -> Callable:
+        """
+        Wraps an endpoint so a sample of its calls is profiled under `route`.
+        """
+        sample = random.random
+        rates = self.route_rates
+
+        if asyncio.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def profiled_async_endpoint(*args, **kwargs):
+                if sample() >= rates.get(route, self.sample_rate) or not _sampling.acquire(blocking=False):
+                    return await endpoint(*args, **kwargs)
+                profile = cProfile.Profile()
+                started = time.perf_counter()
+                try:
+                    return await _ProfiledCoroutine(endpoint(*args, **kwargs), profile)
+                finally:
+                    _sampling.release()
+                    self.record(route, profile, time.perf_counter() - started)
+
+            profiled_async_endpoint.profiled_route = route
+            return profiled_async_endpoint
+
+        @functools.wraps(endpoint)
+        def profiled_endpoint(*args, **kwargs):
+            if sample() >= rates.get(route, self.sample_rate) or not _sampling.acquire(blocking=False):
+                return endpoint(*args, **kwargs)
+            profile = cProfile.Profile()
+            started = time.perf_counter()
+            try:
+                profile.enable()
+                try:
+                    return endpoint(*args, **kwargs)
+                finally:
+                    profile.disable()
+            finally:
+                _sampling.release()
+                self.record(route, profile, time.perf_counter() - started)
+
+        profiled_endpoint.profiled_route = route
+        return profiled_endpoint
+
+
+class ProfiledAPIRoute(APIRoute):
+    """
+    `APIRoute` whose endpoint is sampled by the `RouteProfiler` it was created from, with
+    `RouteProfiler.route_class`. Each method of the route is profiled as "METHOD /path",
+    the path including the prefixes of the routers it was included in.
+    """
+
+    profiler: RouteProfiler
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        # routes are re-created with their prefix when a router is included in another
+        endpoint = getattr(endpoint, "__wrapped__", endpoint) if hasattr(endpoint, "profiled_route") else endpoint
+        methods = kwargs.get("methods") or ["GET"]
+        route = f"{','.join(sorted(method.upper() for method in methods))} {path}"
+        super().__init__(path, self.profiler.wrap(route, endpoint), **kwargs)
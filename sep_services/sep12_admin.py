@@ -0,0 +1,109 @@
+from typing import Callable
+from anchor_sdk.models import AnchorUser, FieldStatusUpdate, CustomerStatusChange
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from anchor_sdk.sep_serializations.sep12_schemas import Sep12SchemaRegistry
+from anchor_sdk.util import sep12_fields_to_json, sep12_status_from_fields
+
+class Sep12StatusService:
+    """
+    Applies back-office field status transitions to many customers in batched operations.
+
+    Each batch of up to `batch_size` customers is written with one call to the handler's
+    `update_field_statuses`. The customer status is then recomputed from the returned
+    fields with the same rules as `GET /customer`, including the declared fields of the
+    customer type when the handler returns it, and the whole batch is notified with one
+    call to `notify_status_changes`.
+
+    Listeners registered with `add_listener` are called with (account_id, memo_id) for each
+    updated customer; register `Sep12Endpoints.invalidate_customer` when responses are cached.
+
+    Attributes:
+        handler (Sep12Handler): Handler storing the field statuses.
+        batch_size (int): Maximum number of customers per handler call.
+        schemas (Sep12SchemaRegistry): Compiled customer type declarations of the handler.
+
+    Args:
+        handler (Sep12Handler): Handler storing the field statuses.
+        batch_size (int, optional): Customers per handler call. Defaults to 1000.
+        schemas (Sep12SchemaRegistry, optional): Compiled declarations, e.g. those of
+            `Sep12Endpoints.schemas`. Defaults to compiling `handler.customer_types()`.
+    """
+
+    def __init__(self, handler: Sep12Handler, batch_size: int = 1000, schemas: Sep12SchemaRegistry = None):
+        self.handler = handler
+        self.batch_size = batch_size
+        self.schemas = schemas if schemas is not None else Sep12SchemaRegistry(handler.customer_types())
+        self._listeners: list[Callable[[str, int], None]] = []
+
+    def add_listener(self, listener: Callable[[str, int], None]):
+        """
+        Registers a callable invoked with (account_id, memo_id) after a customer's statuses changed.
+        """
+        self._listeners.append(listener)
+
+    def apply(self, updates: list[tuple[AnchorUser, list[FieldStatusUpdate]]]) -> list[CustomerStatusChange]:
+        """
+        Applies field status transitions with a synchronous `Sep12Handler`.
+
+        Args:
+            updates (list[tuple[AnchorUser, list[FieldStatusUpdate]]]): Transitions per customer.
+
+        Returns:
+            list[CustomerStatusChange]: The recomputed status of each customer, in input order.
+        """
+        changes = []
+        for batch in self._batches(updates):
+            changes_batch = self._changes(batch, self.handler.update_field_statuses(batch))
+            self.handler.notify_status_changes(changes_batch)
+            self._notify_listeners(changes_batch)
+            changes.extend(changes_batch)
+        return changes
+
+    async def apply_async(self, updates: list[tuple[AnchorUser, list[FieldStatusUpdate]]]) -> list[CustomerStatusChange]:
+        """
+        Applies field status transitions with an `AsyncSep12Handler`.
+
+        Args:
+            updates (list[tuple[AnchorUser, list[FieldStatusUpdate]]]): Transitions per customer.
+
+        Returns:
+            list[CustomerStatusChange]: The recomputed status of each customer, in input order.
+        """
+        changes = []
+        for batch in self._batches(updates):
+            changes_batch = self._changes(batch, await self.handler.update_field_statuses(batch))
+            await self.handler.notify_status_changes(changes_batch)
+            self._notify_listeners(changes_batch)
+            changes.extend(changes_batch)
+        return changes
+
+    def _batches(self, updates: list):
+        for start in range(0, len(updates), self.batch_size):
+            yield updates[start:start + self.batch_size]
+
+    def _changes(self, batch: list, results: list) -> list[CustomerStatusChange]:
+        if len(results) != len(batch):
+            raise ValueError("update_field_statuses must return one result per customer")
+
+        changes = []
+        for (user, _), (customer_id, fields, *customer_type) in zip(batch, results):
+            required_fields, provided_fields = sep12_fields_to_json(fields, self._template(*customer_type))
+            changes.append(CustomerStatusChange(
+                user,
+                customer_id,
+                sep12_status_from_fields(required_fields, provided_fields)
+            ))
+        return changes
+
+    def _template(self, customer_type: str = None) -> dict:
+        if customer_type is None:
+            return None
+        compiled = self.schemas.types.get(customer_type)
+        if compiled is None:
+            raise ValueError(f"update_field_statuses returned the undeclared customer type '{customer_type}'")
+        return compiled.fields_template
+
+    def _notify_listeners(self, changes: list[CustomerStatusChange]):
+        for change in changes:
+            for listener in self._listeners:
+                listener(change.user.account_id, change.user.memo_id)
@@ -0,0 +1,251 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from anchor_sdk.sep_services.shared_cache import CacheBackend
+
+class CachedCustomerResponse:
+    """
+    An encoded `GET /customer` response body and its ETag.
+
+    Attributes:
+        body (bytes): The encoded JSON response.
+        etag (str): Strong ETag of `body`, quoted as sent in the `ETag` header.
+        expires_at (float): UNIX timestamp after which the entry is ignored.
+    """
+    __slots__ = ("body", "etag", "expires_at")
+
+    def __init__(self, body: bytes, expires_at: float):
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self.expires_at = expires_at
+
+
+class CustomerResponseCache:
+    """
+    LRU cache of encoded `GET /customer` responses keyed by (account, memo, type, lang).
+
+    Entries are dropped when the customer's data changes: `Sep12Endpoints` invalidates a
+    customer after `process_submitted_fields`, and integrators call `invalidate_customer`
+    after changing a customer's status out of band. A generation number read before the
+    handler call prevents a response computed before an invalidation from being stored
+    after it. The TTL bounds staleness if an invalidation is ever missed.
+
+    Each invalidation takes the next value of a global counter as the customer's
+    generation. Only the `max_generations` most recently invalidated customers are
+    remembered; the others read the generation of the last one forgotten, which is at
+    least their own, so forgetting a customer never lets a stale response in.
+
+    Attributes:
+        max_entries (int): Maximum number of cached responses.
+        max_generations (int): Maximum number of customer generations remembered.
+        ttl (float): Lifetime of an entry in seconds.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to reach the handler.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached responses. Defaults to 10000.
+        ttl (float, optional): Entry lifetime in seconds. Defaults to 30.
+        max_generations (int, optional): Customer generations remembered. Defaults to `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 30, max_generations: int = None):
+        self.max_entries = max_entries
+        self.max_generations = max_generations if max_generations is not None else max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._keys_by_customer: dict[tuple, set] = {}
+        self._generations: OrderedDict = OrderedDict()
+        self._last_generation = 0
+        self._forgotten_generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def customer_key(account_id: str, memo_id: int = 0) -> tuple:
+        return (account_id, int(memo_id or 0))
+
+    def generation(self, account_id: str, memo_id: int = 0) -> int:
+        """
+        Returns the customer's current generation, to be passed back to `put`. Read it
+        before calling the handler.
+        """
+        return self._generations.get(self.customer_key(account_id, memo_id), self._forgotten_generation)
+
+    def get(self, account_id: str, memo_id: int, customer_type: str, lang: str) -> Optional[CachedCustomerResponse]:
+        key = (account_id, int(memo_id or 0), customer_type, lang)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.time():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        account_id: str,
+        memo_id: int,
+        customer_type: str,
+        lang: str,
+        body: bytes,
+        generation: int
+    ) -> CachedCustomerResponse:
+        """
+        Stores a response, unless the customer was invalidated since `generation` was read.
+
+        Returns:
+            CachedCustomerResponse: The entry for `body`, whether or not it was stored.
+        """
+        customer = self.customer_key(account_id, memo_id)
+        key = customer + (customer_type, lang)
+        entry = CachedCustomerResponse(body, time.time() + self.ttl)
+
+        with self._lock:
+            if self._generations.get(customer, self._forgotten_generation) != generation:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._keys_by_customer.setdefault(customer, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._forget_key(evicted_key)
+        return entry
+
+    def invalidate_customer(self, account_id: str, memo_id: int = 0):
+        """
+        Drops every cached response of the customer, for all types and languages.
+
+        Args:
+            account_id (str): The customer's Stellar account.
+            memo_id (int, optional): The customer's memo, for shared accounts. Defaults to 0.
+        """
+        customer = self.customer_key(account_id, memo_id)
+        with self._lock:
+            self._last_generation += 1
+            self._generations[customer] = self._last_generation
+            self._generations.move_to_end(customer)
+            while len(self._generations) > self.max_generations:
+                _, self._forgotten_generation = self._generations.popitem(last=False)
+            for key in self._keys_by_customer.pop(customer, ()):
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._last_generation += 1
+            self._forgotten_generation = self._last_generation
+            self._generations.clear()
+            self._entries.clear()
+            self._keys_by_customer.clear()
+
+    def _forget_key(self, key: tuple):
+        customer = key[:2]
+        keys = self._keys_by_customer.get(customer)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_customer[customer]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SharedCustomerResponseCache(CustomerResponseCache):
+    """
+    `CustomerResponseCache` stored in a `CacheBackend`, e.g. an `MmapCache`, so every
+    worker of a host serves and invalidates the same `GET /customer` responses.
+
+    A customer's generation is the time of its last invalidation, kept in the backend
+    for one TTL, and is part of the key of its responses: invalidating a customer in any
+    worker makes its cached responses unreachable in all of them. Generations are stored
+    pinned, so the backend evicts responses but never a live generation; when a
+    generation cannot be stored at all, every customer is invalidated instead.
+
+    Responses the backend cannot store, e.g. larger than an `MmapCache` slot, are kept
+    in a small LRU of this worker under the same key, so they are still invalidated by
+    the shared generations.
+
+    Attributes:
+        backend (CacheBackend): The shared store.
+        ttl (float): Lifetime of an entry in seconds.
+        max_local_entries (int): Maximum number of responses kept in this worker.
+        hits (int): Number of lookups answered from the cache by this worker.
+        misses (int): Number of lookups of this worker that had to reach the handler.
+
+    Args:
+        backend (CacheBackend): The shared store.
+        ttl (float, optional): Entry lifetime in seconds. Defaults to 30.
+        max_local_entries (int, optional): Responses kept in this worker. Defaults to 1000.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float = 30, max_local_entries: int = 1000):
+        self.backend = backend
+        self.ttl = ttl
+        self.max_local_entries = max_local_entries
+        self.hits = 0
+        self.misses = 0
+        self._local: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def generation(self, account_id: str, memo_id: int = 0) -> int:
+        generation = self.backend.get(f"sep12:generation:{account_id}:{int(memo_id or 0)}")
+        return int(generation) if generation is not None else 0
+
+    def _key(self, account_id: str, memo_id: int, customer_type: str, lang: str, generation: int) -> str:
+        epoch = self.backend.get("sep12:epoch") or b"0"
+        return f"sep12:customer:{epoch.decode()}:{account_id}:{int(memo_id or 0)}:{generation}:{customer_type}:{lang}"
+
+    def get(self, account_id: str, memo_id: int, customer_type: str, lang: str) -> Optional[CachedCustomerResponse]:
+        key = self._key(account_id, memo_id, customer_type, lang, self.generation(account_id, memo_id))
+        body = self.backend.get(key)
+        if body is not None:
+            self.hits += 1
+            return CachedCustomerResponse(body, time.time() + self.ttl)
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None or entry.expires_at <= time.time():
+                self.misses += 1
+                return None
+            self._local.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        account_id: str,
+        memo_id: int,
+        customer_type: str,
+        lang: str,
+        body: bytes,
+        generation: int
+    ) -> CachedCustomerResponse:
+        key = self._key(account_id, memo_id, customer_type, lang, generation)
+        entry = CachedCustomerResponse(body, time.time() + self.ttl)
+        if not self.backend.set(key, body, self.ttl):
+            with self._lock:
+                self._local[key] = entry
+                self._local.move_to_end(key)
+                while len(self._local) > self.max_local_entries:
+                    self._local.popitem(last=False)
+        return entry
+
+    def invalidate_customer(self, account_id: str, memo_id: int = 0):
+        if not self.backend.set(
+            f"sep12:generation:{account_id}:{int(memo_id or 0)}",
+            str(time.time_ns()).encode(),
+            self.ttl,
+            pinned=True
+        ):
+            self.clear()
+
+    def clear(self):
+        self.backend.set("sep12:epoch", str(time.time_ns()).encode(), self.ttl, pinned=True)
+        with self._lock:
+            self._local.clear()
+
+    def __len__(self) -> int:
+        raise TypeError("The size of a shared response cache is not tracked")
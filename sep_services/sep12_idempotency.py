@@ -0,0 +1,235 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Optional
+from anchor_sdk.exceptions import Sep12KycError
+from anchor_sdk.sep_services.blob_store import BlobHandle
+
+def _canonical_value(value):
+    if isinstance(value, (bytes, bytearray)):
+        return "sha256:" + hashlib.sha256(value).hexdigest()
+    if isinstance(value, (BlobHandle, date)):
+        return str(value)
+    return value
+
+def fingerprint_fields(fields: dict) -> str:
+    """
+    Returns a digest of a SEP-9 field set that does not depend on key order or value encoding
+    of binary fields (raw bytes and their blob handle give the same digest).
+    """
+    canonical = json.dumps(
+        {name: _canonical_value(value) for name, value in fields.items()},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+class _PendingSubmission:
+    __slots__ = ("fingerprint", "keys", "done")
+
+    def __init__(self, fingerprint: str, keys: tuple):
+        self.fingerprint = fingerprint
+        self.keys = keys
+        self.done = threading.Event()
+
+
+class SubmissionIndex:
+    """
+    Bounded index of recent `PUT /customer` submissions, used to answer resent requests
+    without calling the handler again.
+
+    Two kinds of entries are kept, both expiring after `ttl` seconds:
+    - the fingerprint of the last submission per (account, memo, type): a request with
+      the same fingerprint is an exact duplicate and receives the same customer id;
+    - the fingerprint per `Idempotency-Key` and customer: a replayed key receives the
+      same customer id, and reusing a key for a different payload is rejected.
+
+    Only the most recent submission per customer and type is remembered, so sending an
+    older payload again after a newer one is processed normally.
+
+    `reserve` also marks a submission as in flight until it is recorded or released, so
+    an identical request arriving meanwhile waits for its customer id instead of being
+    processed a second time.
+
+    Attributes:
+        max_entries (int): Maximum number of remembered submissions and keys.
+        ttl (float): Lifetime of an entry in seconds.
+        duplicates (int): Number of submissions answered from the index.
+
+    Args:
+        max_entries (int, optional): Maximum number of entries. Defaults to 100000.
+        ttl (float, optional): Entry lifetime in seconds. Defaults to 600.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl: float = 600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.duplicates = 0
+        self._entries: OrderedDict = OrderedDict()
+        # in-flight submissions by (submission key, fingerprint) and by idempotency key
+        self._pending: dict[tuple, _PendingSubmission] = {}
+        self._keys_by_customer: dict[tuple, set] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _keys(account_id: str, memo_id: int, customer_type: str, idempotency_key: str = None) -> tuple:
+        customer = (account_id, int(memo_id or 0))
+        submission_key = ("fields",) + customer + (customer_type,)
+        key = ("key",) + customer + (idempotency_key,) if idempotency_key else None
+        return submission_key, key
+
+    def lookup(
+        self,
+        account_id: str,
+        memo_id: int,
+        customer_type: str,
+        fingerprint: str,
+        idempotency_key: str = None
+    ) -> Optional[str]:
+        """
+        Returns the customer id of an identical recent submission, or None.
+
+        Raises:
+            Sep12KycError: If `idempotency_key` was already used with a different payload.
+        """
+        submission_key, key = self._keys(account_id, memo_id, customer_type, idempotency_key)
+        with self._lock:
+            return self._lookup(submission_key, key, fingerprint)
+
+    def reserve(
+        self,
+        account_id: str,
+        memo_id: int,
+        customer_type: str,
+        fingerprint: str,
+        idempotency_key: str = None,
+        timeout: float = 30
+    ) -> Optional[str]:
+        """
+        Returns the customer id of an identical recent submission, waiting for it while it
+        is being processed. Otherwise marks the submission as in flight and returns None;
+        the caller must then `record` or `release` it.
+
+        Raises:
+            Sep12KycError: If `idempotency_key` was already used with a different payload,
+                or an identical submission is still being processed after `timeout` seconds.
+        """
+        submission_key, key = self._keys(account_id, memo_id, customer_type, idempotency_key)
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                customer_id = self._lookup(submission_key, key, fingerprint)
+                if customer_id is not None:
+                    return customer_id
+
+                pending = self._pending.get(key) if key is not None else None
+                if pending is not None and pending.fingerprint != fingerprint:
+                    raise Sep12KycError(422, "Idempotency-Key was already used with a different request")
+                if pending is None:
+                    pending = self._pending.get((submission_key, fingerprint))
+                if pending is None:
+                    pending_keys = ((submission_key, fingerprint),) + ((key,) if key is not None else ())
+                    reservation = _PendingSubmission(fingerprint, pending_keys)
+                    for pending_key in pending_keys:
+                        self._pending[pending_key] = reservation
+                    return None
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not pending.done.wait(remaining):
+                raise Sep12KycError(409, "An identical submission is still being processed")
+
+    def release(
+        self,
+        account_id: str,
+        memo_id: int,
+        customer_type: str,
+        fingerprint: str,
+        idempotency_key: str = None
+    ):
+        """
+        Ends the reservation of a submission that failed, so a retry is processed.
+        """
+        with self._lock:
+            self._end_reservation(self._keys(account_id, memo_id, customer_type, idempotency_key), fingerprint)
+
+    def record(
+        self,
+        account_id: str,
+        memo_id: int,
+        customer_type: str,
+        fingerprint: str,
+        customer_id: str,
+        idempotency_key: str = None
+    ):
+        """
+        Remembers a processed submission and the customer id it was answered with.
+        """
+        expires_at = time.time() + self.ttl
+        keys = self._keys(account_id, memo_id, customer_type, idempotency_key)
+        with self._lock:
+            for key in keys:
+                if key is None:
+                    continue
+                self._entries[key] = (fingerprint, customer_id, expires_at)
+                self._entries.move_to_end(key)
+                self._keys_by_customer.setdefault(key[1:3], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._forget_key(evicted_key)
+            self._end_reservation(keys, fingerprint)
+
+    def forget_customer(self, account_id: str, memo_id: int = 0):
+        """
+        Drops the remembered submissions of a customer, so the next submission reaches the handler.
+        """
+        with self._lock:
+            for key in self._keys_by_customer.pop((account_id, int(memo_id or 0)), ()):
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_customer.clear()
+
+    def _lookup(self, submission_key: tuple, key: Optional[tuple], fingerprint: str) -> Optional[str]:
+        now = time.time()
+        if key is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                if entry[0] != fingerprint:
+                    raise Sep12KycError(422, "Idempotency-Key was already used with a different request")
+                self.duplicates += 1
+                return entry[1]
+
+        entry = self._entries.get(submission_key)
+        if entry is not None and entry[2] > now and entry[0] == fingerprint:
+            self.duplicates += 1
+            return entry[1]
+        return None
+
+    def _end_reservation(self, keys: tuple, fingerprint: str):
+        submission_key, key = keys
+        for pending_key in ((submission_key, fingerprint), key):
+            pending = self._pending.get(pending_key) if pending_key is not None else None
+            if pending is None or pending.fingerprint != fingerprint:
+                continue
+            for reserved_key in pending.keys:
+                if self._pending.get(reserved_key) is pending:
+                    del self._pending[reserved_key]
+            pending.done.set()
+
+    def _forget_key(self, key: tuple):
+        customer = key[1:3]
+        keys = self._keys_by_customer.get(customer)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_customer[customer]
+
+    def __len__(self) -> int:
+        return len(self._entries)
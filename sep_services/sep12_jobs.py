@@ -0,0 +1,439 @@
+import asyncio
+import base64
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import date
+from typing import Callable, Optional
+from anchor_sdk.exceptions import MethodNotImplementedError
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler, AsyncSep12Handler
+from anchor_sdk.sep_services.blob_store import BlobHandle
+
+logger = logging.getLogger(__name__)
+
+class KycJob:
+    """
+    A submission of SEP-12 fields waiting for `process_submitted_fields`.
+
+    Attributes:
+        id (str): The job id.
+        customer_id (str): The customer id returned to the wallet by `accept_submission`.
+        account_id (str): The customer's Stellar account.
+        memo_id (int): The customer's memo, for shared accounts.
+        client_domain (str): The wallet's client domain, if the token had one.
+        customer_type (str): The SEP-12 customer type, if given.
+        fields (dict): The submitted fields.
+        attempts (int): Number of processing attempts already made.
+    """
+    __slots__ = ("id", "customer_id", "account_id", "memo_id", "client_domain", "customer_type", "fields", "attempts")
+
+    def __init__(
+        self,
+        customer_id: str,
+        account_id: str,
+        memo_id: int,
+        client_domain: Optional[str],
+        customer_type: Optional[str],
+        fields: dict,
+        attempts: int = 0,
+        id: str = None
+    ):
+        self.id = id or str(uuid.uuid4())
+        self.customer_id = customer_id
+        self.account_id = account_id
+        self.memo_id = int(memo_id or 0)
+        self.client_domain = client_domain
+        self.customer_type = customer_type
+        self.fields = fields
+        self.attempts = attempts
+
+    @property
+    def user(self) -> AnchorUser:
+        return AnchorUser(self.account_id, self.memo_id, self.client_domain)
+
+
+class KycJobQueue:
+    """
+    Durable storage of pending `KycJob`s.
+
+    Integrators extend this class to keep jobs in their own broker or database. A claimed
+    job must become claimable again if it is neither completed nor retried within the
+    queue's lease, so jobs of a crashed process are not lost.
+
+    Methods:
+        enqueue(job: KycJob):
+            Persists a new job.
+        claim() -> Optional[KycJob]:
+            Atomically takes the oldest due job, or returns None.
+        complete(job: KycJob):
+            Removes a processed job.
+        retry(job: KycJob, error: str, delay: float):
+            Makes a failed job claimable again after `delay` seconds.
+        fail(job: KycJob, error: str):
+            Marks a job as permanently failed.
+        pending() -> int:
+            Returns the number of jobs waiting or being processed.
+        delete_customer_jobs(customers: list[AnchorUser]) -> int:
+            Deletes the jobs of the customers that no processor holds, e.g. when their data is purged.
+        processing_customers(customers: list[AnchorUser]) -> list[AnchorUser]:
+            Returns the customers with a job currently held by a processor.
+    """
+
+    def enqueue(self, job: KycJob):
+        raise MethodNotImplementedError("sep12", "enqueue")
+
+    def claim(self) -> Optional[KycJob]:
+        raise MethodNotImplementedError("sep12", "claim")
+
+    def complete(self, job: KycJob):
+        raise MethodNotImplementedError("sep12", "complete")
+
+    def retry(self, job: KycJob, error: str, delay: float):
+        raise MethodNotImplementedError("sep12", "retry")
+
+    def fail(self, job: KycJob, error: str):
+        raise MethodNotImplementedError("sep12", "fail")
+
+    def pending(self) -> int:
+        raise MethodNotImplementedError("sep12", "pending")
+
+    def delete_customer_jobs(self, customers: list[AnchorUser]) -> int:
+        raise MethodNotImplementedError("sep12", "delete_customer_jobs")
+
+    def processing_customers(self, customers: list[AnchorUser]) -> list[AnchorUser]:
+        raise MethodNotImplementedError("sep12", "processing_customers")
+
+
+def _encode_value(value):
+    if isinstance(value, BlobHandle):
+        return {"$blob": str(value), "size": value.size}
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    return value
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "$blob" in value:
+            return BlobHandle(BlobHandle.parse(value["$blob"]).digest, value.get("size"))
+        if "$bytes" in value:
+            return base64.b64decode(value["$bytes"])
+        if "$date" in value:
+            return date.fromisoformat(value["$date"])
+    return value
+
+def encode_fields(fields: dict) -> str:
+    return json.dumps({name: _encode_value(value) for name, value in fields.items()})
+
+def decode_fields(encoded: str) -> dict:
+    return {name: _decode_value(value) for name, value in json.loads(encoded).items()}
+
+
+class SqliteKycJobQueue(KycJobQueue):
+    """
+    `KycJobQueue` stored in a SQLite database file.
+
+    The file may be shared by several processes on the same host: claims run in an
+    immediate transaction, and a claimed job becomes claimable again once its lease
+    expires. A customer's jobs are claimed one at a time in submission order, so an
+    older submission never overwrites a newer one. Completed jobs are deleted;
+    permanently failed jobs are kept with their last error for inspection.
+
+    Args:
+        path (str, optional): Database file. Defaults to "kyc_jobs.sqlite3".
+        lease (float, optional): Seconds a claimed job stays reserved. Defaults to 300.
+    """
+
+    def __init__(self, path: str = "kyc_jobs.sqlite3", lease: float = 300):
+        self.path = path
+        self.lease = lease
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS kyc_jobs ("
+                "id TEXT PRIMARY KEY, customer_id TEXT, account_id TEXT NOT NULL, memo_id INTEGER NOT NULL, "
+                "client_domain TEXT, customer_type TEXT, fields TEXT NOT NULL, "
+                "state TEXT NOT NULL, attempts INTEGER NOT NULL, run_at REAL NOT NULL, error TEXT, created_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS kyc_jobs_due ON kyc_jobs (state, run_at)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS kyc_jobs_customer ON kyc_jobs (account_id, memo_id)")
+
+    def enqueue(self, job: KycJob):
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO kyc_jobs VALUES (?, ?, ?, ?, ?, ?, ?, 'queued', ?, ?, NULL, ?)",
+                (
+                    job.id, job.customer_id, job.account_id, job.memo_id, job.client_domain,
+                    job.customer_type, encode_fields(job.fields), job.attempts, now, now
+                )
+            )
+
+    def claim(self) -> Optional[KycJob]:
+        now = time.time()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT id, customer_id, account_id, memo_id, client_domain, customer_type, fields, attempts "
+                    "FROM kyc_jobs AS job WHERE state IN ('queued', 'running') AND run_at <= ? "
+                    # skip customers with a leased job or an older job still waiting
+                    "AND NOT EXISTS (SELECT 1 FROM kyc_jobs AS other "
+                    "WHERE other.account_id = job.account_id AND other.memo_id = job.memo_id AND other.id != job.id "
+                    "AND ((other.state = 'running' AND other.run_at > ?) "
+                    "OR (other.state IN ('queued', 'running') AND other.rowid < job.rowid))) "
+                    "ORDER BY run_at LIMIT 1",
+                    (now, now)
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE kyc_jobs SET state = 'running', run_at = ? WHERE id = ?",
+                        (now + self.lease, row[0])
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        id, customer_id, account_id, memo_id, client_domain, customer_type, fields, attempts = row
+        return KycJob(customer_id, account_id, memo_id, client_domain, customer_type, decode_fields(fields), attempts, id)
+
+    def complete(self, job: KycJob):
+        with self._lock:
+            self._connection.execute("DELETE FROM kyc_jobs WHERE id = ?", (job.id,))
+
+    def retry(self, job: KycJob, error: str, delay: float):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE kyc_jobs SET state = 'queued', attempts = ?, run_at = ?, error = ? WHERE id = ?",
+                (job.attempts, time.time() + delay, error, job.id)
+            )
+
+    def fail(self, job: KycJob, error: str):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE kyc_jobs SET state = 'failed', attempts = ?, error = ? WHERE id = ?",
+                (job.attempts, error, job.id)
+            )
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM kyc_jobs WHERE state IN ('queued', 'running')"
+            ).fetchone()[0]
+
+    def delete_customer_jobs(self, customers: list[AnchorUser]) -> int:
+        now = time.time()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                deleted = 0
+                for customer in customers:
+                    # a leased job is being processed; its processor completes it
+                    deleted += connection.execute(
+                        "DELETE FROM kyc_jobs WHERE account_id = ? AND memo_id = ? "
+                        "AND NOT (state = 'running' AND run_at > ?)",
+                        (customer.account_id, int(customer.memo_id or 0), now)
+                    ).rowcount
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return deleted
+
+    def processing_customers(self, customers: list[AnchorUser]) -> list[AnchorUser]:
+        now = time.time()
+        with self._lock:
+            return [
+                customer for customer in customers
+                if self._connection.execute(
+                    "SELECT 1 FROM kyc_jobs WHERE account_id = ? AND memo_id = ? AND state = 'running' AND run_at > ?",
+                    (customer.account_id, int(customer.memo_id or 0), now)
+                ).fetchone() is not None
+            ]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class KycProcessor:
+    """
+    Runs `process_submitted_fields` for queued SEP-12 submissions on a pool of worker threads.
+
+    With a processor, `PUT /customer` only calls the handler's `accept_submission`, which
+    records the fields as processing and returns the customer id, then enqueues the
+    submission and answers at once. `GET /customer` reports the customer as `PROCESSING`
+    through those field statuses until the handler's processing updates them.
+
+    A failing job is retried with exponential backoff; after `max_attempts` the handler's
+    `processing_failed` is called so it can reject the fields or request verification.
+    Listeners registered with `add_listener` are called with (account_id, memo_id) after
+    each job, e.g. to invalidate cached `GET /customer` responses.
+
+    An `AsyncSep12Handler` is run on an event loop owned by each worker thread. Errors of
+    the queue itself are logged and the worker backs off, up to `max_backoff` seconds,
+    before trying again.
+
+    Attributes:
+        handler (Sep12Handler): Handler processing the submissions.
+        queue (KycJobQueue): Durable job storage.
+        concurrency (int): Number of worker threads, i.e. jobs processed at once.
+        max_attempts (int): Attempts before a job is failed.
+        retry_delay (float): Delay before the first retry, doubled for each further attempt.
+        poll_interval (float): Seconds an idle worker waits before polling the queue again.
+        max_backoff (float): Longest wait of a worker after consecutive queue errors.
+        processed (int): Number of jobs processed successfully.
+        failed (int): Number of jobs failed permanently.
+
+    Args:
+        handler (Sep12Handler): Handler processing the submissions.
+        queue (KycJobQueue, optional): Durable job storage. Defaults to a `SqliteKycJobQueue`.
+        concurrency (int, optional): Number of worker threads. Defaults to 4.
+        max_attempts (int, optional): Attempts before a job is failed. Defaults to 5.
+        retry_delay (float, optional): First retry delay in seconds. Defaults to 5.
+        poll_interval (float, optional): Idle polling interval in seconds. Defaults to 1.
+        max_backoff (float, optional): Longest wait after queue errors in seconds. Defaults to 60.
+    """
+
+    def __init__(
+        self,
+        handler: Sep12Handler,
+        queue: KycJobQueue = None,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        retry_delay: float = 5,
+        poll_interval: float = 1,
+        max_backoff: float = 60
+    ):
+        self.handler = handler
+        self.queue = queue if queue is not None else SqliteKycJobQueue()
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.processed = 0
+        self.failed = 0
+        self._is_async = isinstance(handler, AsyncSep12Handler)
+        self._listeners: list[Callable[[str, int], None]] = []
+        self._counter_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def add_listener(self, listener: Callable[[str, int], None]):
+        """
+        Registers a callable invoked with (account_id, memo_id) after a job is processed or failed.
+        """
+        self._listeners.append(listener)
+
+    def start(self):
+        """
+        Starts the worker threads. Jobs left in a durable queue by a previous run are resumed.
+        """
+        if self._threads:
+            return
+        self._stopped.clear()
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._run, name=f"hitch-kyc-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """
+        Stops the workers after their current job. Unprocessed jobs stay in the queue.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, user: AnchorUser, fields: dict, customer_type: str, customer_id: str) -> KycJob:
+        """
+        Persists a submission for background processing and wakes a worker.
+
+        Args:
+            user (AnchorUser): The submitting customer.
+            fields (dict): The validated submitted fields.
+            customer_type (str): The SEP-12 customer type, if given.
+            customer_id (str): The id returned by the handler's `accept_submission`.
+
+        Returns:
+            KycJob: The queued job.
+        """
+        job = KycJob(customer_id, user.account_id, user.memo_id, user.client_domain, customer_type, fields)
+        self.queue.enqueue(job)
+        self._wakeup.set()
+        return job
+
+    def _run(self):
+        loop = asyncio.new_event_loop() if self._is_async else None
+        errors = 0
+        try:
+            while not self._stopped.is_set():
+                try:
+                    job = self.queue.claim()
+                    if job is not None:
+                        self._process(job, loop)
+                except Exception:
+                    # an unsettled job is claimed again once its lease expires
+                    logger.exception("KYC job queue failed")
+                    errors += 1
+                    self._stopped.wait(min(self.poll_interval * 2 ** errors, self.max_backoff))
+                    continue
+                errors = 0
+                if job is None:
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+        finally:
+            if loop is not None:
+                loop.close()
+
+    def _call(self, loop, method, *args):
+        result = method(*args)
+        return loop.run_until_complete(result) if loop is not None else result
+
+    def _process(self, job: KycJob, loop):
+        user = job.user
+        job.attempts += 1
+        try:
+            if job.customer_type is not None:
+                self._call(loop, self.handler.process_submitted_fields, user, job.fields, job.customer_type)
+            else:
+                self._call(loop, self.handler.process_submitted_fields, user, job.fields)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job.attempts < self.max_attempts:
+                self.queue.retry(job, error, self.retry_delay * 2 ** (job.attempts - 1))
+                return
+            self.queue.fail(job, error)
+            with self._counter_lock:
+                self.failed += 1
+            try:
+                self._call(loop, self.handler.processing_failed, user, job.customer_id, job.customer_type, error)
+            except Exception:
+                logger.exception("processing_failed failed for KYC job %s", job.id)
+        else:
+            self.queue.complete(job)
+            with self._counter_lock:
+                self.processed += 1
+
+        for listener in self._listeners:
+            try:
+                listener(job.account_id, job.memo_id)
+            except Exception:
+                logger.exception("KYC job listener failed for job %s", job.id)
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+from anchor_sdk.exceptions import MethodNotImplementedError
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler, AsyncSep12Handler
+from anchor_sdk.sep_services.blob_store import BlobStore
+from anchor_sdk.sep_services.sep12_jobs import KycJobQueue
+
+logger = logging.getLogger(__name__)
+
+class CustomerPurgeQueue:
+    """
+    Durable storage of the customers waiting to be purged.
+
+    Integrators extend this class to keep the queue in their own database. Customers are
+    deduplicated per (account, memo), and claimed customers must become claimable again if
+    they are neither completed nor retried within the queue's lease, so requests of a
+    crashed process are not lost.
+
+    Methods:
+        enqueue(user: AnchorUser) -> bool:
+            Persists a customer, returning False if it was already queued.
+        claim(limit: int) -> list[AnchorUser]:
+            Atomically takes up to `limit` of the oldest due customers.
+        complete(users: list[AnchorUser]):
+            Removes purged customers.
+        retry(users: list[AnchorUser], delay: float):
+            Makes customers claimable again after `delay` seconds.
+        pending() -> int:
+            Returns the number of customers waiting or being purged.
+    """
+
+    def enqueue(self, user: AnchorUser) -> bool:
+        raise MethodNotImplementedError("sep12", "enqueue")
+
+    def claim(self, limit: int) -> list[AnchorUser]:
+        raise MethodNotImplementedError("sep12", "claim")
+
+    def complete(self, users: list[AnchorUser]):
+        raise MethodNotImplementedError("sep12", "complete")
+
+    def retry(self, users: list[AnchorUser], delay: float):
+        raise MethodNotImplementedError("sep12", "retry")
+
+    def pending(self) -> int:
+        raise MethodNotImplementedError("sep12", "pending")
+
+
+class SqliteCustomerPurgeQueue(CustomerPurgeQueue):
+    """
+    `CustomerPurgeQueue` stored in a SQLite database file.
+
+    Like `SqliteKycJobQueue`, the file may be shared by several processes on the same
+    host: claims run in an immediate transaction and claimed customers are reserved for
+    `lease` seconds.
+
+    Args:
+        path (str, optional): Database file. Defaults to "customer_purges.sqlite3".
+        lease (float, optional): Seconds claimed customers stay reserved. Defaults to 300.
+    """
+
+    def __init__(self, path: str = "customer_purges.sqlite3", lease: float = 300):
+        self.path = path
+        self.lease = lease
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS customer_purges ("
+                "account_id TEXT NOT NULL, memo_id INTEGER NOT NULL, client_domain TEXT, "
+                "run_at REAL NOT NULL, created_at REAL NOT NULL, PRIMARY KEY (account_id, memo_id))"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS customer_purges_due ON customer_purges (run_at)")
+
+    def enqueue(self, user: AnchorUser) -> bool:
+        now = time.time()
+        with self._lock:
+            return self._connection.execute(
+                "INSERT OR IGNORE INTO customer_purges VALUES (?, ?, ?, ?, ?)",
+                (user.account_id, int(user.memo_id or 0), user.client_domain, now, now)
+            ).rowcount == 1
+
+    def claim(self, limit: int) -> list[AnchorUser]:
+        now = time.time()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = connection.execute(
+                    "SELECT account_id, memo_id, client_domain FROM customer_purges "
+                    "WHERE run_at <= ? ORDER BY run_at LIMIT ?",
+                    (now, limit)
+                ).fetchall()
+                connection.executemany(
+                    "UPDATE customer_purges SET run_at = ? WHERE account_id = ? AND memo_id = ?",
+                    [(now + self.lease, account_id, memo_id) for account_id, memo_id, _ in rows]
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return [AnchorUser(account_id, memo_id, client_domain) for account_id, memo_id, client_domain in rows]
+
+    def complete(self, users: list[AnchorUser]):
+        with self._lock:
+            self._connection.executemany(
+                "DELETE FROM customer_purges WHERE account_id = ? AND memo_id = ?",
+                [(user.account_id, int(user.memo_id or 0)) for user in users]
+            )
+
+    def retry(self, users: list[AnchorUser], delay: float):
+        run_at = time.time() + delay
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE customer_purges SET run_at = ? WHERE account_id = ? AND memo_id = ?",
+                [(run_at, user.account_id, int(user.memo_id or 0)) for user in users]
+            )
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM customer_purges").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class CustomerPurgeWorker:
+    """
+    Deletes customer data requested through `DELETE /customer/{account}` in the background.
+
+    Requests are persisted in a `CustomerPurgeQueue`, deduplicated per (account, memo), so
+    a restart does not lose them. A single thread claims up to `batch_size` customers at a
+    time, deletes their submissions still waiting in `job_queue`, hands them to the
+    handler's `delete_users_data`, so the database sees one batched delete instead of one
+    per customer, then purges the returned blobs from the blob store. Between batches it
+    sleeps `batch_interval` seconds, which bounds the purge rate at
+    `batch_size / batch_interval` customers per second however large the backlog grows.
+
+    Deleting the queued KYC jobs matters: they hold the submitted fields and processing
+    one after the purge would recreate the customer. For the same reason a customer whose
+    job is being processed is left out of the batch and retried after `poll_interval`
+    seconds, once the job has been applied.
+
+    A failed batch is retried after `retry_delay` seconds. Listeners registered with
+    `add_listener` are called with (account_id, memo_id) for each purged customer, e.g. to
+    drop cached responses.
+
+    Attributes:
+        handler (Sep12Handler): Handler deleting the customer data.
+        queue (CustomerPurgeQueue): Durable storage of the customers to purge.
+        job_queue (KycJobQueue): Queue of the `KycProcessor` whose jobs are deleted, if any.
+        blob_store (BlobStore): Store the customers' blobs are purged from, if any.
+        batch_size (int): Maximum number of customers deleted per batch.
+        batch_interval (float): Pause between two batches in seconds.
+        retry_delay (float): Delay before a failed batch is claimed again in seconds.
+        poll_interval (float): Seconds the idle worker waits before polling the queue again.
+        purged (int): Number of customers purged.
+
+    Args:
+        handler (Sep12Handler): Handler deleting the customer data.
+        blob_store (BlobStore, optional): Store to purge blobs from. Defaults to None.
+        batch_size (int, optional): Customers per batch. Defaults to 100.
+        batch_interval (float, optional): Pause between batches in seconds. Defaults to 1.
+        retry_delay (float, optional): Delay before retrying a failed batch in seconds. Defaults to 30.
+        queue (CustomerPurgeQueue, optional): Durable storage. Defaults to a `SqliteCustomerPurgeQueue`.
+        job_queue (KycJobQueue, optional): Queue whose jobs of purged customers are deleted.
+            `Sep12Endpoints` sets it to its `KycProcessor`'s queue when not given. Defaults to None.
+        poll_interval (float, optional): Idle polling interval in seconds. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        handler: Sep12Handler,
+        blob_store: BlobStore = None,
+        batch_size: int = 100,
+        batch_interval: float = 1,
+        retry_delay: float = 30,
+        queue: CustomerPurgeQueue = None,
+        job_queue: KycJobQueue = None,
+        poll_interval: float = 1
+    ):
+        self.handler = handler
+        self.blob_store = blob_store
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.retry_delay = retry_delay
+        self.queue = queue if queue is not None else SqliteCustomerPurgeQueue()
+        self.job_queue = job_queue
+        self.poll_interval = poll_interval
+        self.purged = 0
+        self._listeners: list[Callable[[str, int], None]] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_listener(self, listener: Callable[[str, int], None]):
+        """
+        Registers a callable invoked with (account_id, memo_id) after a customer is purged.
+        """
+        self._listeners.append(listener)
+
+    def start(self):
+        """
+        Starts the worker. Customers left in a durable queue by a previous run are purged.
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="hitch-customer-purge", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the worker after its current batch. Customers still queued stay in the queue.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def enqueue(self, user: AnchorUser) -> bool:
+        """
+        Queues a customer for deletion.
+
+        Returns:
+            bool: False if the customer was already queued.
+        """
+        queued = self.queue.enqueue(user)
+        self._wakeup.set()
+        return queued
+
+    def pending(self) -> int:
+        return self.queue.pending()
+
+    def _run(self):
+        loop = asyncio.new_event_loop() if isinstance(self.handler, AsyncSep12Handler) else None
+        try:
+            while not self._stopped.is_set():
+                try:
+                    batch = self.queue.claim(self.batch_size)
+                except Exception:
+                    logger.exception("Customer purge queue failed")
+                    self._stopped.wait(self.retry_delay)
+                    continue
+                if not batch:
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+                    continue
+
+                try:
+                    if self.job_queue is not None:
+                        self.job_queue.delete_customer_jobs(batch)
+                        processing = self.job_queue.processing_customers(batch)
+                        if processing:
+                            self._retry(processing, self.poll_interval)
+                            batch = [user for user in batch if user not in processing]
+                            if not batch:
+                                continue
+                    blobs = self.handler.delete_users_data(batch)
+                    if loop is not None:
+                        blobs = loop.run_until_complete(blobs)
+                except Exception:
+                    logger.exception("Failed to purge a batch of %d customers", len(batch))
+                    self._retry(batch, self.retry_delay)
+                    self._stopped.wait(self.retry_delay)
+                    continue
+
+                if self.blob_store is not None:
+                    for blob in blobs or ():
+                        try:
+                            self.blob_store.delete(blob)
+                        except Exception:
+                            logger.exception("Failed to delete blob %s", blob)
+
+                try:
+                    self.queue.complete(batch)
+                except Exception:
+                    # the customers are purged again once their lease expires
+                    logger.exception("Customer purge queue failed")
+                with self._lock:
+                    self.purged += len(batch)
+                for user in batch:
+                    for listener in self._listeners:
+                        try:
+                            listener(user.account_id, user.memo_id)
+                        except Exception:
+                            logger.exception("Customer purge listener failed")
+
+                # throttle so purging a large backlog does not compete with live traffic
+                self._stopped.wait(self.batch_interval)
+        finally:
+            if loop is not None:
+                loop.close()
+
+    def _retry(self, batch: list[AnchorUser], delay: float):
+        try:
+            self.queue.retry(batch, delay)
+        except Exception:
+            logger.exception("Customer purge queue failed")
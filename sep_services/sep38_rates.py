@@ -0,0 +1,237 @@
+import heapq
+import logging
+import threading
+import time
+from decimal import Decimal
+from typing import Optional
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.exceptions import Sep38QuoteError
+from anchor_sdk.sep_handlers.sep38_handler import Sep38Handler
+from anchor_sdk.sep_serializations.sep38_serializations import QuoteResponse
+
+logger = logging.getLogger(__name__)
+
+class RateSnapshot:
+    """
+    An immutable set of asset-pair prices computed from one `fetch_rates` call.
+
+    Every ordered pair is precomputed, so building a snapshot takes n * (n - 1) divisions
+    and as many dict entries for n assets: negligible for the tens of assets an anchor
+    usually quotes, but about a million entries per refresh at a thousand assets.
+
+    Attributes:
+        prices (dict[tuple[str, str], Decimal]): Units of sell asset per unit of buy asset, keyed by (sell, buy).
+        by_sell (dict[str, list[tuple[str, Decimal]]]): Every (buy_asset, price) available for a sell asset.
+        by_buy (dict[str, list[tuple[str, Decimal]]]): Every (sell_asset, price) available for a buy asset.
+        fetched_at (float): UNIX timestamp of the underlying rates.
+    """
+    __slots__ = ("prices", "by_sell", "by_buy", "fetched_at")
+
+    def __init__(self, rates: dict[str, Decimal], fetched_at: float):
+        assets = [asset for asset, rate in rates.items() if rate]
+        references = [Decimal(rates[asset]) for asset in assets]
+
+        # Every pair is derived from the reference prices in a single pass over the
+        # asset matrix, so each refresh costs one upstream call regardless of pair count.
+        prices = {}
+        by_sell = {asset: [] for asset in assets}
+        by_buy = {asset: [] for asset in assets}
+        for sell_index, sell_asset in enumerate(assets):
+            sell_reference = references[sell_index]
+            row = by_sell[sell_asset]
+            for buy_index, buy_asset in enumerate(assets):
+                if buy_index == sell_index:
+                    continue
+                price = references[buy_index] / sell_reference
+                prices[(sell_asset, buy_asset)] = price
+                row.append((buy_asset, price))
+                by_buy[buy_asset].append((sell_asset, price))
+
+        self.prices = prices
+        self.by_sell = by_sell
+        self.by_buy = by_buy
+        self.fetched_at = fetched_at
+
+
+class Sep38RateCache:
+    """
+    Keeps SEP-38 prices in memory, refreshed from `Sep38Handler.fetch_rates` by a background thread.
+
+    Readers only ever dereference the current `RateSnapshot`; refreshes build a new
+    snapshot and swap it in atomically, so price requests never wait on the upstream provider.
+
+    Attributes:
+        handler (Sep38Handler): The handler providing reference rates.
+        refresh_interval (float): Seconds between refreshes.
+        max_age (float): Age in seconds after which a snapshot is considered stale and rejected.
+
+    Args:
+        handler (Sep38Handler): The handler providing reference rates.
+        refresh_interval (float, optional): Seconds between refreshes. Defaults to 10.
+        max_age (float, optional): Maximum snapshot age in seconds. Defaults to 6 refresh intervals.
+    """
+
+    def __init__(self, handler: Sep38Handler, refresh_interval: float = 10, max_age: float = None):
+        self.handler = handler
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age if max_age is not None else refresh_interval * 6
+
+        self._snapshot: Optional[RateSnapshot] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        Loads the first snapshot and starts the background refresh thread.
+
+        Start it in the process serving requests, e.g. from the application lifespan, since
+        the thread would not survive a fork.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self.refresh()
+        self._thread = threading.Thread(target=self._run, name="hitch-sep38-rates", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def refresh(self) -> bool:
+        """
+        Fetches rates from the handler and swaps in a new snapshot.
+
+        Returns:
+            bool: Whether the refresh succeeded. On failure the previous snapshot is kept.
+        """
+        try:
+            rates = self.handler.fetch_rates()
+        except Exception:
+            logger.exception("Refreshing SEP-38 rates failed, keeping the previous snapshot")
+            return False
+        self._snapshot = RateSnapshot(rates, time.time())
+        return True
+
+    @property
+    def snapshot(self) -> RateSnapshot:
+        """
+        Returns the current snapshot.
+
+        Raises:
+            Sep38QuoteError: If no rates were loaded yet or the snapshot is stale.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or time.time() - snapshot.fetched_at > self.max_age:
+            raise Sep38QuoteError(503, "Prices are temporarily unavailable")
+        return snapshot
+
+    def price(self, sell_asset: str, buy_asset: str) -> Decimal:
+        """
+        Returns the units of `sell_asset` needed for one unit of `buy_asset`.
+
+        Raises:
+            Sep38QuoteError: If the pair is not supported.
+        """
+        price = self.snapshot.prices.get((sell_asset, buy_asset))
+        if price is None:
+            raise Sep38QuoteError(400, f"Unsupported asset pair '{sell_asset}' -> '{buy_asset}'")
+        return price
+
+    def _run(self):
+        while not self._stopped.wait(self.refresh_interval):
+            self.refresh()
+
+
+def quote_account(user: AnchorUser) -> str:
+    """
+    Returns the key quotes are stored under for `user`: the account, plus the memo if any.
+    """
+    return f"{user.account_id}:{user.memo_id}" if user.memo_id else user.account_id
+
+
+class StoredQuote:
+    """
+    A firm quote held by `Sep38QuoteStore`.
+
+    Attributes:
+        quote (QuoteResponse): The quote returned to the client.
+        account (str): The account the quote was issued to.
+        expires_at (float): UNIX timestamp at which the quote expires.
+    """
+    __slots__ = ("quote", "account", "expires_at")
+
+    def __init__(self, quote: QuoteResponse, account: str, expires_at: float):
+        self.quote = quote
+        self.account = account
+        self.expires_at = expires_at
+
+    def is_expired(self, now: float = None) -> bool:
+        return (now if now is not None else time.time()) >= self.expires_at
+
+
+class Sep38QuoteStore:
+    """
+    In-memory store of firm quotes indexed by id and by account, with TTL eviction.
+
+    Expired quotes are evicted from an expiry heap on every write, so eviction cost is
+    proportional to the number of expired quotes rather than to the store size.
+    Integrators that need quotes to survive restarts can subclass it and persist in `put`.
+
+    Args:
+        max_quotes (int, optional): Maximum number of live quotes. Defaults to 100000.
+    """
+
+    def __init__(self, max_quotes: int = 100_000):
+        self.max_quotes = max_quotes
+        self._quotes: dict[str, StoredQuote] = {}
+        self._by_account: dict[str, set] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def put(self, quote: QuoteResponse, account: str, expires_at: float):
+        with self._lock:
+            self._evict_expired(time.time())
+            if len(self._quotes) >= self.max_quotes:
+                raise Sep38QuoteError(503, "Too many outstanding quotes, try again later")
+            self._quotes[quote.id] = StoredQuote(quote, account, expires_at)
+            self._by_account.setdefault(account, set()).add(quote.id)
+            heapq.heappush(self._expiry_heap, (expires_at, quote.id))
+
+    def get(self, quote_id: str) -> Optional[StoredQuote]:
+        """
+        Returns the quote with `quote_id`, or None if it does not exist or has expired.
+        """
+        stored = self._quotes.get(quote_id)
+        if stored is None or stored.is_expired():
+            return None
+        return stored
+
+    def quotes_for_account(self, account: str) -> list[StoredQuote]:
+        now = time.time()
+        with self._lock:
+            quote_ids = list(self._by_account.get(account, ()))
+        quotes = [self._quotes.get(quote_id) for quote_id in quote_ids]
+        return [stored for stored in quotes if stored is not None and not stored.is_expired(now)]
+
+    def evict_expired(self):
+        with self._lock:
+            self._evict_expired(time.time())
+
+    def _evict_expired(self, now: float):
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, quote_id = heapq.heappop(heap)
+            stored = self._quotes.pop(quote_id, None)
+            if stored is None:
+                continue
+            account_quotes = self._by_account.get(stored.account)
+            if account_quotes is not None:
+                account_quotes.discard(quote_id)
+                if not account_quotes:
+                    del self._by_account[stored.account]
+
+    def __len__(self) -> int:
+        return len(self._quotes)
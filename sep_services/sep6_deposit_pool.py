@@ -0,0 +1,273 @@
+import logging
+import secrets
+import threading
+import time
+from collections import deque
+from typing import Optional
+from anchor_sdk.exceptions import MethodNotImplementedError, Sep6TransferError
+
+logger = logging.getLogger(__name__)
+
+class DepositInstruction:
+    """
+    A unique memo and/or address reserved for a single SEP-6 deposit.
+
+    Attributes:
+        memo (str): The unique memo (payment reference) the user must attach to the deposit.
+        address (str): A pre-derived deposit address, if the anchor hands out one address per deposit.
+        expires_at (float): UNIX timestamp after which the reservation is no longer valid.
+
+    Args:
+        memo (str, optional): The reserved memo. Defaults to None.
+        address (str, optional): The reserved address. Defaults to None.
+        expires_at (float, optional): Reservation expiry as a UNIX timestamp. Defaults to never.
+    """
+    __slots__ = ("memo", "address", "expires_at")
+
+    def __init__(self, memo: str = None, address: str = None, expires_at: float = float("inf")):
+        self.memo = memo
+        self.address = address
+        self.expires_at = expires_at
+
+    def is_expired(self, now: float = None) -> bool:
+        return (now if now is not None else time.time()) >= self.expires_at
+
+
+class DepositInstructionSource:
+    """
+    Reserves batches of unique deposit instructions in the anchor's storage.
+
+    Integrators extend this class to reserve memos or pre-derived addresses in their
+    database, e.g. with a single `INSERT ... RETURNING` or `UPDATE ... LIMIT n` per batch.
+    `DepositInstructionPool` only calls it from its background thread, so it never sits
+    on the `/deposit` request path.
+
+    Methods:
+        reserve_batch(size: int, ttl: float) -> list[DepositInstruction]:
+            Reserves `size` unique instructions that stay valid for `ttl` seconds.
+        release_batch(instructions: list[DepositInstruction]):
+            Returns unused or expired instructions to storage so they can be reused or discarded.
+    """
+
+    def reserve_batch(self, size: int, ttl: float) -> list[DepositInstruction]:
+        raise MethodNotImplementedError("sep6", "reserve_batch")
+
+    def release_batch(self, instructions: list[DepositInstruction]):
+        raise MethodNotImplementedError("sep6", "release_batch")
+
+
+class RandomMemoSource(DepositInstructionSource):
+    """
+    Generates random 64-bit `id` memos without any persistent reservation.
+
+    Collisions are negligible at 64 bits, which makes this source suitable for
+    development and for anchors that record the memo together with the transaction.
+    """
+
+    def reserve_batch(self, size: int, ttl: float) -> list[DepositInstruction]:
+        expires_at = time.time() + ttl
+        return [
+            DepositInstruction(memo=str(secrets.randbits(63) or 1), expires_at=expires_at)
+            for _ in range(size)
+        ]
+
+    def release_batch(self, instructions: list[DepositInstruction]):
+        pass
+
+
+class DepositInstructionPool:
+    """
+    Hands out pre-reserved deposit instructions in O(1) without touching storage.
+
+    A background thread keeps a shared reserve of instructions filled from a
+    `DepositInstructionSource`. Each worker thread draws a slab of instructions from the
+    reserve and serves requests from its own slab, so the hot path is a `list.pop()` on
+    thread-local state. Instructions that expire before being handed out, or that are
+    handed back with `release`, are returned to the source in batches.
+
+    `create_anchor_app` starts and stops the pool given as `sep6_options["deposit_pool"]`
+    in the application lifespan; a pool used elsewhere must be started explicitly.
+
+    Attributes:
+        source (DepositInstructionSource): Storage backend used to reserve and release instructions.
+        batch_size (int): Number of instructions reserved per call to the source.
+        slab_size (int): Number of instructions moved into a worker's slab at a time.
+        low_watermark (int): Reserve size below which the background thread refills.
+        ttl (float): Lifetime, in seconds, of each reservation.
+        refill_interval (float): Maximum time, in seconds, between background refill passes.
+
+    Args:
+        source (DepositInstructionSource): Storage backend for reservations.
+        batch_size (int, optional): Instructions per reservation batch. Defaults to 256.
+        slab_size (int, optional): Instructions per worker slab. Defaults to 16.
+        low_watermark (int, optional): Refill threshold. Defaults to `batch_size`.
+        ttl (float, optional): Reservation lifetime in seconds. Defaults to 3600.
+        refill_interval (float, optional): Background pass interval in seconds. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        source: DepositInstructionSource,
+        batch_size: int = 256,
+        slab_size: int = 16,
+        low_watermark: int = None,
+        ttl: float = 3600,
+        refill_interval: float = 1
+    ):
+        self.source = source
+        self.batch_size = batch_size
+        self.slab_size = slab_size
+        self.low_watermark = low_watermark if low_watermark is not None else batch_size
+        self.ttl = ttl
+        self.refill_interval = refill_interval
+
+        # deque.append/popleft are atomic, so the reserve needs no lock
+        self._reserve = deque()
+        self._reclaimed = deque()
+        self._local = threading.local()
+        self._slabs: list[list] = []
+        self._slabs_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        Fills the reserve once and starts the background refill thread.
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._refill()
+        self._thread = threading.Thread(target=self._run, name="hitch-deposit-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread and releases every instruction that was not handed out,
+        including those held in the slabs of worker threads. Call it once requests stopped.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        while self._reserve:
+            self._reclaimed.append(self._reserve.popleft())
+        with self._slabs_lock:
+            for slab in self._slabs:
+                while slab:
+                    self._reclaimed.append(slab.pop())
+        self._flush_reclaimed()
+
+    def acquire(self) -> DepositInstruction:
+        """
+        Returns a unique, unexpired deposit instruction.
+
+        Raises:
+            Sep6TransferError: If the source cannot provide any instruction.
+
+        Returns:
+            DepositInstruction: The reserved instruction.
+        """
+        slab = self._slab()
+        now = time.time()
+        while True:
+            if not slab:
+                self._fill_slab(slab)
+            instruction = slab.pop()
+            if not instruction.is_expired(now):
+                return instruction
+            self._reclaimed.append(instruction)
+
+    def release(self, instruction: DepositInstruction):
+        """
+        Returns an instruction that was acquired but never used.
+
+        Args:
+            instruction (DepositInstruction): The unused instruction.
+        """
+        if instruction.is_expired():
+            self._reclaimed.append(instruction)
+        else:
+            self._slab().append(instruction)
+
+    def available(self) -> int:
+        """
+        Returns the number of instructions in the shared reserve.
+        """
+        return len(self._reserve)
+
+    def _slab(self) -> list:
+        slab = getattr(self._local, "slab", None)
+        if slab is None:
+            slab = self._local.slab = []
+            with self._slabs_lock:
+                self._slabs.append(slab)
+        return slab
+
+    def _fill_slab(self, slab: list):
+        for _ in range(self.slab_size):
+            try:
+                slab.append(self._reserve.popleft())
+            except IndexError:
+                break
+
+        if len(self._reserve) < self.low_watermark:
+            self._wakeup.set()
+
+        if not slab:
+            # the reserve ran dry, fall back to reserving on the request path
+            slab.extend(self._reserve_from_source(self.slab_size))
+            if not slab:
+                raise Sep6TransferError(503, "No deposit instructions available, try again later")
+
+    def _reserve_from_source(self, size: int) -> list[DepositInstruction]:
+        try:
+            return self.source.reserve_batch(size, self.ttl)
+        except MethodNotImplementedError:
+            raise
+        except Exception:
+            logger.exception("Reserving %d deposit instructions failed", size)
+            return []
+
+    def _refill(self):
+        while len(self._reserve) < self.low_watermark and not self._stopped.is_set():
+            batch = self._reserve_from_source(self.batch_size)
+            if not batch:
+                break
+            self._reserve.extend(batch)
+
+    def _drop_expired(self):
+        now = time.time()
+        for _ in range(len(self._reserve)):
+            try:
+                instruction = self._reserve.popleft()
+            except IndexError:
+                break
+            if instruction.is_expired(now):
+                self._reclaimed.append(instruction)
+            else:
+                self._reserve.append(instruction)
+
+    def _flush_reclaimed(self):
+        batch = []
+        while self._reclaimed:
+            batch.append(self._reclaimed.popleft())
+        if batch:
+            try:
+                self.source.release_batch(batch)
+            except Exception:
+                logger.exception("Releasing %d deposit instructions failed, retrying on the next pass", len(batch))
+                self._reclaimed.extend(batch)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.refill_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            self._drop_expired()
+            self._refill()
+            self._flush_reclaimed()
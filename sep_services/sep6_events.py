@@ -0,0 +1,158 @@
+import asyncio
+import json
+import threading
+import time
+from typing import AsyncIterator, Optional
+from anchor_sdk.exceptions import Sep6TransferError
+
+class TransactionSubscription:
+    """
+    A single SSE client subscribed to the transactions of one account.
+
+    Events are buffered in a bounded queue; when a slow client falls behind, the oldest
+    buffered events are dropped so memory per connection stays constant.
+
+    Attributes:
+        account (tuple[str, int]): The (account, memo) this subscription listens to.
+        transaction_id (str): Only forward events for this transaction, if set.
+        dropped (int): Number of events dropped because the queue was full.
+        started (bool): Whether its stream started being sent.
+        created_at (float): Monotonic time the subscription was made.
+    """
+
+    def __init__(self, account: tuple, loop: asyncio.AbstractEventLoop, max_queue: int, transaction_id: str = None):
+        self.account = account
+        self.transaction_id = transaction_id
+        self.dropped = 0
+        self.started = False
+        self.created_at = time.monotonic()
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+
+    def _offer(self, transaction_id: str, payload: bytes):
+        if self.transaction_id is not None and transaction_id != self.transaction_id:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(payload)
+
+
+class TransactionEventHub:
+    """
+    In-process pub/sub hub that fans SEP-6 transaction status changes out to SSE subscribers.
+
+    Integrators call `publish` whenever a transaction changes status, from any thread.
+    Each event is encoded once and the same bytes are handed to every subscriber of the
+    account, so fan-out cost does not grow with payload size.
+
+    Attributes:
+        max_queue (int): Maximum number of undelivered events buffered per subscriber.
+        heartbeat_interval (float): Seconds of inactivity after which a keep-alive comment is sent.
+        max_subscribers_per_account (int): Maximum number of concurrent streams per account.
+        start_timeout (float): Seconds after which a subscription whose stream never started,
+            e.g. because the client left before the response was sent, is dropped.
+
+    Args:
+        max_queue (int, optional): Per-subscriber buffer size. Defaults to 32.
+        heartbeat_interval (float, optional): Keep-alive interval in seconds. Defaults to 15.
+        max_subscribers_per_account (int, optional): Stream limit per account. Defaults to 10.
+        start_timeout (float, optional): Grace period of unstarted streams in seconds. Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 32,
+        heartbeat_interval: float = 15,
+        max_subscribers_per_account: int = 10,
+        start_timeout: float = 30
+    ):
+        self.max_queue = max_queue
+        self.heartbeat_interval = heartbeat_interval
+        self.max_subscribers_per_account = max_subscribers_per_account
+        self.start_timeout = start_timeout
+        self._subscribers: dict[tuple, set] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, account_id: str, transaction: dict, memo_id: int = 0):
+        """
+        Publishes a transaction status change to every subscriber of the account.
+
+        Args:
+            account_id (str): The Stellar account the transaction belongs to.
+            transaction (dict): The SEP-6 transaction object, as returned by `/transaction`.
+            memo_id (int, optional): The memo of the account, if it is shared. Defaults to 0.
+        """
+        subscribers = self._subscribers.get((account_id, int(memo_id or 0)))
+        if not subscribers:
+            return
+
+        payload = (
+            "event: transaction\n"
+            f"data: {json.dumps({'transaction': transaction}, separators=(',', ':'), default=str)}\n\n"
+        ).encode()
+        transaction_id = transaction.get("id")
+        for subscription in tuple(subscribers):
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._offer, transaction_id, payload)
+            except RuntimeError:
+                # the subscriber's event loop has been closed
+                self.unsubscribe(subscription)
+
+    def subscribe(self, account_id: str, memo_id: int = 0, transaction_id: str = None) -> TransactionSubscription:
+        """
+        Registers a subscription for the account. Must be called from a running event loop.
+
+        The subscription is removed when its `stream` ends, by `unsubscribe`, or after
+        `start_timeout` seconds if its stream is never started.
+
+        Raises:
+            Sep6TransferError: If the account already has too many open streams.
+        """
+        account = (account_id, int(memo_id or 0))
+        subscription = TransactionSubscription(account, asyncio.get_running_loop(), self.max_queue, transaction_id)
+        with self._lock:
+            subscribers = self._subscribers.setdefault(account, set())
+            now = time.monotonic()
+            for stale in [
+                other for other in subscribers
+                if not other.started and now - other.created_at > self.start_timeout
+            ]:
+                subscribers.discard(stale)
+            if len(subscribers) >= self.max_subscribers_per_account:
+                raise Sep6TransferError(429, "Too many open transaction streams for this account")
+            subscribers.add(subscription)
+        return subscription
+
+    def subscriber_count(self, account_id: str = None, memo_id: int = 0) -> int:
+        if account_id is None:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+        return len(self._subscribers.get((account_id, int(memo_id or 0)), ()))
+
+    async def stream(self, subscription: TransactionSubscription) -> AsyncIterator[bytes]:
+        """
+        Yields encoded SSE events for the subscription, with periodic heartbeats, and
+        unsubscribes when the client disconnects.
+        """
+        subscription.started = True
+        try:
+            yield b"retry: 5000\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscription._queue.get(), self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    def unsubscribe(self, subscription: TransactionSubscription):
+        """
+        Removes the subscription, if it is still registered.
+        """
+        with self._lock:
+            subscribers: Optional[set] = self._subscribers.get(subscription.account)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.account]
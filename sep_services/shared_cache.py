@@ -0,0 +1,197 @@
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from hashlib import blake2b
+from typing import Optional
+from anchor_sdk.exceptions import MethodNotImplementedError
+
+class CacheBackend:
+    """
+    Byte-oriented key/value cache with per-entry TTLs, used by the caching points of the
+    SEP-10, SEP-6 and SEP-12 modules when one is configured.
+
+    Integrators extend this class to plug in another store.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise MethodNotImplementedError("cache", "get")
+
+    def set(self, key: str, value: bytes, ttl: float, pinned: bool = False) -> bool:
+        """
+        Stores `value` for `ttl` seconds. Returns False when the value could not be stored.
+
+        A `pinned` entry is never evicted to make room for another one before it expires,
+        for entries whose early loss would be unsafe rather than a miss. Backends that never
+        evict live entries may ignore it.
+        """
+        raise MethodNotImplementedError("cache", "set")
+
+    def delete(self, key: str):
+        raise MethodNotImplementedError("cache", "delete")
+
+    def clear(self):
+        raise MethodNotImplementedError("cache", "clear")
+
+
+_MAGIC = b"HITCHC01"
+_FILE_HEADER = struct.Struct("<8sII")
+_FILE_HEADER_SIZE = 64
+# seq, expires_at, key hash, key length, value length, flags
+_SLOT_HEADER = struct.Struct("<QdQHIH")
+_SLOT_HEADER_SIZE = 32
+_SEQ = struct.Struct("<Q")
+_PINNED = 1
+
+class MmapCache(CacheBackend):
+    """
+    A cache shared by every worker process of a host, stored in a memory-mapped file.
+
+    The file holds a fixed number of fixed-size slots, addressed by the key's hash with
+    a short linear probe. Reads take no lock: each slot carries a sequence number that
+    writers make odd while they write and even when done, and a reader treats a slot
+    whose number is odd, or changed while it was read, as a miss. Writes are serialized
+    across processes with an exclusive `lockf` on the file. When every slot of the probe
+    window is live, the unpinned one expiring first is replaced; when they are all
+    pinned, the new value is not stored.
+
+    Values larger than a slot are not stored. The file is created sparse, so only the
+    slots in use take memory. Every process using the cache must be able to trust the
+    others, since any of them can write to it.
+
+    Attributes:
+        path (str): The cache file.
+        slots (int): Number of slots.
+        slot_size (int): Bytes per slot, including a 32 bytes header and the key.
+
+    Args:
+        path (str): The cache file, e.g. on a tmpfs such as /dev/shm.
+        slots (int, optional): Number of slots. Defaults to 16384.
+        slot_size (int, optional): Bytes per slot. Defaults to 4096.
+        probes (int, optional): Slots examined per key. Defaults to 8.
+    """
+
+    def __init__(self, path: str, slots: int = 16384, slot_size: int = 4096, probes: int = 8):
+        self.path = path
+        self.probes = min(probes, slots)
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(self._fd, _FILE_HEADER.size, 0)
+            if len(header) == _FILE_HEADER.size and header.startswith(_MAGIC):
+                _, slots, slot_size = _FILE_HEADER.unpack(header)
+            else:
+                os.ftruncate(self._fd, _FILE_HEADER_SIZE + slots * slot_size)
+                os.pwrite(self._fd, _FILE_HEADER.pack(_MAGIC, slots, slot_size), 0)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+        self.slots = slots
+        self.slot_size = slot_size
+        self._mmap = mmap.mmap(self._fd, _FILE_HEADER_SIZE + slots * slot_size)
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        return int.from_bytes(blake2b(key, digest_size=8).digest(), "little") or 1
+
+    def _offsets(self, key_hash: int):
+        for probe in range(self.probes):
+            yield _FILE_HEADER_SIZE + ((key_hash + probe) % self.slots) * self.slot_size
+
+    def get(self, key: str) -> Optional[bytes]:
+        key_bytes = key.encode()
+        key_hash = self._hash(key_bytes)
+        mm = self._mmap
+        now = time.time()
+
+        for offset in self._offsets(key_hash):
+            seq, expires_at, slot_hash, key_length, value_length, _ = _SLOT_HEADER.unpack_from(mm, offset)
+            if slot_hash != key_hash or expires_at <= now or seq & 1:
+                continue
+            start = offset + _SLOT_HEADER_SIZE
+            data = mm[start:start + key_length + value_length]
+            if _SEQ.unpack_from(mm, offset)[0] != seq:
+                return None
+            if data[:key_length] == key_bytes:
+                return data[key_length:]
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float, pinned: bool = False) -> bool:
+        key_bytes = key.encode()
+        if _SLOT_HEADER_SIZE + len(key_bytes) + len(value) > self.slot_size:
+            return False
+        key_hash = self._hash(key_bytes)
+
+        with self._locked():
+            offset = self._slot_for(key_bytes, key_hash)
+            if offset is None:
+                return False
+            self._write(offset, time.time() + ttl, key_hash, key_bytes, value, _PINNED if pinned else 0)
+        return True
+
+    def delete(self, key: str):
+        key_bytes = key.encode()
+        key_hash = self._hash(key_bytes)
+        with self._locked():
+            offset = self._find(key_bytes, key_hash)
+            if offset is not None:
+                self._write(offset, 0.0, 0, b"", b"")
+
+    def clear(self):
+        with self._locked():
+            for slot in range(self.slots):
+                offset = _FILE_HEADER_SIZE + slot * self.slot_size
+                if _SLOT_HEADER.unpack_from(self._mmap, offset)[2]:
+                    self._write(offset, 0.0, 0, b"", b"")
+
+    def close(self):
+        self._mmap.close()
+        os.close(self._fd)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def _find(self, key_bytes: bytes, key_hash: int) -> Optional[int]:
+        for offset in self._offsets(key_hash):
+            _, _, slot_hash, key_length, _, _ = _SLOT_HEADER.unpack_from(self._mmap, offset)
+            start = offset + _SLOT_HEADER_SIZE
+            if slot_hash == key_hash and self._mmap[start:start + key_length] == key_bytes:
+                return offset
+        return None
+
+    def _slot_for(self, key_bytes: bytes, key_hash: int) -> Optional[int]:
+        existing = self._find(key_bytes, key_hash)
+        if existing is not None:
+            return existing
+
+        now = time.time()
+        victim, victim_expiry = None, None
+        for offset in self._offsets(key_hash):
+            _, expires_at, _, _, _, flags = _SLOT_HEADER.unpack_from(self._mmap, offset)
+            if expires_at <= now:
+                return offset
+            if flags & _PINNED:
+                continue
+            if victim is None or expires_at < victim_expiry:
+                victim, victim_expiry = offset, expires_at
+        return victim
+
+    def _write(self, offset: int, expires_at: float, key_hash: int, key_bytes: bytes, value: bytes, flags: int = 0):
+        mm = self._mmap
+        seq = _SEQ.unpack_from(mm, offset)[0]
+        _SEQ.pack_into(mm, offset, seq + 1)
+        start = offset + _SLOT_HEADER_SIZE
+        mm[start:start + len(key_bytes) + len(value)] = key_bytes + value
+        _SLOT_HEADER.pack_into(mm, offset, seq + 1, expires_at, key_hash, len(key_bytes), len(value), flags)
+        _SEQ.pack_into(mm, offset, seq + 2)
@@ -0,0 +1,193 @@
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Hashable, Optional
+from anchor_sdk.models import AnchorUser
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls so they share one in-flight execution.
+
+    The first caller for a key runs the function; callers arriving with the same key
+    while it runs wait for it and receive the same result (or exception). Nothing is
+    cached once the call completes. Sync callers, e.g. handlers run in FastAPI's
+    threadpool, use `call`; coroutine callers use `acall`.
+
+    Results are shared between callers, so wrapped functions must return values the
+    callers do not mutate.
+
+    Attributes:
+        calls (dict[str, int]): Number of calls per name.
+        collapsed (dict[str, int]): Number of calls per name that joined an in-flight execution.
+    """
+
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+        self.collapsed: dict[str, int] = {}
+        self._calls: dict[Hashable, _Call] = {}
+        self._async_calls: dict[Hashable, _AsyncCall] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: Hashable, function: Callable, *args, **kwargs) -> Any:
+        """
+        Runs `function(*args, **kwargs)`, or waits for the identical call already running under `key`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self._count(key, not leader)
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def acall(self, key: Hashable, function: Callable, *args, **kwargs) -> Any:
+        """
+        Awaits `function(*args, **kwargs)`, or the identical call already running under `key`.
+
+        The call runs in its own task, so a caller being cancelled, e.g. because its client
+        disconnected, does not cancel it for the other callers; it is cancelled once every
+        caller is gone.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        call = self._async_calls.get(loop_key)
+        with self._lock:
+            self._count(key, call is not None)
+        if call is None:
+            call = self._async_calls[loop_key] = _AsyncCall(loop.create_task(function(*args, **kwargs)))
+            call.task.add_done_callback(lambda _: self._forget_async_call(loop_key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._forget_async_call(loop_key, call)
+                call.task.cancel()
+
+    def _forget_async_call(self, loop_key: tuple, call: _AsyncCall):
+        if self._async_calls.get(loop_key) is call:
+            del self._async_calls[loop_key]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Returns the number of calls and collapsed calls per name.
+        """
+        return {
+            name: {"calls": calls, "collapsed": self.collapsed.get(name, 0)}
+            for name, calls in self.calls.items()
+        }
+
+    def _count(self, key: Hashable, collapsed: bool):
+        name = key[0] if isinstance(key, tuple) and key else str(key)
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if collapsed:
+            self.collapsed[name] = self.collapsed.get(name, 0) + 1
+
+
+def _argument_key(value: Any) -> Hashable:
+    if isinstance(value, AnchorUser):
+        return ("user", value.account_id, value.memo_id, value.client_domain)
+    hash(value)
+    return value
+
+
+def coalesce(single_flight: SingleFlight, function: Callable, name: str = None) -> Callable:
+    """
+    Wraps a handler method so concurrent calls with equal arguments share one execution.
+
+    The key is the method name and its arguments, with `AnchorUser` arguments reduced to
+    (account, memo, client domain). Calls with unhashable arguments are not coalesced.
+
+    Args:
+        single_flight (SingleFlight): The coalescing group.
+        function (Callable): A sync function or a coroutine function.
+        name (str, optional): Name used in keys and counters. Defaults to the function name.
+
+    Returns:
+        Callable: The wrapped function, sync or async like `function`.
+    """
+    name = name or function.__name__
+
+    def make_key(args, kwargs):
+        try:
+            return (
+                name,
+                tuple(_argument_key(arg) for arg in args),
+                tuple(sorted((key, _argument_key(value)) for key, value in kwargs.items()))
+            )
+        except TypeError:
+            return None
+
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            if key is None:
+                return await function(*args, **kwargs)
+            return await single_flight.acall(key, function, *args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        key = make_key(args, kwargs)
+        if key is None:
+            return function(*args, **kwargs)
+        return single_flight.call(key, function, *args, **kwargs)
+    return wrapper
+
+
+def coalesce_handler_methods(handler: Any, methods: list[str], single_flight: SingleFlight = None) -> SingleFlight:
+    """
+    Replaces read-only methods of a handler instance with coalescing wrappers.
+
+    Only wrap methods without side effects, e.g. `Sep12Handler.fetch_required_fields` or
+    SEP-6 transaction lookups; never wrap methods that write, such as `process_submitted_fields`.
+
+    Args:
+        handler (Any): The handler instance, e.g. a `Sep12Handler` or `Sep6Handler`.
+        methods (list[str]): Names of the methods to wrap.
+        single_flight (SingleFlight, optional): Coalescing group to use. Defaults to a new one.
+
+    Returns:
+        SingleFlight: The coalescing group, exposing the collapsed call counters.
+    """
+    single_flight = single_flight if single_flight is not None else SingleFlight()
+    for method in methods:
+        setattr(handler, method, coalesce(single_flight, getattr(handler, method), f"{type(handler).__name__}.{method}"))
+    return single_flight
@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+import phonenumbers
+import pycountry
+from phonenumbers import PhoneMetadata
+from stellar_sdk import Keypair
+from anchor_sdk.default_sep10_handler.handler import DefaultSep10Handler
+from anchor_sdk.default_sep10_handler.horizon import HorizonPool
+from anchor_sdk.default_sep10_handler.util.sep10_utils import get_client_signing_key
+
+logger = logging.getLogger(__name__)
+
+def preload_reference_data():
+    """
+    Loads the ISO country database used by `validate_country_code` and the metadata of
+    every phone number region used by `validate_phone_number`, which both libraries
+    otherwise load on first use.
+    """
+    pycountry.countries.get(alpha_3="USA")
+    for region in phonenumbers.SUPPORTED_REGIONS:
+        PhoneMetadata.metadata_for_region(region)
+    for country_code in phonenumbers.COUNTRY_CODES_FOR_NON_GEO_REGIONS:
+        PhoneMetadata.metadata_for_nongeo_region(country_code)
+
+def warm_sep10_handler(handler: DefaultSep10Handler):
+    """
+    Derives the signing keypair, signs a throwaway JWT, opens pooled connections to every
+    Horizon node and fetches the TOML of each allowed client domain, so the first logins
+    find warm connections, measured Horizon latencies and closed circuit breakers.
+
+    Unreachable Horizon nodes and client domains are logged; they do not fail the warm-up.
+    """
+    Keypair.from_secret(handler.sep10_signing_key)
+    if handler.jwt_keys is not None and handler.jwt_keys.current is not None:
+        handler.jwt_keys.sign({"sub": handler.sep10_public_key})
+
+    server = handler.server
+    endpoints = server.endpoints if isinstance(server, HorizonPool) else [None]
+    for endpoint in endpoints:
+        started = time.monotonic()
+        try:
+            (endpoint.server if endpoint is not None else server).root().call()
+        except Exception as e:
+            logger.warning("Horizon warm-up failed: %s", e)
+            if endpoint is not None:
+                endpoint.record(time.monotonic() - started, False)
+        else:
+            if endpoint is not None:
+                endpoint.record(time.monotonic() - started, True)
+
+    for client_domain in handler.allowed_client_domains:
+        try:
+            get_client_signing_key(client_domain, handler.toml_client)
+        except Exception as e:
+            logger.warning("Client domain '%s' warm-up failed: %s", client_domain, e)
+
+
+class WarmUp:
+    """
+    Runs start-up tasks in a background thread and reports readiness once they are done.
+
+    Tasks preload lazily loaded datasets, open connections and pre-render static responses
+    before the first request, so a new worker serves it at steady-state latency. Add the
+    tasks, pass `warmup_lifespan(warm_up)` as the FastAPI `lifespan`, and expose readiness
+    with `ReadinessEndpoints` for the orchestrator's readiness probe.
+
+    A failing task is logged and recorded in `failures`; readiness is still reported once
+    every task has run, since warm-up only affects latency.
+
+    Example:
+        warm_up = WarmUp()
+        warm_up.add("reference data", preload_reference_data)
+        warm_up.add("sep10", lambda: warm_sep10_handler(sep10_handler))
+        warm_up.add("sep6 info", sep6_endpoints.warm_up)
+        app = FastAPI(lifespan=warmup_lifespan(warm_up))
+
+    Attributes:
+        ready (threading.Event): Set once every task has run.
+        failures (dict[str, str]): Error of each failed task, by name.
+        durations (dict[str, float]): Seconds taken by each task, by name.
+    """
+
+    def __init__(self):
+        self._tasks: list[tuple[str, Callable[[], None]]] = []
+        self._thread: Optional[threading.Thread] = None
+        self.ready = threading.Event()
+        self.failures: dict[str, str] = {}
+        self.durations: dict[str, float] = {}
+
+    def add(self, name: str, task: Callable[[], None]) -> "WarmUp":
+        """
+        Adds a task, run after the previously added ones.
+        """
+        self._tasks.append((name, task))
+        return self
+
+    @property
+    def is_ready(self) -> bool:
+        return self.ready.is_set()
+
+    def start(self):
+        """
+        Runs the tasks in a background thread, once.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self.run, name="warm-up", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float = None) -> bool:
+        return self.ready.wait(timeout)
+
+    def run(self):
+        """
+        Runs the tasks in the calling thread and sets `ready`.
+        """
+        for name, task in self._tasks:
+            started = time.monotonic()
+            try:
+                task()
+            except Exception as e:
+                logger.exception("Warm-up task '%s' failed", name)
+                self.failures[name] = str(e)
+            self.durations[name] = time.monotonic() - started
+        self.ready.set()
+
+
+def warmup_lifespan(warm_up: WarmUp, lifespan: Callable = None):
+    """
+    Builds a FastAPI `lifespan` starting `warm_up` when the application starts.
+
+    Args:
+        warm_up (WarmUp): The warm-up to start.
+        lifespan (Callable, optional): The application's own lifespan, entered after the warm-up started.
+    """
+    @asynccontextmanager
+    async def warmup_lifespan_context(app):
+        warm_up.start()
+        if lifespan is None:
+            yield
+        else:
+            async with lifespan(app) as state:
+                yield state
+
+    return warmup_lifespan_context
@@ -0,0 +1,16 @@
+"""
+Makes the repository importable as `anchor_sdk` when it is not installed under that name.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if importlib.util.find_spec("anchor_sdk") is None:
+    spec = importlib.util.spec_from_file_location(
+        "anchor_sdk", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["anchor_sdk"] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,110 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from stellar_sdk import Network
+
+class StubHorizon:
+    """
+    A local Horizon serving its root and `GET /accounts/{account_id}` from memory, for tests.
+
+    It listens on a free port of 127.0.0.1 and can be given a `latency` or made to
+    `fail` with 503 responses, to exercise failover and hedging of `HorizonPool`.
+
+    Example:
+        with StubHorizon() as horizon:
+            horizon.add_account(keypair.public_key)
+            pool = HorizonPool([horizon.url])
+
+    Attributes:
+        url (str): Base URL of the stub, set once started.
+        latency (float): Seconds every response is delayed by.
+        fail (bool): Whether every request is answered with 503.
+        requests (int): Number of requests received.
+    """
+
+    def __init__(self, latency: float = 0, fail: bool = False, network_passphrase: str = Network.TESTNET_NETWORK_PASSPHRASE):
+        self.latency = latency
+        self.network_passphrase = network_passphrase
+        self.fail = fail
+        self.requests = 0
+        self.url: str = None
+        self._accounts: dict[str, dict] = {}
+        self._server: ThreadingHTTPServer = None
+
+    def add_account(
+        self,
+        account_id: str,
+        sequence: int = 1,
+        signers: list[tuple[str, int]] = None,
+        thresholds: tuple[int, int, int] = (0, 0, 0)
+    ):
+        """
+        Adds an account. Without `signers`, the master key signs with weight 1.
+        """
+        signers = signers if signers is not None else [(account_id, 1)]
+        self._accounts[account_id] = {
+            "id": account_id,
+            "account_id": account_id,
+            "sequence": str(sequence),
+            "signers": [{"key": key, "weight": weight, "type": "ed25519_public_key"} for key, weight in signers],
+            "thresholds": {
+                "low_threshold": thresholds[0],
+                "med_threshold": thresholds[1],
+                "high_threshold": thresholds[2]
+            }
+        }
+
+    def remove_account(self, account_id: str):
+        self._accounts.pop(account_id, None)
+
+    def start(self) -> "StubHorizon":
+        stub = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                path = self.path.split("?")[0].rstrip("/")
+                account = stub._accounts.get(path[len("/accounts/"):]) if path.startswith("/accounts/") else None
+                if stub.fail:
+                    self._send(503, {"type": "service_unavailable", "title": "Service Unavailable", "status": 503})
+                elif path == "":
+                    self._send(200, {"horizon_version": "stub", "network_passphrase": stub.network_passphrase})
+                elif account is None:
+                    self._send(404, {"type": "not_found", "title": "Resource Missing", "status": 404})
+                else:
+                    self._send(200, account)
+
+            def _send(self, status: int, body: dict):
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/hal+json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                try:
+                    self.wfile.write(content)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/"
+        threading.Thread(target=self._server.serve_forever, name="stub-horizon", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubHorizon":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from anchor_sdk.exceptions import ServiceOverloaded
+from anchor_sdk.sep_services.admission import PRIORITY_BULK, PRIORITY_INTERACTIVE, ConcurrencyLimit
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+def test_full_queue_sheds_requests_without_higher_priority():
+    async def scenario():
+        limit = ConcurrencyLimit("test", 1, max_queue=1, queue_timeout=5)
+        await limit.acquire()
+        queued = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloaded):
+            await limit.acquire()
+        assert limit.shed == 1
+
+        limit.release()
+        await queued
+        assert limit.active == 1 and limit.queued == 0
+
+    run(scenario())
+
+def test_higher_priority_request_displaces_the_lowest_queued_one():
+    async def scenario():
+        limit = ConcurrencyLimit("test", 1, max_queue=1, queue_timeout=5)
+        await limit.acquire()
+        bulk = asyncio.ensure_future(limit.acquire(PRIORITY_BULK))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(limit.acquire(PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloaded):
+            await bulk
+        limit.release()
+        await interactive
+        assert limit.shed == 1 and limit.queued == 0
+
+    run(scenario())
+
+def test_queued_request_expires_after_queue_timeout():
+    async def scenario():
+        limit = ConcurrencyLimit("test", 1, queue_timeout=0.01)
+        await limit.acquire()
+        with pytest.raises(ServiceOverloaded):
+            await limit.acquire()
+        assert limit.expired == 1 and limit.queued == 0
+
+        limit.release()
+        assert limit.active == 0
+        await limit.acquire()
+        assert limit.active == 1
+
+    run(scenario())
+
+def test_released_slot_is_handed_to_the_highest_priority_first():
+    async def scenario():
+        limit = ConcurrencyLimit("test", 1, queue_timeout=5)
+        await limit.acquire()
+        order = []
+
+        async def waiter(name, priority):
+            await limit.acquire(priority)
+            order.append(name)
+
+        tasks = [
+            asyncio.ensure_future(waiter("bulk", PRIORITY_BULK)),
+            asyncio.ensure_future(waiter("interactive", PRIORITY_INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        limit.release()
+        await asyncio.sleep(0)
+        limit.release()
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "bulk"]
+
+    run(scenario())
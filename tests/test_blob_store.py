@@ -0,0 +1,51 @@
+import io
+import hashlib
+from anchor_sdk.sep_services.blob_store import BlobHandle, LocalBlobStore, store_binary_fields
+
+def test_put_and_read(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    handle = store.put(b"document")
+    assert handle == BlobHandle(hashlib.sha256(b"document").hexdigest())
+    assert handle.size == 8
+    with store.read(handle) as content:
+        assert bytes(content) == b"document"
+    assert BlobHandle.parse(str(handle)) == handle
+
+def test_file_like_input_is_streamed_in_chunks(tmp_path):
+    store = LocalBlobStore(str(tmp_path), chunk_size=3)
+    handle = store.put(io.BytesIO(b"streamed document"))
+    assert handle == store.put(b"streamed document")
+    assert handle.size == 17
+
+def test_empty_blob(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    handle = store.put(b"")
+    assert bytes(store.read(handle)) == b""
+
+def test_deduplicated_blob_outlives_one_delete(tmp_path):
+    first, second = LocalBlobStore(str(tmp_path)), LocalBlobStore(str(tmp_path))
+    handle = first.put(b"document")
+    assert second.put(b"document") == handle
+    assert first.references(handle) == 2
+
+    first.delete(handle)
+    assert second.exists(handle)
+    second.delete(handle)
+    assert not first.exists(handle)
+    assert first.references(handle) == 0
+    first.delete(handle)
+
+def test_blob_stored_without_a_count_holds_one_reference(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    handle = store.put(b"document")
+    store._connection.execute("DELETE FROM blob_refs")
+    assert store.references(handle) == 1
+
+    assert store.put(b"document") == handle
+    assert store.references(handle) == 2
+
+def test_store_binary_fields_replaces_bytes_only(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    fields = store_binary_fields(store, {"first_name": "x", "photo_id_front": b"\x00\x01"})
+    assert fields["first_name"] == "x"
+    assert store.exists(fields["photo_id_front"])
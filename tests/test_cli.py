@@ -0,0 +1,29 @@
+import signal
+import time
+import pytest
+from anchor_sdk.cli import _supervise, main, serve
+
+def test_several_workers_require_a_factory():
+    with pytest.raises(ValueError):
+        serve("myanchor.app:app", workers=2, preload=False)
+
+def test_command_line_rejects_several_workers_without_factory():
+    with pytest.raises(SystemExit) as exit:
+        main(["serve", "myanchor.app:app", "--workers", "2"])
+    assert exit.value.code == 2
+
+def test_crashing_workers_stop_the_master_after_repeated_crashes():
+    def crash():
+        raise RuntimeError("startup failed")
+
+    handlers = signal.getsignal(signal.SIGTERM), signal.getsignal(signal.SIGINT)
+    started = time.monotonic()
+    try:
+        with pytest.raises(SystemExit) as exit:
+            _supervise(crash, 2, graceful_timeout=1, restart_delay=0.05, max_crashes=4, crash_window=30)
+    finally:
+        signal.signal(signal.SIGTERM, handlers[0])
+        signal.signal(signal.SIGINT, handlers[1])
+    assert exit.value.code == 1
+    # the replacements were delayed 0.05s, 0.1s, ... rather than forked in a loop
+    assert time.monotonic() - started >= 0.1
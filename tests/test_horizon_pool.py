@@ -0,0 +1,88 @@
+import time
+import pytest
+from stellar_sdk import Keypair
+from stellar_sdk.exceptions import BadResponseError, ConnectionError, NotFoundError
+from anchor_sdk.default_sep10_handler.horizon import HorizonEndpoint, HorizonPool
+from anchor_sdk.default_sep10_handler.outbound import CircuitBreaker, deadline
+from .stub_horizon import StubHorizon
+
+ACCOUNT = Keypair.random().public_key
+
+def stub(**kwargs) -> StubHorizon:
+    horizon = StubHorizon(**kwargs).start()
+    horizon.add_account(ACCOUNT, sequence=7)
+    return horizon
+
+def load(server):
+    return server.load_account(ACCOUNT)
+
+def test_hedged_request_to_a_second_node_beats_a_slow_one():
+    slow, fast = stub(latency=1), stub()
+    pool = HorizonPool([slow.url, fast.url], initial_hedge_delay=0.05)
+    try:
+        started = time.monotonic()
+        account = pool.call(load)
+        assert time.monotonic() - started < 0.8
+        assert account.sequence == 7
+        assert pool.hedged == 1
+        assert slow.requests == 1 and fast.requests == 1
+    finally:
+        pool.close()
+        slow.stop()
+        fast.stop()
+
+def test_failing_node_fails_over_and_ranks_last():
+    failing, healthy = stub(fail=True), stub()
+    pool = HorizonPool([failing.url, healthy.url], initial_hedge_delay=5)
+    try:
+        assert pool.call(load).sequence == 7
+        assert pool.hedged == 0
+        assert failing.requests == 1
+        assert pool.endpoints[0].score > pool.endpoints[1].score
+
+        # the failing node is no longer tried first
+        pool.call(load)
+        assert failing.requests == 1 and healthy.requests == 2
+    finally:
+        pool.close()
+        failing.stop()
+        healthy.stop()
+
+def test_missing_account_is_an_answer_without_failover():
+    first, second = stub(), stub()
+    pool = HorizonPool([first.url, second.url])
+    try:
+        with pytest.raises(NotFoundError):
+            pool.call(lambda server: server.load_account(Keypair.random().public_key))
+        assert first.requests + second.requests == 1
+    finally:
+        pool.close()
+        first.stop()
+        second.stop()
+
+def test_expired_deadline_fails_the_call():
+    slow = stub(latency=1)
+    pool = HorizonPool([slow.url], initial_hedge_delay=5)
+    try:
+        started = time.monotonic()
+        with deadline(0.1):
+            with pytest.raises(ConnectionError):
+                pool.call(load)
+        assert time.monotonic() - started < 0.8
+    finally:
+        pool.close()
+        slow.stop()
+
+def test_nodes_with_an_open_breaker_are_not_called():
+    failing = stub(fail=True)
+    endpoint = HorizonEndpoint(failing.url, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30))
+    pool = HorizonPool([endpoint])
+    try:
+        with pytest.raises(BadResponseError):
+            pool.call(load)
+        with pytest.raises(ConnectionError):
+            pool.call(load)
+        assert failing.requests == 1
+    finally:
+        pool.close()
+        failing.stop()
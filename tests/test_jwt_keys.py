@@ -0,0 +1,22 @@
+import json
+from anchor_sdk.default_sep10_handler.jwt_keys import JwtKeySet, JwtSigningKey
+
+def kids(jwks_json: bytes) -> list[str]:
+    return [jwk["kid"] for jwk in json.loads(jwks_json)["keys"]]
+
+def test_jwks_json_follows_rotation_and_retirement():
+    keys = JwtKeySet([JwtSigningKey.generate("k1")])
+    assert kids(keys.jwks_json()) == ["k1"]
+
+    keys.rotate(JwtSigningKey.generate("k2", "ES256"))
+    assert kids(keys.jwks_json()) == ["k1", "k2"]
+
+    keys.retire("k1")
+    assert kids(keys.jwks_json()) == ["k2"]
+
+def test_tokens_verify_after_rotation():
+    keys = JwtKeySet([JwtSigningKey.generate("k1")])
+    token = keys.sign({"sub": "GA"})
+    keys.rotate(JwtSigningKey.generate("k2"))
+    assert keys.verify(token)["sub"] == "GA"
+    assert keys.verify(keys.sign({"sub": "GB"}))["sub"] == "GB"
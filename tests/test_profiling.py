@@ -0,0 +1,30 @@
+import asyncio
+from anchor_sdk.sep_services import profiling
+from anchor_sdk.sep_services.profiling import RouteProfiler
+
+def endpoint(value):
+    return sum(range(value))
+
+async def async_endpoint(value):
+    await asyncio.sleep(0)
+    return sum(range(value))
+
+def test_sampled_calls_are_profiled():
+    profiler = RouteProfiler(sample_rate=1)
+    assert profiler.wrap("GET /sum", endpoint)(10) == 45
+    assert asyncio.run(profiler.wrap("GET /async", async_endpoint)(10)) == 45
+    assert profiler.get("GET /sum").samples == 1
+    assert profiler.get("GET /async").samples == 1
+
+def test_calls_sampled_while_another_is_profiled_run_unprofiled():
+    profiler = RouteProfiler(sample_rate=1)
+    wrapped = profiler.wrap("GET /sum", endpoint)
+    wrapped_async = profiler.wrap("GET /async", async_endpoint)
+
+    with profiling._sampling:
+        assert wrapped(10) == 45
+        assert asyncio.run(wrapped_async(10)) == 45
+    assert profiler.profiles() == {}
+
+    wrapped(10)
+    assert profiler.get("GET /sum").samples == 1
@@ -0,0 +1,76 @@
+import time
+from types import SimpleNamespace
+import jwt
+import pytest
+from stellar_sdk import Keypair
+from anchor_sdk.exceptions import Sep10AuthError
+from anchor_sdk.default_sep10_handler.handler import DefaultSep10Handler
+from anchor_sdk.default_sep10_handler.revocation import BloomFilter, RevocationList
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(100)
+    items = [f"jti-{index}" for index in range(100)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    assert sum(f"other-{index}" in bloom for index in range(1000)) < 50
+
+def test_revoked_token_is_rejected(tmp_path):
+    account = Keypair.random().public_key
+    token = jwt.encode(
+        {"sub": account, "jti": "jti-1", "iat": int(time.time()), "exp": int(time.time()) + 60, "client_domain": None},
+        "secret",
+        algorithm="HS256"
+    )
+    handler = DefaultSep10Handler(
+        "secret",
+        Keypair.random().secret,
+        "auth.example.test",
+        "example.test",
+        "https://example.test",
+        server=object(),
+        revoked_jtis=RevocationList(str(tmp_path / "revoked.sqlite3"))
+    )
+    request = SimpleNamespace(headers={"Authorization": f"Bearer {token}"})
+    assert handler.authenticated_route(request).account_id == account
+
+    handler.revoke_token(token)
+    with pytest.raises(Sep10AuthError):
+        handler.authenticated_route(request)
+    assert len(handler.revoked_jtis) == 1
+
+def test_revocations_reach_other_lists_on_reload(tmp_path):
+    path = str(tmp_path / "revoked.sqlite3")
+    first = RevocationList(path)
+    second = RevocationList(path, reload_interval=60)
+    first.revoke("jti-1")
+
+    assert "jti-1" in first
+    assert "jti-1" not in second
+    second.reload()
+    assert "jti-1" in second
+
+def test_reload_past_capacity_rebuilds_without_false_negatives(tmp_path):
+    path = str(tmp_path / "revoked.sqlite3")
+    writer = RevocationList(path)
+    reader = RevocationList(path, capacity=4, reload_interval=60)
+    jtis = [f"jti-{index}" for index in range(50)]
+    for jti in jtis:
+        writer.revoke(jti)
+
+    reader.reload()
+    assert reader.capacity >= 50
+    assert all(jti in reader for jti in jtis)
+    assert "jti-other" not in reader
+
+def test_expired_entries_are_purged(tmp_path):
+    revoked = RevocationList(str(tmp_path / "revoked.sqlite3"))
+    now = time.time()
+    revoked.revoke("expired", now - 1)
+    revoked.revoke("live", now + 60)
+    revoked.revoke("forever")
+
+    assert revoked.purge_expired(now) == 1
+    assert "expired" not in revoked
+    assert "live" in revoked and "forever" in revoked
+    assert len(revoked) == 2
@@ -0,0 +1,30 @@
+import pytest
+from stellar_sdk import Keypair
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.default_sep10_handler import handler as handler_module
+from anchor_sdk.default_sep10_handler.handler import DefaultSep10Handler
+from anchor_sdk.default_sep10_handler.outbound import CircuitBreaker, CircuitBreakers
+
+def test_unexpected_signing_key_error_is_recorded_as_a_failure(monkeypatch):
+    def broken_lookup(client_domain, client):
+        raise KeyError("SIGNING_KEY")
+
+    monkeypatch.setattr(handler_module, "get_client_signing_key", broken_lookup)
+    breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0)
+    handler = DefaultSep10Handler(
+        "secret",
+        Keypair.random().secret,
+        "auth.example.test",
+        "example.test",
+        "https://example.test",
+        server=object(),
+        toml_breakers=breakers
+    )
+    user = AnchorUser(Keypair.random().public_key, client_domain="wallet.test")
+
+    with pytest.raises(KeyError):
+        handler.create_challenge_transaction(user)
+    # the half-open probe failed, so the breaker admits a new probe instead of staying stuck
+    assert breakers.get("wallet.test").state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(KeyError):
+        handler.create_challenge_transaction(user)
@@ -0,0 +1,57 @@
+import time
+from types import SimpleNamespace
+import jwt
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from stellar_sdk import Keypair
+from anchor_sdk.app import anchor_exception_handler
+from anchor_sdk.exceptions import AnchorSdkException, Sep10AuthError
+from anchor_sdk.default_sep10_handler.revocation import RevocationList
+from anchor_sdk.default_sep10_handler.tenants import AnchorTenant
+from anchor_sdk.sep_endpoints.sep10_endpoints import Sep10Endpoints
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+
+def tenant(key, revoked_jtis) -> AnchorTenant:
+    tenant = AnchorTenant(
+        key,
+        "shared-secret",
+        Keypair.random().secret,
+        f"auth.{key}.test",
+        f"{key}.test",
+        f"https://{key}.test",
+        revoked_jtis=revoked_jtis
+    )
+    tenant._bind(None, None, "Test SDF Network ; September 2015", None)
+    return tenant
+
+def test_tenant_handler_checks_its_revoked_tokens(tmp_path):
+    acme = tenant("acme", RevocationList(str(tmp_path / "acme.sqlite3")))
+    globex = tenant("globex", RevocationList(str(tmp_path / "globex.sqlite3")))
+    account = Keypair.random().public_key
+    token = jwt.encode(
+        {"sub": account, "jti": "jti-1", "iat": int(time.time()), "exp": int(time.time()) + 60, "client_domain": None},
+        "shared-secret",
+        algorithm="HS256"
+    )
+    request = SimpleNamespace(headers={"Authorization": f"Bearer {token}"})
+    assert acme.sep10_handler.authenticated_route(request).account_id == account
+
+    acme.sep10_handler.revoke_token(token)
+    with pytest.raises(Sep10AuthError):
+        acme.sep10_handler.authenticated_route(request)
+    # the other tenant's revocation list is untouched
+    assert globex.sep10_handler.authenticated_route(request).account_id == account
+    assert len(globex.sep10_handler.revoked_jtis) == 0
+
+def test_oversized_introspection_batch_is_rejected_as_too_large():
+    router = APIRouter()
+    Sep10Endpoints(Sep10Handler(), router, introspection_secret="s", max_introspection_batch=2)
+    app = FastAPI()
+    app.include_router(router, prefix="/auth")
+    app.add_exception_handler(AnchorSdkException, anchor_exception_handler)
+
+    response = TestClient(app).post(
+        "/auth/introspect", json={"tokens": ["a", "b", "c"]}, headers={"Authorization": "Bearer s"}
+    )
+    assert response.status_code == 413
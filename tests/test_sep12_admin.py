@@ -0,0 +1,67 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from stellar_sdk import Keypair
+from anchor_sdk.app import anchor_exception_handler
+from anchor_sdk.exceptions import AnchorSdkException
+from anchor_sdk.sep_endpoints.sep12_admin_endpoints import Sep12AdminEndpoints
+from anchor_sdk.models import AnchorUser, FieldStatusUpdate, Sep12KycField
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from anchor_sdk.sep_services.sep12_admin import Sep12StatusService
+
+class TypedSep12Handler(Sep12Handler):
+    def __init__(self, customer_type):
+        self.customer_type = customer_type
+        self.notified = []
+
+    def customer_types(self):
+        return {"sep31-sender": [Sep12KycField("first_name", "First name"), Sep12KycField("last_name", "Last name")]}
+
+    def update_field_statuses(self, updates):
+        results = []
+        for user, _ in updates:
+            fields = [Sep12KycField("first_name", is_accepted=True)]
+            results.append(("id1", fields, self.customer_type) if self.customer_type else ("id1", fields))
+        return results
+
+    def notify_status_changes(self, changes):
+        self.notified.extend(changes)
+
+UPDATES = [(AnchorUser("GA"), [FieldStatusUpdate("first_name", "ACCEPTED")])]
+
+def test_declared_fields_not_provided_need_info():
+    service = Sep12StatusService(TypedSep12Handler("sep31-sender"))
+    assert [change.status for change in service.apply(UPDATES)] == ["NEEDS_INFO"]
+
+def test_without_customer_type_only_returned_fields_count():
+    service = Sep12StatusService(TypedSep12Handler(None))
+    assert [change.status for change in service.apply(UPDATES)] == ["ACCEPTED"]
+
+def test_undeclared_customer_type_is_an_error():
+    service = Sep12StatusService(TypedSep12Handler("sep6-deposit"))
+    with pytest.raises(ValueError):
+        service.apply(UPDATES)
+
+def test_non_numeric_memo_is_rejected_as_a_bad_request():
+    router = APIRouter()
+    Sep12AdminEndpoints(router, Sep12StatusService(TypedSep12Handler(None)), "admin")
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(AnchorSdkException, anchor_exception_handler)
+    client = TestClient(app)
+
+    def update(memo):
+        return client.post(
+            "/admin/sep12/customers/status",
+            json={"customers": [{
+                "account": Keypair.random().public_key,
+                "memo": memo,
+                "fields": {"first_name": {"status": "ACCEPTED"}}
+            }]},
+            headers={"Authorization": "Bearer admin"}
+        )
+
+    assert update("not-a-number").status_code == 400
+    response = update("7")
+    assert response.status_code == 200
+    assert response.json()["customers"][0]["memo"] == "7"
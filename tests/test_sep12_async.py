@@ -0,0 +1,42 @@
+import threading
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from anchor_sdk.models import AnchorUser, Sep12KycField
+from anchor_sdk.sep_endpoints.sep12_endpoints import Sep12Endpoints
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.sep_handlers.sep12_handler import AsyncSep12Handler
+
+class RecordingSep10Handler(Sep10Handler):
+    def __init__(self):
+        self.threads = []
+
+    def authenticated_route(self, request):
+        self.threads.append(threading.get_ident())
+        return AnchorUser("GA")
+
+class RecordingAsyncSep12Handler(AsyncSep12Handler):
+    def __init__(self):
+        self.threads = []
+
+    async def fetch_required_fields(self, user, customer_type=None):
+        self.threads.append(threading.get_ident())
+        return ("id1", None, [Sep12KycField("first_name", "First name")])
+
+    async def delete_user_data(self, user):
+        self.threads.append(threading.get_ident())
+        return []
+
+def test_async_routes_authenticate_off_the_event_loop():
+    auth_handler = RecordingSep10Handler()
+    handler = RecordingAsyncSep12Handler()
+    router = APIRouter()
+    Sep12Endpoints(router, handler, auth_handler)
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as client:
+        assert client.get("/customer").status_code == 200
+        assert client.delete("/customer/GA").status_code == 200
+
+    event_loop = handler.threads[0]
+    assert handler.threads == [event_loop, event_loop]
+    assert event_loop not in auth_handler.threads
@@ -0,0 +1,85 @@
+import threading
+import time
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from anchor_sdk.models import AnchorUser, Sep12KycField
+from anchor_sdk.sep_endpoints.sep12_endpoints import Sep12Endpoints
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from anchor_sdk.sep_services.sep12_cache import CustomerResponseCache
+from anchor_sdk.sep_services.single_flight import SingleFlight
+
+class FixedUserSep10Handler(Sep10Handler):
+    def authenticated_route(self, request):
+        return AnchorUser("GA")
+
+class GatedSep12Handler(Sep12Handler):
+    def __init__(self):
+        self.calls = 0
+        self.accepted = False
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def fetch_required_fields(self, user, type=None):
+        self.calls += 1
+        accepted = self.accepted
+        self.gate.wait(5)
+        return ("id1", None, [Sep12KycField("first_name", "First name", is_accepted=accepted)])
+
+def test_invalidation_rejects_responses_computed_before_it():
+    cache = CustomerResponseCache()
+    generation = cache.generation("GA")
+    cache.invalidate_customer("GA")
+    cache.put("GA", 0, None, None, b"stale", generation)
+    assert cache.get("GA", 0, None, None) is None
+
+def test_generations_are_bounded():
+    cache = CustomerResponseCache(max_generations=3)
+    for index in range(100):
+        cache.invalidate_customer(f"G{index}")
+    assert len(cache._generations) == 3
+
+def test_forgotten_generation_still_rejects_stale_responses():
+    cache = CustomerResponseCache(max_generations=1)
+    generation = cache.generation("GA")
+    cache.invalidate_customer("GA")
+    cache.invalidate_customer("GB")
+    assert "GA" not in {customer[0] for customer in cache._generations}
+    cache.put("GA", 0, None, None, b"stale", generation)
+    assert cache.get("GA", 0, None, None) is None
+
+    fresh = cache.generation("GA")
+    cache.put("GA", 0, None, None, b"fresh", fresh)
+    assert cache.get("GA", 0, None, None).body == b"fresh"
+
+def test_get_joining_a_fetch_started_before_an_invalidation_does_not_cache_it():
+    handler = GatedSep12Handler()
+    single_flight = SingleFlight()
+    router = APIRouter()
+    endpoints = Sep12Endpoints(
+        router, handler, FixedUserSep10Handler(), response_cache=CustomerResponseCache(), single_flight=single_flight
+    )
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    handler.gate.clear()
+    responses = []
+    leader = threading.Thread(target=lambda: responses.append(client.get("/customer")))
+    leader.start()
+    while handler.calls == 0:
+        time.sleep(0.001)
+
+    handler.accepted = True
+    endpoints.invalidate_customer("GA")
+    follower = threading.Thread(target=lambda: responses.append(client.get("/customer")))
+    follower.start()
+    while not single_flight.collapsed:
+        time.sleep(0.001)
+    handler.gate.set()
+    leader.join()
+    follower.join()
+
+    assert [response.json()["status"] for response in responses] == ["NEEDS_INFO", "NEEDS_INFO"]
+    assert client.get("/customer").json()["status"] == "ACCEPTED"
+    assert handler.calls == 2
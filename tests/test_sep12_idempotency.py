@@ -0,0 +1,118 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from anchor_sdk.exceptions import Sep12KycError
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.sep_endpoints.sep12_endpoints import Sep12Endpoints
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from anchor_sdk.sep_services.sep12_idempotency import SubmissionIndex
+
+class FixedUserSep10Handler(Sep10Handler):
+    def authenticated_route(self, request):
+        return AnchorUser("GA")
+
+class CountingSep12Handler(Sep12Handler):
+    def __init__(self):
+        self.calls = 0
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def process_submitted_fields(self, user, fields, type=None):
+        self.calls += 1
+        self.entered.set()
+        self.gate.wait(5)
+        return "id1"
+
+def client_for(handler, index):
+    router = APIRouter()
+    endpoints = Sep12Endpoints(router, handler, FixedUserSep10Handler(), submission_index=index)
+    app = FastAPI()
+    app.include_router(router)
+    return endpoints, TestClient(app)
+
+def test_lookup_finds_recorded_submission():
+    index = SubmissionIndex()
+    index.record("GA", 0, None, "f1", "id1")
+    assert index.lookup("GA", 0, None, "f1") == "id1"
+    assert index.lookup("GA", 0, None, "f2") is None
+
+def test_idempotency_key_reused_with_other_fields_is_rejected():
+    index = SubmissionIndex()
+    index.record("GA", 0, None, "f1", "id1", "key")
+    with pytest.raises(Sep12KycError) as error:
+        index.reserve("GA", 0, None, "f2", "key")
+    assert error.value.status_code == 422
+
+def test_released_reservation_lets_the_next_submission_proceed():
+    index = SubmissionIndex()
+    assert index.reserve("GA", 0, None, "f1") is None
+    index.release("GA", 0, None, "f1")
+    assert index.reserve("GA", 0, None, "f1", timeout=0) is None
+
+def test_reservation_waiting_too_long_is_a_conflict():
+    index = SubmissionIndex()
+    index.reserve("GA", 0, None, "f1")
+    with pytest.raises(Sep12KycError) as error:
+        index.reserve("GA", 0, None, "f1", timeout=0.01)
+    assert error.value.status_code == 409
+
+def test_identical_submissions_in_flight_are_processed_once():
+    handler = CountingSep12Handler()
+    handler.gate.clear()
+    _, client = client_for(handler, SubmissionIndex())
+    responses = []
+
+    def put():
+        responses.append(client.put("/customer", json={"first_name": "x"}))
+
+    first = threading.Thread(target=put)
+    first.start()
+    assert handler.entered.wait(5)
+    second = threading.Thread(target=put)
+    second.start()
+    handler.gate.set()
+    first.join(5)
+    second.join(5)
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert [response.json()["id"] for response in responses] == ["id1", "id1"]
+    assert handler.calls == 1
+
+def test_invalidate_customer_forgets_submissions():
+    handler = CountingSep12Handler()
+    endpoints, client = client_for(handler, SubmissionIndex())
+    client.put("/customer", json={"first_name": "x"})
+    client.put("/customer", json={"first_name": "x"})
+    assert handler.calls == 1
+
+    endpoints.invalidate_customer("GA")
+    client.put("/customer", json={"first_name": "x"})
+    assert handler.calls == 2
+
+def test_recording_a_submission_wakes_its_resends_despite_a_newer_submission():
+    index = SubmissionIndex()
+    assert index.reserve("GA", 0, None, "a") is None
+    with ThreadPoolExecutor(1) as executor:
+        resend = executor.submit(index.reserve, "GA", 0, None, "a", timeout=5)
+        time.sleep(0.05)
+        assert index.reserve("GA", 0, None, "b") is None
+        index.record("GA", 0, None, "a", "id1")
+        assert resend.result(timeout=1) == "id1"
+
+def test_forget_customer_only_drops_that_customer():
+    index = SubmissionIndex(max_entries=3)
+    index.record("GA", 0, None, "f1", "id1", "key")
+    index.record("GB", 0, None, "f2", "id2")
+    index.forget_customer("GA")
+    assert index.lookup("GA", 0, None, "f1", "key") is None
+    assert index.lookup("GB", 0, None, "f2") == "id2"
+
+    for number in range(5):
+        index.record(f"G{number}", 0, None, "f", "id")
+    assert len(index) == 3
+    assert sum(len(keys) for keys in index._keys_by_customer.values()) == 3
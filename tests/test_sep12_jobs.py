@@ -0,0 +1,110 @@
+import sqlite3
+import time
+from datetime import date
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from anchor_sdk.sep_services.sep12_jobs import KycJob, KycProcessor, SqliteKycJobQueue
+
+def job(account_id="GA", fields=None) -> KycJob:
+    return KycJob("id1", account_id, 0, None, None, fields if fields is not None else {"first_name": "x"})
+
+def test_claim_takes_jobs_in_order_once(tmp_path):
+    queue = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"))
+    first, second = job("GA"), job("GB")
+    queue.enqueue(first)
+    queue.enqueue(second)
+
+    assert queue.claim().id == first.id
+    assert queue.claim().id == second.id
+    assert queue.claim() is None
+    assert queue.pending() == 2
+
+def test_jobs_of_one_customer_are_claimed_one_at_a_time(tmp_path):
+    queue = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"))
+    first, second, other = job("GA"), job("GA"), job("GB")
+    for queued in (first, second, other):
+        queue.enqueue(queued)
+
+    assert queue.claim().id == first.id
+    assert queue.claim().id == other.id
+    assert queue.claim() is None
+
+    # a retried job still runs before the customer's newer submission
+    queue.retry(first, "error", 0.05)
+    assert queue.claim() is None
+    time.sleep(0.06)
+    assert queue.claim().id == first.id
+    queue.complete(first)
+    assert queue.claim().id == second.id
+
+def test_claimed_fields_round_trip(tmp_path):
+    queue = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"))
+    queue.enqueue(job(fields={"birth_date": date(2000, 1, 2), "photo_id_front": b"\x00\x01"}))
+    assert queue.claim().fields == {"birth_date": date(2000, 1, 2), "photo_id_front": b"\x00\x01"}
+
+def test_retried_job_is_claimable_after_its_delay(tmp_path):
+    queue = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"))
+    queue.enqueue(job())
+    claimed = queue.claim()
+    claimed.attempts = 1
+    queue.retry(claimed, "error", 0.05)
+
+    assert queue.claim() is None
+    time.sleep(0.06)
+    retried = queue.claim()
+    assert retried.id == claimed.id
+    assert retried.attempts == 1
+
+def test_job_whose_lease_expired_is_claimed_again(tmp_path):
+    queue = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"), lease=0.05)
+    queue.enqueue(job())
+    claimed = queue.claim()
+
+    assert queue.claim() is None
+    time.sleep(0.06)
+    assert queue.claim().id == claimed.id
+
+def test_completed_and_failed_jobs_are_not_pending(tmp_path):
+    queue = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"))
+    queue.enqueue(job("GA"))
+    queue.enqueue(job("GB"))
+    queue.complete(queue.claim())
+    queue.fail(queue.claim(), "error")
+
+    assert queue.pending() == 0
+    assert queue.claim() is None
+
+class FlakyQueue(SqliteKycJobQueue):
+    def __init__(self, path):
+        super().__init__(path)
+        self.errors = 2
+
+    def claim(self):
+        if self.errors:
+            self.errors -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return super().claim()
+
+class RecordingSep12Handler(Sep12Handler):
+    def __init__(self):
+        self.processed = []
+
+    def process_submitted_fields(self, user, fields, type=None):
+        self.processed.append(user.account_id)
+
+def test_processor_keeps_running_after_queue_errors(tmp_path):
+    handler = RecordingSep12Handler()
+    processor = KycProcessor(
+        handler, FlakyQueue(str(tmp_path / "jobs.sqlite3")), concurrency=1, poll_interval=0.01
+    )
+    processor.submit(AnchorUser("GA"), {"first_name": "x"}, None, "id1")
+    processor.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not handler.processed and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        processor.stop()
+
+    assert handler.processed == ["GA"]
+    assert processor.queue.errors == 0
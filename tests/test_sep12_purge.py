@@ -0,0 +1,95 @@
+import time
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from anchor_sdk.sep_services.sep12_jobs import KycJob, SqliteKycJobQueue
+from anchor_sdk.sep_services.sep12_purge import CustomerPurgeWorker, SqliteCustomerPurgeQueue
+
+class RecordingSep12Handler(Sep12Handler):
+    def __init__(self):
+        self.deleted = []
+
+    def delete_users_data(self, users):
+        self.deleted.extend((user.account_id, user.memo_id) for user in users)
+        return []
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+def test_queue_deduplicates_customers(tmp_path):
+    queue = SqliteCustomerPurgeQueue(str(tmp_path / "purges.sqlite3"))
+    assert queue.enqueue(AnchorUser("GA"))
+    assert not queue.enqueue(AnchorUser("GA"))
+    assert queue.enqueue(AnchorUser("GA", 7))
+    assert queue.pending() == 2
+
+def test_queued_customers_survive_a_restart(tmp_path):
+    path = str(tmp_path / "purges.sqlite3")
+    handler = RecordingSep12Handler()
+    CustomerPurgeWorker(handler, queue=SqliteCustomerPurgeQueue(path)).enqueue(AnchorUser("GA"))
+
+    worker = CustomerPurgeWorker(handler, queue=SqliteCustomerPurgeQueue(path), poll_interval=0.01)
+    worker.start()
+    try:
+        wait_for(lambda: worker.purged == 1)
+    finally:
+        worker.stop()
+
+    assert handler.deleted == [("GA", 0)]
+    assert worker.pending() == 0
+
+def test_purge_deletes_the_customers_kyc_jobs(tmp_path):
+    jobs = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"))
+    jobs.enqueue(KycJob("id1", "GA", 0, None, None, {"first_name": "x"}))
+    jobs.enqueue(KycJob("id2", "GB", 0, None, None, {"first_name": "y"}))
+    failed = jobs.claim()
+    jobs.fail(failed, "error")
+
+    worker = CustomerPurgeWorker(
+        RecordingSep12Handler(),
+        queue=SqliteCustomerPurgeQueue(str(tmp_path / "purges.sqlite3")),
+        job_queue=jobs,
+        poll_interval=0.01
+    )
+    worker.enqueue(AnchorUser("GA"))
+    worker.start()
+    try:
+        wait_for(lambda: worker.purged == 1)
+    finally:
+        worker.stop()
+
+    remaining = jobs.claim()
+    assert remaining.account_id == "GB"
+    assert jobs.claim() is None
+    assert jobs.delete_customer_jobs([AnchorUser("GA")]) == 0
+
+def test_customer_whose_job_is_being_processed_is_purged_after_it(tmp_path):
+    jobs = SqliteKycJobQueue(str(tmp_path / "jobs.sqlite3"))
+    jobs.enqueue(KycJob("id1", "GA", 0, None, None, {"first_name": "x"}))
+    jobs.enqueue(KycJob("id2", "GB", 0, None, None, {"first_name": "y"}))
+    running = jobs.claim()
+
+    handler = RecordingSep12Handler()
+    worker = CustomerPurgeWorker(
+        handler,
+        queue=SqliteCustomerPurgeQueue(str(tmp_path / "purges.sqlite3")),
+        job_queue=jobs,
+        batch_interval=0,
+        poll_interval=0.01
+    )
+    worker.enqueue(AnchorUser("GA"))
+    worker.enqueue(AnchorUser("GB"))
+    worker.start()
+    try:
+        wait_for(lambda: worker.purged == 1)
+        time.sleep(0.05)
+        assert handler.deleted == [("GB", 0)]
+
+        jobs.complete(running)
+        wait_for(lambda: worker.purged == 2)
+    finally:
+        worker.stop()
+
+    assert handler.deleted == [("GB", 0), ("GA", 0)]
+    assert jobs.pending() == 0
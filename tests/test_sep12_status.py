@@ -0,0 +1,49 @@
+from anchor_sdk.models import Sep12KycField
+from anchor_sdk.sep_serializations.sep12_schemas import CompiledCustomerType
+from anchor_sdk.util import sep12_fields_to_json, sep12_status_from_fields
+
+def status_of(declared: list[Sep12KycField], handler_fields: list[Sep12KycField]) -> str:
+    template = CompiledCustomerType("sep31-sender", declared).fields_template
+    return sep12_status_from_fields(*sep12_fields_to_json(handler_fields, template))
+
+DECLARED = [
+    Sep12KycField("first_name", "First name"),
+    Sep12KycField("email_address", "Email", optional=True),
+]
+
+def test_missing_optional_field_does_not_block_acceptance():
+    assert status_of(DECLARED, [Sep12KycField("first_name", is_accepted=True)]) == "ACCEPTED"
+
+def test_missing_optional_field_does_not_block_processing():
+    assert status_of(DECLARED, [Sep12KycField("first_name", is_processing=True)]) == "PROCESSING"
+
+def test_missing_required_field_needs_info():
+    assert status_of(DECLARED, [Sep12KycField("email_address", is_accepted=True)]) == "NEEDS_INFO"
+
+def test_nothing_provided_needs_info():
+    assert status_of(DECLARED, []) == "NEEDS_INFO"
+
+def test_only_optional_fields_declared_and_none_provided_is_accepted():
+    assert status_of([Sep12KycField("email_address", optional=True)], []) == "ACCEPTED"
+
+def test_rejected_fields():
+    assert status_of(DECLARED, [Sep12KycField("first_name", is_rejected=True)]) == "REJECTED"
+    both = [Sep12KycField("first_name", is_rejected=True), Sep12KycField("email_address", is_accepted=True)]
+    assert status_of(DECLARED, both) == "NEEDS_INFO"
+
+def test_verification_required():
+    fields = [Sep12KycField("first_name", value="Ada", requires_verification=True)]
+    assert status_of(DECLARED, fields) == "NEEDS_INFO"
+
+def test_optional_fields_still_listed_in_fields():
+    fields, provided = sep12_fields_to_json([Sep12KycField("first_name", is_accepted=True)], CompiledCustomerType("t", DECLARED).fields_template)
+    assert fields == {"email_address": {"type": "string", "description": "Email", "optional": True}}
+    assert provided["first_name"]["status"] == "ACCEPTED"
+
+def test_optional_field_returned_without_status_stays_optional():
+    handler_fields = [Sep12KycField("first_name", is_accepted=True), Sep12KycField("email_address")]
+    assert status_of(DECLARED, handler_fields) == "ACCEPTED"
+
+    template = CompiledCustomerType("sep31-sender", DECLARED).fields_template
+    fields, _ = sep12_fields_to_json(handler_fields, template)
+    assert fields["email_address"] == {"type": "string", "description": "Email", "optional": True}
@@ -0,0 +1,82 @@
+import time
+from decimal import Decimal
+import pytest
+from fastapi import APIRouter
+from anchor_sdk.exceptions import Sep38QuoteError, Sep6TransferError
+from anchor_sdk.models import AnchorUser
+from anchor_sdk.sep_endpoints.sep6_endpoints import Sep6Endpoints
+from anchor_sdk.sep_handlers.sep6_handler import Sep6Handler
+from anchor_sdk.sep_serializations.sep38_serializations import Fee, QuoteResponse
+from anchor_sdk.sep_services.sep38_rates import RateSnapshot, Sep38QuoteStore, quote_account
+
+USDC = "stellar:USDC:GA5ZSEJYB37JRC5AVCIA5MOP4RHTM335X2KGX3IHOJAPP5RE34K4KZVN"
+
+def quote(id="q1", sell_asset="iso4217:USD", buy_asset=USDC, sell_amount="100") -> QuoteResponse:
+    return QuoteResponse(
+        id=id,
+        expires_at="2030-01-01T00:00:00Z",
+        total_price="1",
+        price="1",
+        sell_asset=sell_asset,
+        sell_amount=sell_amount,
+        buy_asset=buy_asset,
+        buy_amount=sell_amount,
+        fee=Fee(total="0", asset=sell_asset)
+    )
+
+def test_snapshot_derives_every_pair_from_reference_rates():
+    snapshot = RateSnapshot({"USD": Decimal("1"), "EUR": Decimal("0.5"), "XLM": Decimal("10"), "DEAD": 0}, 0)
+    assert snapshot.prices[("USD", "EUR")] == Decimal("0.5")
+    assert snapshot.prices[("EUR", "USD")] == Decimal("2")
+    assert snapshot.prices[("EUR", "XLM")] == Decimal("20")
+    assert len(snapshot.prices) == 6
+    assert ("USD", "USD") not in snapshot.prices
+    assert "DEAD" not in snapshot.by_sell
+    assert dict(snapshot.by_sell["USD"]) == {"EUR": Decimal("0.5"), "XLM": Decimal("10")}
+    assert dict(snapshot.by_buy["USD"]) == {"EUR": Decimal("2"), "XLM": Decimal("0.1")}
+
+def test_expired_quotes_are_evicted_in_expiry_order():
+    store = Sep38QuoteStore()
+    now = time.time()
+    store.put(quote("short"), "GA", now + 0.05)
+    store.put(quote("long"), "GA", now + 60)
+    assert store.get("short") is not None
+
+    time.sleep(0.06)
+    assert store.get("short") is None
+    store.evict_expired()
+    assert len(store) == 1
+    assert [stored.quote.id for stored in store.quotes_for_account("GA")] == ["long"]
+
+def test_full_store_rejects_quotes_until_some_expire():
+    store = Sep38QuoteStore(max_quotes=1)
+    store.put(quote("q1"), "GA", time.time() + 0.05)
+    with pytest.raises(Sep38QuoteError):
+        store.put(quote("q2"), "GA", time.time() + 60)
+
+    time.sleep(0.06)
+    store.put(quote("q2"), "GA", time.time() + 60)
+    assert len(store) == 1
+
+def test_exchange_quote_must_match_account_assets_and_amount():
+    store = Sep38QuoteStore()
+    user = AnchorUser("GA", 7)
+    store.put(quote(), quote_account(user), time.time() + 60)
+    endpoints = Sep6Endpoints(APIRouter(), Sep6Handler(), None, None, quote_store=store)
+
+    def resolve(user=user, quote_id="q1", asset_code="USDC", sell_amount="100.0"):
+        return endpoints._resolve_quote(
+            user, quote_id, sell_asset="iso4217:USD", buy_asset_code=asset_code, sell_amount=sell_amount
+        )
+
+    assert resolve().quote.id == "q1"
+    assert resolve(quote_id=None) is None
+    for arguments in (
+        {"quote_id": "missing"},
+        {"user": AnchorUser("GA")},
+        {"asset_code": "EURC"},
+        {"sell_amount": "99"},
+        {"sell_amount": "lots"},
+    ):
+        with pytest.raises(Sep6TransferError):
+            resolve(**arguments)
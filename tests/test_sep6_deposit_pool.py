@@ -0,0 +1,102 @@
+import threading
+import time
+import pytest
+from fastapi.testclient import TestClient
+from anchor_sdk.app import create_anchor_app
+from anchor_sdk.exceptions import Sep6TransferError
+from anchor_sdk.sep_handlers.sep10_handler import Sep10Handler
+from anchor_sdk.sep_handlers.sep12_handler import Sep12Handler
+from anchor_sdk.sep_handlers.sep6_handler import Sep6Handler
+from anchor_sdk.sep_services.sep6_deposit_pool import DepositInstruction, DepositInstructionPool, DepositInstructionSource
+
+class CountingSource(DepositInstructionSource):
+    def __init__(self, limit=None, failed_releases=0):
+        self.limit = limit
+        self.failed_releases = failed_releases
+        self.reserved = []
+        self.released = []
+        self.lock = threading.Lock()
+
+    def reserve_batch(self, size, ttl):
+        with self.lock:
+            if self.limit is not None:
+                size = min(size, self.limit - len(self.reserved))
+            batch = [DepositInstruction(memo=str(len(self.reserved) + index)) for index in range(size)]
+            self.reserved.extend(batch)
+            return batch
+
+    def release_batch(self, instructions):
+        if self.failed_releases:
+            self.failed_releases -= 1
+            raise ConnectionError("storage unavailable")
+        self.released.extend(instructions)
+
+def test_requests_are_served_from_slabs_drawn_from_the_reserve():
+    source = CountingSource()
+    pool = DepositInstructionPool(source, batch_size=8, slab_size=4, refill_interval=60)
+    pool.start()
+    try:
+        assert pool.available() == 8
+        memos = {pool.acquire().memo for _ in range(4)}
+        assert len(memos) == 4
+        assert pool.available() == 4
+        assert len(source.reserved) == 8
+
+        # the next slab empties the reserve, which wakes the background refill
+        pool.acquire()
+        deadline = time.monotonic() + 5
+        while pool.available() < 8 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.available() == 8
+        assert len(source.reserved) == 16
+    finally:
+        pool.stop()
+
+def test_empty_reserve_falls_back_to_reserving_on_the_request_path():
+    source = CountingSource()
+    pool = DepositInstructionPool(source, batch_size=8, slab_size=4)
+    assert pool.acquire().memo is not None
+    assert len(source.reserved) == 4
+
+def test_exhausted_source_fails_the_request():
+    pool = DepositInstructionPool(CountingSource(limit=1), batch_size=8, slab_size=4)
+    pool.acquire()
+    with pytest.raises(Sep6TransferError) as error:
+        pool.acquire()
+    assert error.value.status_code == 503
+
+def test_failed_releases_are_queued_again():
+    source = CountingSource(failed_releases=1)
+    pool = DepositInstructionPool(source, slab_size=4)
+    pool.release(DepositInstruction(memo="expired", expires_at=0))
+
+    pool._flush_reclaimed()
+    assert source.released == []
+    pool._flush_reclaimed()
+    assert [instruction.memo for instruction in source.released] == ["expired"]
+
+def test_stop_releases_the_reserve_and_every_slab():
+    source = CountingSource()
+    pool = DepositInstructionPool(source, batch_size=8, slab_size=4, refill_interval=60)
+    pool.start()
+    handed_out = []
+    worker = threading.Thread(target=lambda: handed_out.append(pool.acquire()))
+    worker.start()
+    worker.join()
+    pool.stop()
+
+    assert len(source.released) == len(source.reserved) - 1
+    assert handed_out[0] not in source.released
+
+def test_anchor_app_starts_and_stops_the_deposit_pool():
+    source = CountingSource()
+    pool = DepositInstructionPool(source, batch_size=8, refill_interval=60)
+    app = create_anchor_app(
+        sep10_handler=Sep10Handler(),
+        sep12_handler=Sep12Handler(),
+        sep6_handler=Sep6Handler(),
+        sep6_options={"deposit_pool": pool}
+    )
+    with TestClient(app):
+        assert pool.available() == 8
+    assert len(source.released) == 8
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+import pytest
+from anchor_sdk.exceptions import Sep6TransferError
+from anchor_sdk.sep_services.sep6_events import TransactionEventHub
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+def test_slow_subscriber_drops_the_oldest_events():
+    async def scenario():
+        hub = TransactionEventHub(max_queue=2)
+        subscription = hub.subscribe("GA")
+        for index in range(5):
+            hub.publish("GA", {"id": f"t{index}"})
+        await asyncio.sleep(0)
+
+        assert subscription.dropped == 3
+        events = [subscription._queue.get_nowait() for _ in range(2)]
+        assert b'"id":"t3"' in events[0]
+        assert b'"id":"t4"' in events[1]
+
+    run(scenario())
+
+def test_events_published_from_another_thread_reach_the_stream():
+    async def scenario():
+        hub = TransactionEventHub()
+        subscription = hub.subscribe("GA", 7, transaction_id="t1")
+        stream = hub.stream(subscription)
+        assert await stream.__anext__() == b"retry: 5000\n\n"
+
+        publisher = threading.Thread(target=lambda: [
+            hub.publish("GA", {"id": "t2"}, memo_id=7),
+            hub.publish("GB", {"id": "t1"}),
+            hub.publish("GA", {"id": "t1", "status": "completed"}, memo_id=7),
+        ])
+        publisher.start()
+        event = await asyncio.wait_for(stream.__anext__(), 5)
+        publisher.join()
+        await stream.aclose()
+
+        assert event.startswith(b"event: transaction\ndata: ")
+        assert b'"status":"completed"' in event
+        assert hub.subscriber_count() == 0
+
+    run(scenario())
+
+def test_idle_stream_sends_heartbeats():
+    async def scenario():
+        hub = TransactionEventHub(heartbeat_interval=0.01)
+        stream = hub.stream(hub.subscribe("GA"))
+        assert await stream.__anext__() == b"retry: 5000\n\n"
+        assert await stream.__anext__() == b": keep-alive\n\n"
+        await stream.aclose()
+
+    run(scenario())
+
+def test_unstarted_subscriptions_are_pruned_after_start_timeout():
+    async def scenario():
+        hub = TransactionEventHub(max_subscribers_per_account=1, start_timeout=0.01)
+        hub.subscribe("GA")
+        time.sleep(0.02)
+        started = hub.subscribe("GA")
+        assert hub.subscriber_count("GA") == 1
+
+        stream = hub.stream(started)
+        await stream.__anext__()
+        time.sleep(0.02)
+        with pytest.raises(Sep6TransferError):
+            hub.subscribe("GA")
+        await stream.aclose()
+
+    run(scenario())
@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+from anchor_sdk.i18n import MessageCatalog
+from anchor_sdk.sep_endpoints.sep6_endpoints import Sep6Endpoints
+from anchor_sdk.sep_handlers.sep6_handler import Sep6Handler
+from anchor_sdk.sep_serializations.sep6_fields import InfoResponse
+from anchor_sdk.sep_services.shared_cache import MmapCache
+
+class CountingSep6Handler(Sep6Handler):
+    def __init__(self):
+        self.calls = 0
+
+    def info(self):
+        self.calls += 1
+        return InfoResponse.model_validate({
+            "deposit": {},
+            "withdraw": {},
+            "fee": {"enabled": False, "description": "x" * 600},
+            "transactions": {"enabled": True},
+            "transaction": {"enabled": True},
+            "features": {"account_creation": True, "claimable_balances": True},
+        })
+
+def test_info_too_large_for_the_shared_cache_is_rendered_once(tmp_path):
+    handler = CountingSep6Handler()
+    endpoints = Sep6Endpoints(
+        APIRouter(),
+        handler,
+        None,
+        None,
+        catalog=MessageCatalog({"en": {}}),
+        cache=MmapCache(str(tmp_path / "cache"), slots=8, slot_size=256)
+    )
+    first = endpoints.info("en").body
+    assert endpoints.info("en").body == first
+    assert handler.calls == 1
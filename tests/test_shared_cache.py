@@ -0,0 +1,68 @@
+import time
+from anchor_sdk.sep_services.shared_cache import MmapCache
+from anchor_sdk.sep_services.sep12_cache import SharedCustomerResponseCache
+
+def test_set_and_get(tmp_path):
+    cache = MmapCache(str(tmp_path / "cache"), slots=64, slot_size=256)
+    assert cache.set("a", b"1", 30)
+    assert cache.get("a") == b"1"
+    assert cache.set("a", b"2", 30)
+    assert cache.get("a") == b"2"
+    assert cache.get("b") is None
+
+def test_entries_are_shared_through_the_file(tmp_path):
+    path = str(tmp_path / "cache")
+    MmapCache(path, slots=64, slot_size=256).set("a", b"1", 30)
+    assert MmapCache(path).get("a") == b"1"
+
+def test_expired_and_deleted_entries_are_misses(tmp_path):
+    cache = MmapCache(str(tmp_path / "cache"), slots=64, slot_size=256)
+    cache.set("a", b"1", 0.01)
+    cache.set("b", b"2", 30)
+    time.sleep(0.02)
+    cache.delete("b")
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+def test_oversized_value_is_not_stored(tmp_path):
+    cache = MmapCache(str(tmp_path / "cache"), slots=64, slot_size=256)
+    assert not cache.set("a", b"x" * 256, 30)
+    assert cache.get("a") is None
+
+def test_pinned_entries_are_not_evicted(tmp_path):
+    cache = MmapCache(str(tmp_path / "cache"), slots=4, slot_size=256, probes=4)
+    for index in range(4):
+        assert cache.set(f"pinned{index}", b"1", 30, pinned=True)
+
+    assert not cache.set("other", b"2", 30)
+    assert [cache.get(f"pinned{index}") for index in range(4)] == [b"1"] * 4
+    assert cache.set("pinned0", b"3", 30, pinned=True)
+    assert cache.get("pinned0") == b"3"
+
+def test_unpinned_entry_is_evicted_before_pinned_ones(tmp_path):
+    cache = MmapCache(str(tmp_path / "cache"), slots=2, slot_size=256, probes=2)
+    cache.set("pinned", b"1", 1, pinned=True)
+    cache.set("response", b"2", 30)
+    assert cache.set("other", b"3", 30)
+    assert cache.get("pinned") == b"1"
+    assert cache.get("response") is None
+
+def test_customer_generations_survive_response_churn(tmp_path):
+    backend = MmapCache(str(tmp_path / "cache"), slots=2, slot_size=256, probes=2)
+    cache = SharedCustomerResponseCache(backend)
+    cache.put("GA", 0, None, None, b"old", cache.generation("GA"))
+    cache.invalidate_customer("GA")
+    generation = cache.generation("GA")
+    for index in range(10):
+        cache.put(f"G{index}", 0, None, None, b"other", 0)
+    assert cache.generation("GA") == generation != 0
+    assert cache.get("GA", 0, None, None) is None
+
+def test_oversized_response_is_kept_in_the_worker_and_invalidated(tmp_path):
+    cache = SharedCustomerResponseCache(MmapCache(str(tmp_path / "cache"), slots=64, slot_size=256))
+    body = b"x" * 1024
+    cache.put("GA", 0, None, None, body, cache.generation("GA"))
+    assert cache.get("GA", 0, None, None).body == body
+
+    cache.invalidate_customer("GA")
+    assert cache.get("GA", 0, None, None) is None
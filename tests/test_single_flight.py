@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+from anchor_sdk.sep_services.single_flight import SingleFlight
+
+def test_followers_survive_the_leader_being_cancelled():
+    async def scenario():
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        leader = asyncio.create_task(single_flight.acall("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.acall("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert len(calls) == 1
+        assert single_flight.stats()["key"] == {"calls": 2, "collapsed": 1}
+
+    asyncio.run(scenario())
+
+def test_call_is_cancelled_once_every_caller_left():
+    async def scenario():
+        single_flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(single_flight.acall("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert not single_flight._async_calls
+
+    asyncio.run(scenario())
+
+def test_errors_are_shared_and_the_call_is_forgotten():
+    async def scenario():
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            single_flight.acall("key", fail), single_flight.acall("key", fail), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        await asyncio.sleep(0)
+        assert not single_flight._async_calls
+
+    asyncio.run(scenario())
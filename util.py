@@ -3,6 +3,7 @@ from stellar_sdk.exceptions import Ed25519PublicKeyInvalidError
 from anchor_sdk.exceptions import Sep10AuthError, Sep12KycError
 from urllib.parse import urlparse
 from anchor_sdk.models import Sep12KycField
+from anchor_sdk.i18n import LocalizedMessages
 from validators import domain
 import re
 import phonenumbers
@@ -56,17 +57,37 @@ def validate_country_code(code : str, field = "address"):
     if country is None:
         raise Sep12KycError(400, f"Invalid {field} country code: '{code}'")
     
-def sep12_fields_to_json(fields : list[Sep12KycField]) -> tuple[
+def sep12_fields_to_json(
+    fields : list[Sep12KycField],
+    template : dict = None,
+    messages : LocalizedMessages = None
+) -> tuple[
     dict, # fields
     dict  # provided fields
 ]:
-    required_fields = {}
+    """
+    Splits handler fields into the SEP-12 `fields` and `provided_fields` objects.
+
+    When a compiled customer type `template` is given, every declared field starts out
+    as required with its pre-built descriptor, and `fields` only needs to contain the
+    fields that have a status. Fields returned without a status are merged over their
+    declared descriptor, and missing descriptions are taken from the template.
+    When localized `messages` are given, their field descriptions take precedence.
+    """
+    required_fields = dict(template) if template else {}
     provided_fields = {}
+    descriptions = messages.field_descriptions if messages is not None else None
     
     for field in fields:
+        description = field.description
+        if descriptions is not None and field.field_name in descriptions:
+            description = descriptions[field.field_name]
+        elif description is None and template and field.field_name in template:
+            description = template[field.field_name]["description"]
+
         field_object = {
             "type" : field.type,
-            "description" : field.description
+            "description" : description
         }
 
         
@@ -80,11 +101,41 @@ def sep12_fields_to_json(fields : list[Sep12KycField]) -> tuple[
         if status:
             field_object['status'] = status
             provided_fields[field.field_name] = field_object
+            required_fields.pop(field.field_name, None)
 
         else:
+            # the handler's field refines the declared one, e.g. it keeps `optional`
+            if template and field.field_name in template:
+                field_object = {**template[field.field_name], **field_object}
             if field.choices:
                 field_object['choices'] = field.choices
+            if field.optional:
+                field_object['optional'] = True
             
             required_fields[field.field_name] = field_object
 
     return (required_fields, provided_fields)
+
+def sep12_status_from_fields(fields : dict, provided_fields : dict) -> str:
+    """
+    Derives the SEP-12 customer status from the `fields` and `provided_fields` objects
+    built by `sep12_fields_to_json`. Fields marked `optional` that were not provided do
+    not hold the customer in NEEDS_INFO.
+    """
+    if any(not descriptor.get('optional') for descriptor in fields.values()):
+        return "NEEDS_INFO"
+    
+    all_statuses = [provided_fields[field]['status'] for field in provided_fields]
+    all_fields_rejected = len(all_statuses) > 0 and all([status == "REJECTED" for status in all_statuses])
+
+    if all_fields_rejected: return "REJECTED"
+    elif (
+        ("VERIFICATION_REQUIRED" in all_statuses)
+            or 
+        (not all_fields_rejected and "REJECTED" in all_statuses)
+        ): 
+        return "NEEDS_INFO"
+    
+    elif "PROCESSING" in all_statuses : return "PROCESSING"
+
+    return "ACCEPTED"